@@ -0,0 +1,273 @@
+import os, sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+import pygame
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from benchmarks.scenarios import Scenario, scenarios
+
+phases = ("update", "collision_decetion", "elimination", "draw")
+
+def percentiles(samples: list[float]) -> dict:
+    """
+    Returns the p50, p95 and p99 of some times, by the nearest rank, and
+    their mean, in milliseconds.
+
+    Parameters
+    ----------
+    samples : list[float]
+        Times in seconds.
+
+    Returns
+    -------
+    dict
+        `p50`, `p95`, `p99` and `mean`, or zeros without samples.
+    """
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0}
+    ordered = sorted(samples)
+    def rank(percent):
+        index = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return round(ordered[index] * 1000, 4)
+    mean = sum(ordered) / len(ordered)
+    return {
+        "p50": rank(50), "p95": rank(95), "p99": rank(99),
+        "mean": round(mean * 1000, 4)
+    }
+
+def new_game() -> tuple:
+    """
+    Builds the game with every state loaded, on the screen of SDL,
+    which is the dummy one unless SDL_VIDEODRIVER says otherwise.
+
+    Returns
+    -------
+    tuple
+        The Main object and its GameManager, in the game state.
+    """
+    from src.main import Main
+    main = Main()
+    main.finish_loading()
+    main.change_state("game", False)
+    return main, main.states["game"]
+
+def run(scenario: Scenario, frames: int = None) -> dict:
+    """
+    Plays a scenario in a new game and times each phase of each frame.
+
+    Parameters
+    ----------
+    scenario : Scenario
+        The scripted run.
+    frames : int, optional
+        Frames to time, those of the scenario by default.
+
+    Returns
+    -------
+    dict
+        `frames` timed, the stats of each of the `phases` and of the
+        whole `frame`.
+    """
+    main, game = new_game()
+    random.seed(0)
+    scenario.setup(game)
+    steps = {
+        "update": game.update,
+        "collision_decetion": game.collision_decetion,
+        "elimination": lambda: game.elimination(main.change_state),
+        "draw": lambda: game.draw(main.screen)
+    }
+    times = {phase: [] for phase in phases}
+    totals = []
+    for frame in range(frames or scenario.frames):
+        if main.current_state is not game:
+            break
+        scenario.step(game, frame)
+        total = 0.0
+        for phase in phases:
+            start = time.perf_counter()
+            steps[phase]()
+            elapsed = time.perf_counter() - start
+            times[phase].append(elapsed)
+            total += elapsed
+        totals.append(total)
+    return {
+        "frames": len(totals),
+        "phases": {phase: percentiles(times[phase]) for phase in phases},
+        "frame": percentiles(totals)
+    }
+
+def regressions(
+    results: dict, baseline: dict, threshold: float, metric: str = "p95"
+) -> list[str]:
+    """
+    Compares the frame times of the scenarios run in both results.
+
+    Parameters
+    ----------
+    results : dict
+        The results of this run.
+    baseline : dict
+        Results of an earlier run, like the one of the last commit.
+    threshold : float
+        Slowdown allowed, 0.25 for 25 % slower.
+    metric : str
+        The stat of the frame times compared.
+
+    Returns
+    -------
+    list[str]
+        One message for each scenario slower than allowed.
+    """
+    found = []
+    for name, result in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        old, new = before["frame"][metric], result["frame"][metric]
+        if new > old * (1 + threshold):
+            found.append(
+                f"{name}: {metric} {new:.2f} ms, was {old:.2f} ms "
+                f"(+{(new / old - 1) * 100 if old else math.inf:.0f} %)"
+            )
+    return found
+
+def positive(text: str) -> int:
+    """
+    Reads a number of the command line that must be at least 1.
+
+    Parameters
+    ----------
+    text : str
+        The value given to the option.
+
+    Returns
+    -------
+    int
+        The number.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the value is not a whole number above 0.
+    """
+    try:
+        number = int(text)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a number above 0")
+    return number
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Reads the options of the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        The options, those given to the program by default.
+
+    Returns
+    -------
+    argparse.Namespace
+        The options.
+    """
+    parser = argparse.ArgumentParser(
+        description="Times the frames of scripted runs of the game."
+    )
+    parser.add_argument(
+        "--scenario", action="append", metavar="NAME",
+        help="scenario to run, all of them by default"
+    )
+    parser.add_argument(
+        "--frames", type=positive, help="frames of each scenario"
+    )
+    parser.add_argument(
+        "--enemies", type=positive, default=20,
+        help="enemies of each kind in the crowd"
+    )
+    parser.add_argument(
+        "--projectiles", type=positive, default=2000,
+        help="projectiles alive in the bullet storm"
+    )
+    parser.add_argument(
+        "--output", metavar="JSON", help="file to write the results to"
+    )
+    parser.add_argument(
+        "--baseline", metavar="JSON", help="results to compare with"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="slowdown allowed against the baseline, 0.25 by default"
+    )
+    parser.add_argument(
+        "--metric", default="p95", choices=("p50", "p95", "p99", "mean"),
+        help="frame time stat compared with the baseline"
+    )
+    return parser.parse_args(argv)
+
+def main(argv: list = None) -> int:
+    """
+    Runs the scenarios, prints their frame times and writes them to
+    JSON.
+
+    Parameters
+    ----------
+    argv : list, optional
+        The options, those given to the program by default.
+
+    Returns
+    -------
+    int
+        1 if a scenario got slower than the threshold allows, else 0.
+    """
+    args = parse_args(argv)
+    every = scenarios(args.enemies, args.projectiles)
+    names = args.scenario or list(every)
+    unknown = [name for name in names if name not in every]
+    if unknown:
+        raise SystemExit(f"unknown scenarios: {', '.join(unknown)}")
+
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "scenarios": {}
+    }
+    for name in names:
+        result = run(every[name], args.frames)
+        results["scenarios"][name] = result
+        stats = result["frame"]
+        print(
+            f"{name:18} {result['frames']:5} frames  "
+            f"p50 {stats['p50']:7.2f}  p95 {stats['p95']:7.2f}  "
+            f"p99 {stats['p99']:7.2f} ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        found = regressions(results, baseline, args.threshold, args.metric)
+        for message in found:
+            print(f"regression {message}")
+        return 1 if found else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
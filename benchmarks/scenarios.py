@@ -0,0 +1,308 @@
+import os, sys
+import random
+import pygame
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.enemy import Dummy, Mage, Flying
+from src.weapon import projectile_system
+
+class Scenario:
+    """
+    Scripted run of the game that is timed frame by frame. The hero
+    cannot die and walks right on its own, as a player rushing the map
+    would, unless a scenario stops it.
+
+    Attributes
+    ----------
+    name : str
+        Identifier of the scenario in the results.
+    frames : int
+        Number of frames timed.
+
+    Methods
+    -------
+    setup(game) -> None
+        Prepares a new game before the first timed frame.
+    step(game, frame) -> None
+        Plays the input of a frame, before it is timed.
+    """
+
+    name = "scenario"
+    frames = 300
+
+    def setup(self, game: object) -> None:
+        """
+        Prepares a new game before the first timed frame.
+
+        Parameters
+        ----------
+        game : GameManager
+            The game, in its first frame.
+
+        Returns
+        -------
+        None
+        """
+
+    def step(self, game: object, frame: int) -> None:
+        """
+        Plays the input of a frame. The hero is healed and kept above
+        the pits, and walks right until the boss arena.
+
+        Parameters
+        ----------
+        game : GameManager
+            The game being timed.
+        frame : int
+            Number of the frame, from 0.
+
+        Returns
+        -------
+        None
+        """
+        game.hero.life = 1000
+        if not game.camera.boss_fase:
+            game.hero.rect.x += 12
+        game.hero.rect.y = min(game.hero.rect.y, 300)
+
+class WalkMap(Scenario):
+    """
+    Walks the map from the start to the boss arena, through every
+    enemy of the level.
+    """
+
+    name = "walk_map"
+    frames = 700
+
+class BossFight(Scenario):
+    """
+    Fights a single boss: the other bosses are taken out of the roster
+    and the hero walks to the arena before the frames are timed.
+
+    Attributes
+    ----------
+    boss : str
+        Name of the class of the boss.
+
+    Methods
+    -------
+    setup(game) -> None
+        Walks to the arena of the boss, without timing.
+    """
+
+    boss = ""
+
+    def setup(self, game: object) -> None:
+        """
+        Leaves the boss alone in the roster and walks to its arena.
+
+        Parameters
+        ----------
+        game : GameManager
+            The game, in its first frame.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        RuntimeError
+            If the boss does not appear.
+        """
+        game.order.factories = [
+            factory for factory in game.order.factories
+            if factory[0].__name__ == self.boss
+        ]
+        for frame in range(3000):
+            if game.bosses:
+                return
+            Scenario.step(self, game, frame)
+            game.update()
+            game.collision_decetion()
+            game.elimination(lambda state, music: None)
+        raise RuntimeError(f"{self.boss} did not appear")
+
+class GanonVolley(BossFight):
+    """
+    Ganon fires a volley every frame, as fast as projectiles can be
+    spawned.
+    """
+
+    name = "ganon_volley"
+    boss = "Ganon"
+
+    def step(self, game: object, frame: int) -> None:
+        """
+        Heals the hero and makes every boss attack at once.
+        """
+        super().step(game, frame)
+        for boss in game.bosses:
+            boss.atk_timer = 0
+
+class BalrogLightning(BossFight):
+    """
+    Balrog moves along the arena and strikes its lanes with lightning.
+    """
+
+    name = "balrog_lightning"
+    boss = "Balrog"
+
+class Crowd(Scenario):
+    """
+    Many Dummy, Mage and Flying enemies around the hero at once.
+
+    Attributes
+    ----------
+    count : int
+        Number of enemies of each kind.
+    """
+
+    name = "crowd"
+
+    def __init__(self, count: int = 20) -> None:
+        """
+        Initializes the scenario.
+
+        Parameters
+        ----------
+        count : int
+            Number of enemies of each kind.
+
+        Returns
+        -------
+        None
+        """
+        self.count = count
+
+    def setup(self, game: object) -> None:
+        """
+        Spawns the enemies over the screen, in front of the hero.
+
+        Parameters
+        ----------
+        game : GameManager
+            The game, in its first frame.
+
+        Returns
+        -------
+        None
+        """
+        left = game.hero.rect.x + 200
+        space = 1000 // self.count
+        for index in range(self.count):
+            x = left + index * space
+            game.enemies.append(Dummy(x, 100, 50, 80, game.hero))
+            game.enemies.append(Flying(x, 100, 60, 60, game.hero))
+            game.enemies.append(Mage(x, 0, 80, 150, game.hero))
+
+    def step(self, game: object, frame: int) -> None:
+        """
+        Heals the hero, who stays among the enemies.
+        """
+        game.hero.life = 1000
+        game.hero.rect.y = min(game.hero.rect.y, 300)
+
+class BulletStorm(Scenario):
+    """
+    The hero and the mages around the first of them keep a number of 
+    projectiles flying across the screen, topped up before each frame, 
+    which is the load the projectile pool and its batched hit tests 
+    were made for.
+
+    Attributes
+    ----------
+    count : int
+        Number of projectiles alive at the start of each frame.
+    shooters : list
+        The hero and the mages the projectiles are fired for.
+    image : pygame.Surface
+        Image of the projectiles.
+    """
+
+    name = "bullet_storm"
+    frames = 150
+
+    def __init__(self, count: int = 2000) -> None:
+        """
+        Initializes the scenario.
+
+        Parameters
+        ----------
+        count : int
+            Number of projectiles alive at the start of each frame.
+
+        Returns
+        -------
+        None
+        """
+        self.count = count
+        self.shooters = []
+        self.image = None
+
+    def setup(self, game: object) -> None:
+        """
+        Walks to the first mages, without timing.
+
+        Parameters
+        ----------
+        game : GameManager
+            The game, in its first frame.
+
+        Returns
+        -------
+        None
+        """
+        for frame in range(120):
+            Scenario.step(self, game, frame)
+            game.update()
+            game.collision_decetion()
+            game.elimination(lambda state, music: None)
+        mages = [enemy for enemy in game.enemies if isinstance(enemy, Mage)]
+        self.shooters = [game.hero] + mages
+        self.image = pygame.Surface((20, 10))
+
+    def step(self, game: object, frame: int) -> None:
+        """
+        Fires projectiles over the screen until `count` are alive, and 
+        keeps the hero and the enemies alive.
+        """
+        left = game.camera.position_x
+        alive = sum(len(shooter.projectiles) for shooter in self.shooters)
+        for _ in range(self.count - alive):
+            shooter = random.choice(self.shooters)
+            who = "Yokai" if shooter is game.hero else shooter.TAG
+            projectile_system.fire(
+                shooter.projectiles, left + random.randint(0, 1300), 
+                random.randint(0, 700), random.choice((-3, 3)), 
+                random.choice((-2, 0, 2)), who, 0, 20, 10, self.image
+            )
+        game.hero.life = 1000
+        game.hero.rect.y = min(game.hero.rect.y, 300)
+        for enemy in game.enemies:
+            enemy.life = max(enemy.life, 1000)
+
+def scenarios(count: int = 20, projectiles: int = 2000) -> dict:
+    """
+    Returns every scenario, by name.
+
+    Parameters
+    ----------
+    count : int
+        Number of enemies of each kind in the crowd.
+    projectiles : int
+        Number of projectiles alive in the bullet storm.
+
+    Returns
+    -------
+    dict
+        The scenarios, in the order they are run.
+    """
+    every = [
+        WalkMap(), GanonVolley(), BalrogLightning(), Crowd(count), 
+        BulletStorm(projectiles)
+    ]
+    return {scenario.name: scenario for scenario in every}
@@ -0,0 +1,152 @@
+import os, sys
+import json
+import time
+import argparse
+import subprocess
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+import pygame
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+# Where the frames of the characters are read from, the first source
+# that has a frame serves it
+sources = ("png", "atlas", "pack")
+
+def load(source: str) -> float:
+    """
+    Creates every character with their frames read from one source, the
+    ones before it in `sources` being left out, and times it. Must run
+    in a new process, the frames loaded are cached.
+
+    Parameters
+    ----------
+    source : str
+        "png" for the image files, "atlas" for the atlas pages, or
+        "pack" for the pack file.
+
+    Returns
+    -------
+    float
+        Seconds taken to create the characters.
+
+    Raises
+    ------
+    RuntimeError
+        If the atlas or the pack is asked for and was not built.
+    """
+    import src.atlas as atlas
+    import src.pack as pack
+
+    pygame.init()
+    pygame.display.set_mode((1400, 800))
+    start = time.perf_counter()
+    if source != "pack":
+        pack._pack_loaded = True
+        pack._pack = None
+    elif pack.get_pack() is None:
+        raise RuntimeError("the pack is not built, run python -m src.pack")
+    if source == "png":
+        atlas._atlas_loaded = True
+        atlas._atlas = None
+    elif source == "atlas" and atlas.get_atlas() is None:
+        raise RuntimeError("the atlas is not built, run python -m src.atlas")
+    atlas.create_characters()
+    return time.perf_counter() - start
+
+def measure(source: str, repeat: int) -> float:
+    """
+    Times the loading from a source in new processes.
+
+    Parameters
+    ----------
+    source : str
+        One of `sources`.
+    repeat : int
+        Number of processes.
+
+    Returns
+    -------
+    float
+        Best seconds of the runs.
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.startup", "--source", source],
+            cwd=os.path.join(current_dir, ".."), capture_output=True,
+            text=True, check=True
+        ).stdout
+        times.append(float(output.split()[-1]))
+    return min(times)
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Reads the options of the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        The options, those given to the program by default.
+
+    Returns
+    -------
+    argparse.Namespace
+        The options.
+    """
+    parser = argparse.ArgumentParser(
+        description="Times the loading of the frames of the characters."
+    )
+    parser.add_argument(
+        "--source", choices=sources,
+        help="time a single run of this process, with one source"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="processes timed for each source, the best one is kept"
+    )
+    parser.add_argument(
+        "--output", metavar="JSON", help="file to write the results to"
+    )
+    return parser.parse_args(argv)
+
+def main(argv: list = None) -> int:
+    """
+    Times each source in new processes and prints the best times.
+
+    Parameters
+    ----------
+    argv : list, optional
+        The options, those given to the program by default.
+
+    Returns
+    -------
+    int
+        0.
+    """
+    args = parse_args(argv)
+    if args.source:
+        print(f"{args.source} {load(args.source):.4f}")
+        return 0
+
+    results = {}
+    for source in sources:
+        try:
+            results[source] = round(measure(source, args.repeat) * 1000, 1)
+        except subprocess.CalledProcessError as error:
+            reason = error.stderr.strip().splitlines()[-1]
+            print(f"{source:6} skipped: {reason}")
+            continue
+        print(f"{source:6} {results[source]:8.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,478 @@
 import pygame
 import os
 import sys
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))  
+src_path = os.path.join(current_dir, '..')  
+sys.path.append(src_path)
+
+from src.atlas import frame_key, atlas_frame, record_frame
+from src.pack import pack_frame, record_pack
+
+class SurfaceCache:
+    """
+    Process-wide cache of loaded images, shared by every object that
+    draws the same file at the same size.
+
+    Attributes
+    ----------
+    surfaces : dict
+        Loaded surfaces keyed by (path, size, flip, alpha).
+    hits : int
+        Number of requests answered from the cache.
+    misses : int
+        Number of requests that had to load or transform an image.
+    decoded : dict
+        Images decoded by `prefetch` and not converted yet, keyed by 
+        path.
+    convert : bool
+        Whether the images are converted to the format of the display. 
+        Off when nothing is drawn, as in the headless mode.
+
+    Methods
+    -------
+    get(path, size, flip, alpha) -> pygame.Surface
+        Returns the cached surface, loading it on the first request.
+    prefetch(paths) -> threading.Thread
+        Decodes image files on a worker thread.
+    decode(paths) -> None
+        Decodes image files on the calling thread.
+    discard(paths) -> None
+        Drops decoded images that were not used.
+    load(path, alpha) -> pygame.Surface
+        Returns a converted surface that is not kept in the cache.
+    converted(surface, alpha) -> pygame.Surface
+        Returns a surface in the format of the display.
+    clear() -> None
+        Drops every cached surface and resets the counters.
+
+    Notes
+    -----
+    The surfaces are shared, so callers must not draw on them. Setting
+    the surface alpha before each blit, as `Sprites.draw` does, is safe.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty cache.
+        """
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+        self.decoded = {}
+        self.lock = threading.Lock()
+        self.convert = True
+
+    def get(
+        self, path: str, size: Optional[tuple] = None, flip: bool = False,
+        alpha: bool = True
+    ) -> pygame.Surface:
+        """
+        Returns the image in `path` scaled and flipped as requested.
+
+        Parameters
+        ----------
+        path : str
+            Path of the image file.
+        size : tuple, optional
+            Final (width, height) of the image. If not provided, the
+            original size is kept.
+        flip : bool
+            Whether to flip the image horizontally.
+        alpha : bool
+            Whether to convert the image keeping per-pixel alpha
+            (`convert_alpha`) or not (`convert`).
+
+        Returns
+        -------
+        pygame.Surface
+            The shared surface for the requested key.
+        """
+        path = os.path.normpath(os.path.abspath(path))
+        key = (path, tuple(size) if size else None, flip, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        base_key = (path, None, False, alpha)
+        surface = self.surfaces.get(base_key)
+        if surface is None:
+            surface = self.load(path, alpha)
+            self.surfaces[base_key] = surface
+        if size:
+            surface = pygame.transform.scale(surface, key[1])
+        if flip:
+            surface = pygame.transform.flip(surface, True, False)
+        self.surfaces[key] = surface
+        return surface
+
+    def prefetch(self, paths: list[str]) -> threading.Thread:
+        """
+        Reads and decodes image files on a worker thread, so that a 
+        later `load` or `get` only has to convert them.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Paths of the image files.
+
+        Returns
+        -------
+        threading.Thread
+            The worker thread, already started.
+
+        Notes
+        -----
+        Only the decoding runs on the worker, converting a surface needs 
+        the display and stays on the main thread.
+        """
+        paths = [os.path.normpath(os.path.abspath(path)) for path in paths]
+        thread = threading.Thread(
+            target=self.decode, args=(paths,), daemon=True
+        )
+        thread.start()
+        return thread
+
+    def decode(self, paths: list[str]) -> None:
+        """
+        Decodes the image files on the calling thread and keeps them 
+        for `load`. Files that cannot be read are skipped, `load` will 
+        raise the error if they are used.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Paths of the image files.
+
+        Returns
+        -------
+        None
+        """
+        for path in paths:
+            path = os.path.normpath(os.path.abspath(path))
+            with self.lock:
+                if path in self.decoded:
+                    continue
+            try:
+                surface = pygame.image.load(path)
+            except (pygame.error, OSError):
+                continue
+            with self.lock:
+                self.decoded[path] = surface
+
+    def discard(self, paths: list[str]) -> None:
+        """
+        Drops the decoded images of `paths` that no `load` used.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Paths of the image files.
+
+        Returns
+        -------
+        None
+        """
+        with self.lock:
+            for path in paths:
+                self.decoded.pop(os.path.normpath(os.path.abspath(path)), None)
+
+    def load(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """
+        Returns the converted image in `path`, using the decoded image 
+        from `prefetch` when it is ready. The surface is not cached.
+
+        Parameters
+        ----------
+        path : str
+            Path of the image file.
+        alpha : bool
+            Whether to convert the image keeping per-pixel alpha.
+
+        Returns
+        -------
+        pygame.Surface
+            A new surface owned by the caller.
+        """
+        path = os.path.normpath(os.path.abspath(path))
+        with self.lock:
+            surface = self.decoded.pop(path, None)
+        if surface is None:
+            surface = pygame.image.load(path)
+        return self.converted(surface, alpha)
+
+    def converted(
+        self, surface: pygame.Surface, alpha: bool = True
+    ) -> pygame.Surface:
+        """
+        Returns a surface in the format of the display, so it is drawn 
+        without converting its pixels on every blit. With `convert` off 
+        the surface is returned as it is.
+
+        Parameters
+        ----------
+        surface : pygame.Surface
+            Any surface, like a decoded image.
+        alpha : bool
+            Whether to keep per-pixel alpha.
+
+        Returns
+        -------
+        pygame.Surface
+            A new surface, or `surface` itself.
+        """
+        if not self.convert:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def clear(self) -> None:
+        """
+        Drops every cached surface and resets the counters.
+
+        Returns
+        -------
+        None
+        """
+        self.surfaces.clear()
+        with self.lock:
+            self.decoded.clear()
+        self.hits = 0
+        self.misses = 0
+
+surface_cache = SurfaceCache()
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Returns the bytes used by the pixels of `surface`.
+    """
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+def paste(
+    surface: pygame.Surface, image: pygame.Surface, position: tuple
+) -> None:
+    """
+    Copies `image` onto a transparent `surface` at `position`. Adding 
+    onto the transparent pixels copies the pixels as they are, a normal 
+    blit would blend the translucent borders twice.
+    """
+    surface.blit(image, position, special_flags=pygame.BLEND_RGBA_ADD)
+
+class MirrorStore:
+    """
+    Bounded cache of mirrored animation frames. Characters keep only 
+    one orientation of each frame, and the other one is flipped here 
+    the first time it is drawn.
+
+    Attributes
+    ----------
+    surfaces : OrderedDict
+        Mirrored frames keyed by `frame_key`, from the least to the 
+        most recently used.
+    size : int
+        Bytes used by the mirrored frames.
+    max_size : int
+        Bytes allowed before the least recently used frames are 
+        dropped.
+    hits : int
+        Number of frames found already mirrored.
+    misses : int
+        Number of frames that had to be flipped.
+    saved : dict[str, int]
+        Bytes of mirrored frames not kept by each character, keyed by 
+        the folder of its images.
+
+    Methods
+    -------
+    mirror(key, surface) -> pygame.Surface
+        Returns the mirrored frame, flipping it if needed.
+    report() -> dict
+        Returns the bytes saved by each character.
+    clear() -> None
+        Drops every mirrored frame and resets the counters.
+    """
+
+    def __init__(self, max_size: int = 32 * 2**20) -> None:
+        """
+        Initializes an empty store.
+
+        Parameters
+        ----------
+        max_size : int
+            Bytes allowed for the mirrored frames.
+        """
+        self.surfaces = OrderedDict()
+        self.size = 0
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.saved = {}
+
+    def mirror(self, key: str, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Returns `surface` flipped horizontally.
+
+        Parameters
+        ----------
+        key : str
+            The name of the frame, built with `frame_key`. Frames with 
+            the same key share the mirrored surface.
+        surface : pygame.Surface
+            The frame in its stored orientation.
+
+        Returns
+        -------
+        pygame.Surface
+            The mirrored frame, shared, so it must not be drawn on.
+        """
+        image = self.surfaces.get(key)
+        if image is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return image
+
+        self.misses += 1
+        image = pygame.transform.flip(surface, True, False)
+        self.surfaces[key] = image
+        self.size += surface_bytes(image)
+        while self.size > self.max_size and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.size -= surface_bytes(old)
+        return image
+
+    def report(self) -> dict[str, int]:
+        """
+        Returns the bytes saved by each character, from the biggest.
+
+        Returns
+        -------
+        dict[str, int]
+            Saved bytes keyed by the folder of the character's images.
+        """
+        return dict(sorted(self.saved.items(), key=lambda item: -item[1]))
+
+    def clear(self) -> None:
+        """
+        Drops every mirrored frame and resets the counters.
+
+        Returns
+        -------
+        None
+        """
+        self.surfaces.clear()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.saved.clear()
+
+mirror_store = MirrorStore()
+
+class MirroredFrames:
+    """
+    Frames of one action, used as the list `Sprites.assets` expects: 
+    the frames of each `add` follow the ones added before, so two calls 
+    with opposite `mirrored` give the two directions. When both calls 
+    load the same frames, they are kept once and the mirrored half 
+    comes from `mirror_store`.
+
+    Attributes
+    ----------
+    halves : list[tuple]
+        Keys, frames and whether they are mirrored, for each `add`.
+
+    Methods
+    -------
+    add(keys, frames, mirrored) -> None
+        Adds the frames of one direction after the others.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty sequence.
+        """
+        self.halves = []
+
+    def add(self, keys: list[str], frames: list, mirrored: bool) -> None:
+        """
+        Adds the frames of one direction after the others.
+
+        Parameters
+        ----------
+        keys : list[str]
+            The name of each frame, built with `frame_key`.
+        frames : list[pygame.Surface]
+            The frames in their stored orientation.
+        mirrored : bool
+            Whether the frames are shown flipped horizontally.
+
+        Returns
+        -------
+        None
+        """
+        for half_keys, half_frames, _ in self.halves:
+            if half_keys == keys:
+                frames = half_frames
+                character = keys[0].split("/")[0] if keys else ""
+                saved = sum(surface_bytes(frame) for frame in frames)
+                mirror_store.saved[character] = (
+                    mirror_store.saved.get(character, 0) + saved
+                )
+                break
+        self.halves.append((keys, frames, mirrored))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of frames of every direction.
+        """
+        return sum(len(frames) for _, frames, _ in self.halves)
+
+    def __getitem__(self, index: int) -> pygame.Surface:
+        """
+        Returns the frame at `index`, mirrored if it is in a mirrored 
+        half.
+        """
+        if index < 0:
+            index += len(self)
+        for keys, frames, mirrored in self.halves:
+            if 0 <= index < len(frames):
+                if mirrored:
+                    return mirror_store.mirror(keys[index], frames[index])
+                return frames[index]
+            index -= len(frames)
+        raise IndexError("frame index out of range")
+
+def load_frame(
+    key: str, build: Callable[[], pygame.Surface]
+) -> pygame.Surface:
+    """
+    Returns a scaled frame from the asset pack or the texture atlas, 
+    and only calls `build` to read and scale it from its file when 
+    neither has it.
+
+    Parameters
+    ----------
+    key : str
+        The name of the frame, built with `frame_key`.
+    build : Callable[[], pygame.Surface]
+        Function that loads the frame from its file.
+
+    Returns
+    -------
+    pygame.Surface
+        The frame at its final size.
+    """
+    image = pack_frame(key)
+    if image is None:
+        image = atlas_frame(key)
+        if image is None:
+            image = build()
+            record_frame(key, image)
+        record_pack(key, image)
+    return image
 
 class Sprites():
 
@@ -38,7 +509,8 @@ class Sprites():
         
         """
         Loads sprites from separate image files and stores them in a 
-        list.
+        list. Frames found in the asset pack or the texture atlas are 
+        taken from there instead of being read and scaled again.
 
         Parameters
         ----------
@@ -75,16 +547,19 @@ class Sprites():
 
         """
 
+        size = (width + adjW, height + adjH)
+        keys = []
+        frames = []
         for i in range(sizes_directory[action]):
-            image = pygame.image.load(
-                os.path.join(images_directory[action], f"{i+1}.png")
-            ).convert_alpha()
-            image = pygame.transform.scale(
-                image, (width + adjW, height + adjH)
-            )
-            if invert:
-                image = pygame.transform.flip(image, invert, False)
-            images[action].append(image)
+            path = os.path.join(images_directory[action], f"{i+1}.png")
+            keys.append(frame_key(path, None, size))
+            frames.append(load_frame(
+                keys[-1], 
+                lambda: pygame.transform.scale(surface_cache.load(path), size)
+            ))
+        if not isinstance(images[action], MirroredFrames):
+            images[action] = MirroredFrames()
+        images[action].add(keys, frames, invert)
 
 
     def load_spritesheets(
@@ -95,7 +570,9 @@ class Sprites():
     ) -> None:
         
         """
-        Loads a spritesheet and stores individual images in a list.
+        Loads a spritesheet and stores individual images in a list. 
+        Frames found in the asset pack or the texture atlas are taken 
+        from there instead of being read and scaled again.
 
         Parameters
         ----------
@@ -153,24 +630,28 @@ class Sprites():
         from different lines based on this value.
         """
         
-        sheet = pygame.image.load(
-            os.path.join(images_directory[action], f"{file_name}.png")
-        ).convert_alpha()
+        path = os.path.join(images_directory[action], f"{file_name}.png")
+        size = (width + adjW, height + adjH)
+        sheet = []
+
+        def cut(area: tuple) -> pygame.Surface:
+            # The sheet is only read when a frame has to be cut from it
+            if not sheet:
+                sheet.append(surface_cache.load(path))
+            return pygame.transform.scale(sheet[0].subsurface(area), size)
         
+        keys = []
+        frames = []
         for i in range(sizes_directory[action]):
             column = i % gap if gap else i
             row = i // gap if gap else 0
-            
-            image = sheet.subsurface((column * size_x, line + size_y * row), 
-                                     (size_x, size_y))
-            image = pygame.transform.scale(
-                image, (width + adjW, height + adjH)
-            )
-            
-            if invert:
-                image = pygame.transform.flip(image, invert, False)
-            
-            images[action].append(image)
+            area = (column * size_x, line + size_y * row, size_x, size_y)
+            keys.append(frame_key(path, area, size))
+            frames.append(load_frame(keys[-1], lambda: cut(area)))
+        
+        if not isinstance(images[action], MirroredFrames):
+            images[action] = MirroredFrames()
+        images[action].add(keys, frames, invert)
 
     def assets(
         self, rect: pygame.Rect, action: str, actual: dict[str, float], 
@@ -244,7 +725,9 @@ class Sprites():
         self.image_rect.centerx = rect.centerx
         self.before = action
 
-    def draw(self, screen: pygame.Surface, alpha: int = 255) -> None:
+    def draw(
+        self, screen: pygame.Surface, camera: object = None, alpha: int = 255
+    ) -> None:
 
         """
         Draw the assets on the screen.
@@ -253,6 +736,11 @@ class Sprites():
         ----------
         screen: pygame.Surface
             Surface where sprites will be drawn.
+        camera: Camera, optional
+            The camera that moves the sprite from the world to the 
+            screen. Without it, the sprite is drawn where it is.
+        alpha: int
+            Opacity of the sprite.
 
         Returns
         -------
@@ -264,7 +752,10 @@ class Sprites():
         
         if self.image and self.image_rect:
             self.image.set_alpha(alpha)
-            screen.blit(self.image, self.image_rect)
+            if camera is not None:
+                screen.blit(self.image, camera.apply(self.image_rect))
+            else:
+                screen.blit(self.image, self.image_rect)
 
 class Herolife:
     """
@@ -322,6 +813,10 @@ class Herolife:
         -------
         update(hero) -> None
             Updates the current health of the hero.
+        state() -> tuple
+            Returns the image of each heart.
+        render() -> tuple
+            Draws the hearts on a surface of their own.
         draw(screen) -> None
             Draws the hero's health bar on the screen.
         
@@ -340,7 +835,7 @@ class Herolife:
         Heart_path = os.path.abspath(Heart_path)
         for i in range(1, 6):
             image_path = os.path.join(Heart_path, f"heart_{i}.png")
-            self.image = pygame.image.load(image_path).convert_alpha()
+            self.image = surface_cache.load(image_path)
             self.image = pygame.transform.scale(self.image, (width, height))
             self.images.append(self.image)
 
@@ -364,6 +859,50 @@ class Herolife:
         self.max_life = hero.max_life
         self.hearts = self.max_life//self.heart
 
+    def state(self) -> tuple:
+        """
+        Returns the image used by each heart, which is all that changes 
+        the drawing of the health bar.
+
+        Returns
+        -------
+        tuple[int]
+            Index in `images` of each heart.
+        """
+        hearts = []
+        actual_life = self.actual_life
+        for i in range(self.hearts):
+            if actual_life <= 0:
+                hearts.append(4)
+            elif actual_life >= self.heart:
+                hearts.append(0)
+            elif actual_life >= self.heart*(3/4):
+                hearts.append(1)
+            elif actual_life >= self.heart*(1/2):
+                hearts.append(2)
+            else:
+                hearts.append(3)
+            actual_life -= self.heart
+        return tuple(hearts)
+
+    def render(self) -> tuple:
+        """
+        Draws the hearts on a transparent surface of their own.
+
+        Returns
+        -------
+        tuple
+            The surface and the rect of the screen it covers.
+        """
+        width, height = self.images[0].get_size()
+        rect = pygame.Rect(
+            self.adj, self.y, max(0, self.hearts - 1)*self.x + width, height
+        )
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        for i, image in enumerate(self.state()):
+            paste(surface, self.images[image], (i*self.x, 0))
+        return surface, rect
+
     def draw(self,screen):
         """
         Draws the hero's health bar on the screen using heart images to 
@@ -379,22 +918,9 @@ class Herolife:
         None
 
         """
-        actual_life = self.actual_life
-        for i in range(self.hearts):
-            if actual_life <= 0:
-                screen.blit(self.images[4], (i*self.x + self.adj , self.y))
-            elif actual_life >= self.heart:
-                screen.blit(self.images[0], (i*self.x + self.adj , self.y))
-                
-            elif actual_life >= self.heart*(3/4):
-                
-                screen.blit(self.images[1], (i*self.x + self.adj , self.y))
-            elif actual_life >= self.heart*(1/2):
-                
-                screen.blit(self.images[2], (i*self.x + self.adj , self.y))
-            else:
-                screen.blit(self.images[3], (i*self.x + self.adj , self.y))
-            actual_life -= self.heart
+        for i, image in enumerate(self.state()):
+            screen.blit(self.images[image], (i*self.x + self.adj , self.y))
+
 class Bar:
     def __init__(self, Value, x, y, width, height, color1, color2):
         self.max = Value  
@@ -414,6 +940,35 @@ class Bar:
         if self.actual > 0 :
             self.actual = self.max - self.actual
             self.rect.width = self.width * (self.actual/self.max)
+
+    def state(self) -> tuple:
+        """
+        Returns the width of the filled part, which is all that changes 
+        the drawing of the bar.
+
+        Returns
+        -------
+        tuple[int]
+            Width of the filled part of the bar.
+        """
+        return (self.rect.width,)
+
+    def render(self) -> tuple:
+        """
+        Draws the bar on a transparent surface of its own.
+
+        Returns
+        -------
+        tuple
+            The surface and the rect of the screen it covers.
+        """
+        surface = pygame.Surface(self.rect_2.size, pygame.SRCALPHA)
+        origin = (-self.rect_2.x, -self.rect_2.y)
+        pygame.draw.rect(surface, self.color1, self.rect_2.move(origin))
+        pygame.draw.rect(surface, self.color2, self.rect.move(origin))
+        pygame.draw.rect(surface, (0,0,0), self.rect_2.move(origin), 4)
+        return surface, self.rect_2.copy()
+
     def draw(self, screen):
         pygame.draw.rect(screen, self.color1, self.rect_2)
         pygame.draw.rect(screen, self.color2, self.rect)
@@ -499,6 +1054,35 @@ class Bosslife(Bar):
         self.rect.width = self.width * (Value / self.max)
         if self.transition.width > self.rect.width:
             self.transition.width -= self.health_change_speed 
+
+    def state(self) -> tuple:
+        """
+        Returns the widths that change the drawing of the bar.
+
+        Returns
+        -------
+        tuple[int]
+            Width of the transition and of the health bar.
+        """
+        return (self.transition.width, self.rect.width)
+
+    def render(self) -> tuple:
+        """
+        Draws the bar on a transparent surface of its own.
+
+        Returns
+        -------
+        tuple
+            The surface and the rect of the screen it covers.
+        """
+        rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        origin = (-rect.x, -rect.y)
+        pygame.draw.rect(surface, self.color2, self.transition.move(origin))
+        pygame.draw.rect(surface, self.color1, self.rect.move(origin))
+        pygame.draw.rect(surface, (0, 0, 0), rect.move(origin), 4)
+        return surface, rect
+
     def draw(self, screen : pygame.Surface) -> None:
         """
         Draws the boss's health bar on the screen, including the 
@@ -515,4 +1099,63 @@ class Bosslife(Bar):
         pygame.draw.rect(
             screen, (0, 0, 0), 
             pygame.Rect(self.x, self.y, self.width, self.height), 4
-        )
\ No newline at end of file
+        )
+class Hud:
+    """
+    Draws the HUD widgets from cached surfaces. Each widget is drawn 
+    again only when its state changes, and every cached surface is 
+    sent to the screen in a single `blits` call.
+
+    Attributes
+    ----------
+    cache : dict
+        Widget, state, surface and rect of each widget, keyed by the 
+        widget's id.
+    dirty : int
+        Number of widgets drawn again in the last frame.
+
+    Methods
+    -------
+    draw(screen, widgets) -> None
+        Draws the widgets, rendering only the changed ones.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty HUD.
+        """
+        self.cache = {}
+        self.dirty = 0
+
+    def draw(self, screen: pygame.Surface, widgets: list) -> None:
+        """
+        Draws the widgets, rendering again only the ones whose state 
+        changed since the last frame. Widgets left out of the list are 
+        dropped from the cache.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The screen surface where the widgets will be drawn.
+        widgets : list
+            Objects with `state()` and `render()`, like `Herolife`, 
+            `Bar` and `Bosslife`.
+
+        Returns
+        -------
+        None
+        """
+        self.dirty = 0
+        cache = {}
+        for widget in widgets:
+            entry = self.cache.get(id(widget))
+            state = widget.state()
+            if entry is None or entry[0] is not widget or entry[1] != state:
+                entry = (widget, state, *widget.render())
+                self.dirty += 1
+            cache[id(widget)] = entry
+        self.cache = cache
+        screen.blits(
+            [(surface, rect) for _, _, surface, rect in cache.values()],
+            doreturn=False
+        )
@@ -0,0 +1,410 @@
+import pygame
+import os, sys
+import json
+from typing import Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+main_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+assets_directory = os.path.join(main_directory, "assets")
+atlas_directory = os.path.join(assets_directory, "Atlas")
+manifest_name = "atlas.json"
+
+def frame_key(path: str, area: Optional[tuple], size: tuple) -> str:
+    """
+    Builds the name of an animation frame inside the atlas.
+
+    Parameters
+    ----------
+    path : str
+        Path of the source image file.
+    area : tuple or None
+        (x, y, width, height) of the frame inside a spritesheet, or
+        None when the frame is the whole file.
+    size : tuple
+        Final (width, height) of the frame.
+
+    Returns
+    -------
+    str
+        A key that does not depend on where the game was started from.
+
+    Notes
+    -----
+    Only the unflipped frames are stored, the flipped ones are made 
+    from them when loaded, which keeps the atlas at half the size.
+    """
+    source = os.path.abspath(path)
+    if source.startswith(assets_directory + os.sep):
+        source = source[len(assets_directory) + 1:]
+    else:
+        source = os.path.relpath(source, assets_directory)
+    source = source.replace(os.sep, "/")
+    area = ",".join(str(int(v)) for v in area) if area else "-"
+    return f"{source}|{area}|{int(size[0])}x{int(size[1])}"
+
+class TextureAtlas:
+    """
+    Atlas pages built by `AtlasBuilder`, with the frames cut out as
+    subsurfaces.
+
+    Attributes
+    ----------
+    frames : dict[str, tuple]
+        Page index and rectangle of each frame, keyed by `frame_key`.
+    pages : list[pygame.Surface]
+        The atlas images, converted once when loaded.
+    hits : int
+        Number of frames served from the atlas.
+    misses : int
+        Number of frames that were not in the atlas.
+
+    Methods
+    -------
+    frame(key) -> pygame.Surface or None
+        Returns the frame as a subsurface of its page.
+    """
+
+    def __init__(self, directory: str = atlas_directory) -> None:
+        """
+        Loads the manifest and the atlas pages in `directory`.
+
+        Parameters
+        ----------
+        directory : str
+            Directory with the manifest and the pages.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the manifest or one of the pages does not exist.
+        """
+        with open(os.path.join(directory, manifest_name)) as file:
+            manifest = json.load(file)
+
+        from src.assets import surface_cache
+        self.pages = [
+            surface_cache.load(os.path.join(directory, name))
+            for name in manifest["pages"]
+        ]
+
+        # Frames of a source file edited after the build are left out,
+        # so they are read from the file itself.
+        stale = set()
+        for source, mtime in manifest["sources"].items():
+            path = os.path.join(assets_directory, source)
+            if not os.path.exists(path) or os.path.getmtime(path) != mtime:
+                stale.add(source)
+
+        self.frames = {
+            key: value for key, value in manifest["frames"].items()
+            if key.split("|")[0] not in stale
+        }
+        self.hits = 0
+        self.misses = 0
+
+    def frame(self, key: str) -> Optional[pygame.Surface]:
+        """
+        Returns the frame stored under `key`.
+
+        Parameters
+        ----------
+        key : str
+            The name of the frame, built with `frame_key`.
+
+        Returns
+        -------
+        pygame.Surface or None
+            A subsurface of the atlas page, or None if the frame is not
+            in the atlas.
+        """
+        value = self.frames.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        page, x, y, width, height = value
+        return self.pages[page].subsurface((x, y, width, height))
+
+class AtlasBuilder:
+    """
+    Collects the animation frames loaded by `Sprites` and packs them
+    into atlas pages.
+
+    Attributes
+    ----------
+    frames : dict[str, pygame.Surface]
+        Recorded frames, already at their final size.
+    page_size : int
+        Maximum width and height of each atlas page.
+
+    Methods
+    -------
+    record(key, surface) -> None
+        Stores a frame to be packed.
+    pack() -> tuple
+        Places the frames on pages using shelves.
+    save(directory) -> list
+        Writes the pages and the manifest.
+    """
+
+    def __init__(self, page_size: int = 4096) -> None:
+        """
+        Initializes an empty builder.
+
+        Parameters
+        ----------
+        page_size : int
+            Maximum width and height of each atlas page.
+        """
+        self.frames = {}
+        self.page_size = page_size
+
+    def record(self, key: str, surface: pygame.Surface) -> None:
+        """
+        Stores a frame to be packed. Frames recorded twice are kept
+        once.
+
+        Parameters
+        ----------
+        key : str
+            The name of the frame, built with `frame_key`.
+        surface : pygame.Surface
+            The frame at its final size.
+
+        Returns
+        -------
+        None
+        """
+        self.frames.setdefault(key, surface)
+
+    def pack(self) -> tuple:
+        """
+        Places the frames on pages, filling rows (shelves) from the
+        tallest frame to the shortest.
+
+        Returns
+        -------
+        tuple
+            A dict with (page, x, y, width, height) for each key and a
+            list with the used (width, height) of each page.
+
+        Raises
+        ------
+        ValueError
+            If a frame is bigger than a page.
+        """
+        order = sorted(
+            self.frames, key=lambda k: self.frames[k].get_height(),
+            reverse=True
+        )
+        places = {}
+        pages = []
+        page = -1
+        x = y = shelf = used_w = 0
+        for key in order:
+            width, height = self.frames[key].get_size()
+            if width > self.page_size or height > self.page_size:
+                raise ValueError(f"Frame {key} is bigger than a page!")
+            if page < 0 or x + width > self.page_size:
+                x = 0
+                y += shelf
+                shelf = 0
+            if page < 0 or y + height > self.page_size:
+                if page >= 0:
+                    pages.append((used_w, y))
+                page += 1
+                x = y = shelf = used_w = 0
+            places[key] = (page, x, y, width, height)
+            x += width
+            shelf = max(shelf, height)
+            used_w = max(used_w, x)
+        if page >= 0:
+            pages.append((used_w, y + shelf))
+        return places, pages
+
+    def save(self, directory: str = atlas_directory) -> list:
+        """
+        Writes the atlas pages as PNG files and the manifest as JSON.
+
+        Parameters
+        ----------
+        directory : str
+            Directory where the files are written.
+
+        Returns
+        -------
+        list[str]
+            Names of the written pages.
+        """
+        from src.assets import paste
+
+        os.makedirs(directory, exist_ok=True)
+        places, sizes = self.pack()
+        surfaces = [pygame.Surface(size, pygame.SRCALPHA) for size in sizes]
+        for key, (page, x, y, _, _) in places.items():
+            paste(surfaces[page], self.frames[key], (x, y))
+
+        names = []
+        for i, surface in enumerate(surfaces):
+            names.append(f"atlas_{i}.png")
+            pygame.image.save(surface, os.path.join(directory, names[-1]))
+        for name in os.listdir(directory):
+            if name.startswith("atlas_") and name not in names:
+                os.remove(os.path.join(directory, name))
+
+        sources = {}
+        for key in places:
+            source = key.split("|")[0]
+            path = os.path.join(assets_directory, source)
+            sources[source] = os.path.getmtime(path)
+
+        with open(os.path.join(directory, manifest_name), "w") as file:
+            json.dump(
+                {"pages": names, "sources": sources, "frames": places},
+                file, indent=1, sort_keys=True
+            )
+        return names
+
+_atlas = None
+_atlas_loaded = False
+_builder = None
+
+def get_atlas() -> Optional[TextureAtlas]:
+    """
+    Returns the game's atlas, loading it the first time it is needed.
+
+    Returns
+    -------
+    TextureAtlas or None
+        The atlas, or None if it was not built or a build is running.
+    """
+    global _atlas, _atlas_loaded
+    if not _atlas_loaded:
+        _atlas_loaded = True
+        if _builder is None:
+            try:
+                _atlas = TextureAtlas()
+            except (FileNotFoundError, KeyError, ValueError):
+                _atlas = None
+    return _atlas
+
+def atlas_frame(key: str) -> Optional[pygame.Surface]:
+    """
+    Returns a frame from the game's atlas.
+
+    Parameters
+    ----------
+    key : str
+        The name of the frame, built with `frame_key`.
+
+    Returns
+    -------
+    pygame.Surface or None
+        The frame, or None if there is no atlas or the frame is not in
+        it.
+    """
+    atlas = get_atlas()
+    if atlas is None:
+        return None
+    return atlas.frame(key)
+
+def manifest_sources(directory: str = atlas_directory) -> set:
+    """
+    Reads which source files were packed, without loading the atlas.
+
+    Parameters
+    ----------
+    directory : str
+        Directory with the manifest.
+
+    Returns
+    -------
+    set[str]
+        Source files relative to `assets`, empty if there is no atlas.
+    """
+    try:
+        with open(os.path.join(directory, manifest_name)) as file:
+            return set(json.load(file)["sources"])
+    except (FileNotFoundError, KeyError, ValueError):
+        return set()
+
+def record_frame(key: str, surface: pygame.Surface) -> None:
+    """
+    Gives a loaded frame to the atlas builder, when one is running.
+
+    Parameters
+    ----------
+    key : str
+        The name of the frame, built with `frame_key`.
+    surface : pygame.Surface
+        The frame at its final size.
+
+    Returns
+    -------
+    None
+    """
+    if _builder is not None:
+        _builder.record(key, surface)
+
+def create_characters() -> list:
+    """
+    Creates every character with the sizes used in the game, which 
+    loads all of their frames.
+
+    Returns
+    -------
+    list
+        The heroes, the enemies and the bosses.
+    """
+    from src.player import Knight, Yokai, Ninja
+    from src.enemy import Dummy, Mage, Flying
+    from src.boss import Ganon, Balrog, Demagorgon
+
+    hero = Knight(0, 0, 40, 70)
+    return [
+        hero, Yokai(0, 0, 40, 70), Ninja(0, 0, 40, 70),
+        Dummy(0, 0, 50, 80, hero), Flying(0, 0, 60, 60, hero),
+        Mage(0, 0, 80, 150, hero), Ganon(1100, 500, 150, 220, hero),
+        Balrog(1000, 100, 140, 180, hero),
+        Demagorgon(1000, 400, 100, 300, hero)
+    ]
+
+def build_atlas(directory: str = atlas_directory) -> AtlasBuilder:
+    """
+    Builds the atlas by creating every character with the sizes used in
+    the game and recording the frames they load.
+
+    Parameters
+    ----------
+    directory : str
+        Directory where the atlas is written.
+
+    Returns
+    -------
+    AtlasBuilder
+        The builder with the recorded frames.
+    """
+    global _builder, _atlas, _atlas_loaded
+    _builder = AtlasBuilder()
+    _atlas = None
+    _atlas_loaded = True
+    try:
+        create_characters()
+        _builder.save(directory)
+        return _builder
+    finally:
+        _builder = None
+        _atlas_loaded = False
+
+if __name__ == "__main__":
+    # `Sprites` talks to `src.atlas`, not to this `__main__` module
+    from src.atlas import build_atlas
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    builder = build_atlas()
+    places, pages = builder.pack()
+    print(f"{len(places)} frames packed in {len(pages)} pages: {pages}")
+    pygame.quit()
@@ -8,8 +8,9 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(current_dir, '..')  
 sys.path.append(src_path)
 
-from src.weapon import Projectile, Attack
-from src.assets import Sprites
+from src.weapon import Attack, projectile_system
+from src.assets import Sprites, surface_cache
+from src.loader import AssetLoader
 
 class Bosses:
 
@@ -48,6 +49,9 @@ class Bosses:
         dies, as x coordinates, or None if still alive.
     touch : bool
         If the boss collides with a wall.
+    arena_x : int
+        World coordinate of the left edge of the arena, the screen 
+        where the boss fights.
 
     Methods
     -------
@@ -55,6 +59,10 @@ class Bosses:
         Updates the hero object reference used by the boss for various 
         interactions.
 
+    enter(arena_x) -> None
+        Moves the boss from the screen coordinates it was built with to
+        the arena.
+
     move() -> None
         Handles the movement mechanics of the boss, including position 
         changes and animations.
@@ -67,6 +75,10 @@ class Bosses:
         Renders the boss and its projectiles on the screen, 
         applying appropriate camera transformations.
 
+    scroll(screen, camera) -> None
+        Draws the projectiles of the boss, used when the boss is out of
+        the screen.
+
     on_collision(other) -> None
         Handles collision detection and response between the boss and 
         other objects, triggering specific actions when a collision 
@@ -114,6 +126,7 @@ class Bosses:
         self.immune = False
         self.death_position = None
         self.touch = False
+        self.arena_x = 0
 
     def new_hero(self, hero: object):
         """
@@ -132,6 +145,25 @@ class Bosses:
 
         self.hero = hero
 
+    def enter(self, arena_x: int) -> None:
+        """
+        Moves the boss to the arena. The boss is built and moves in the
+        coordinates of the screen, which are the coordinates of the 
+        arena once the camera stops.
+
+        Parameters
+        ----------
+        arena_x : int
+            World coordinate of the left edge of the arena.
+
+        Returns
+        -------
+        None
+        """
+
+        self.arena_x = arena_x
+        self.rect.x += arena_x
+
     def move(self):
         pass
 
@@ -156,14 +188,13 @@ class Bosses:
         self.speed_y += self.gravity
         self.rect.y += min(self.speed_y, self.speed_y_max)
 
-        for projectile in self.projectiles:
-            projectile.update()
+        projectile_system.update(self.projectiles)
         
     def draw (self, screen: pygame.Surface, camera: object):
         """
-        Draws the boss and its projectiles, adjusting their positions 
-        based on the camera movement. Additionally, it draws all the 
-        boss sprites.
+        Draws the boss and its projectiles, moved from the world to the 
+        screen by the camera. Additionally, it draws all the boss 
+        sprites.
 
         Parameters
         ----------
@@ -179,18 +210,30 @@ class Bosses:
             the screen by drawing sprites.
         """
 
-        if camera.TAG == "Camera":
-            self.rect.x -= camera.position_x
-        for projectile in self.projectiles:
-            if not screen.get_rect().colliderect(projectile.rect):
-                self.projectiles.remove(projectile)
-                del projectile
-        
-        self.sprites.draw(screen)
-        
+        self.sprites.draw(screen, camera)
+        self.scroll(screen, camera)
+
+    def scroll(self, screen: pygame.Surface, camera: object):
+        """
+        Draws the projectiles of the boss, without drawing the boss. 
+        Called directly for bosses out of the screen.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the projectiles will be drawn.
+        camera : object
+            The camera object used to move the projectiles to the 
+            screen.
+
+        Returns
+        -------
+        None
+        """
+
         for projectile in self.projectiles:
             projectile.draw(screen, camera)
-            self.shot.draw(screen)
+            self.shot.draw(screen, camera)
 
     def on_collision(self, other: object):
         """
@@ -198,7 +241,8 @@ class Bosses:
         objects. If the projectile hits a Player, it reduces their 
         life; if it hits the Ground, it gets deleted. If the boss 
         collides with Ground, it interacts with the ground and doesn't 
-        pass through it.
+        pass through it. Given the tile map, the boss and the 
+        projectiles are resolved against its tiles.
 
         Parameters
         ----------
@@ -213,6 +257,11 @@ class Bosses:
             does not return any value.
 
         """  
+        if other.TAG == "TileMap":
+            for tile in other.touching(self.rect):
+                self.on_collision(tile)
+            other.discard(self.projectiles)
+            return
 
         if (other.TAG == "Ground" and self.rect.colliderect(other) and 
             self.rect.bottom > other.rect.top and self.speed_y > 0 and
@@ -230,17 +279,13 @@ class Bosses:
             ):
                 self.touch = True
 
-        for projectile in self.projectiles:
-            if other.TAG == "Ground":
-                if projectile.rect.colliderect(other):
-                    self.projectiles.remove(projectile)
-                    del projectile
+        if other.TAG in ("Ground", "Player") and self.projectiles:
+            hits = projectile_system.hits(self.projectiles, other.rect)
             if other.TAG == "Player":
-                if projectile.rect.colliderect(other):
-                    other.life -= projectile.damage
+                for index in hits:
+                    other.life -= self.projectiles[index].damage
                     other.action = "Hurt"
-                    self.projectiles.remove(projectile)
-                    del projectile
+            projectile_system.release_all(self.projectiles, hits)
 
 class Balrog(Bosses):
     """
@@ -322,6 +367,8 @@ class Balrog(Bosses):
         Handles Balrog's movement.
     attack() -> None
         Manages Balrog's attack patterns.
+    enter(arena_x) -> None
+        Moves Balrog and its attack zones to the arena.
     draw(screen, camera) -> None
         Draws Balrog and its attacks on the screen.
     on_collision(other) -> None
@@ -461,6 +508,25 @@ class Balrog(Bosses):
             self.images_directory, self.adjW, self.adjH
         )
 
+    def enter(self, arena_x: int) -> None:
+        """
+        Moves Balrog and its attack zones, which cover the screen, to 
+        the arena.
+
+        Parameters
+        ----------
+        arena_x : int
+            World coordinate of the left edge of the arena.
+
+        Returns
+        -------
+        None
+        """
+
+        super().enter(arena_x)
+        for atks in self.all_atks:
+            atks.rect.x += arena_x
+
     def attack(self) -> None:
         """
         Handles Balrog's attack mechanics. 
@@ -486,6 +552,7 @@ class Balrog(Bosses):
         if self.atk_cooldown == self.warning_sign:
             self.probability_atk = random.randint(0, len(self.all_atks) - 1)
             self.rect.x = (
+                self.arena_x + 
                 self.screen_width/self.number_bars * self.probability_atk + 
                 self.screen_width/(2*self.number_bars)
             )
@@ -580,7 +647,7 @@ class Balrog(Bosses):
                     atks.rect, "Attack", self.actual_balrog, "L", 
                     self.fps["Attack"], self.images, 0, "B"
                 )
-                self.lightning.draw(screen)       
+                self.lightning.draw(screen, camera)
 
     def on_collision(self, other: object) -> None:
         """
@@ -718,6 +785,10 @@ class Ganon(Bosses):
     fps : dict
         A dictionary specifying the frames per second for each 
         animation.
+    volley : tuple
+        For each projectile of an attack, how far in front of Ganon and 
+        how far from his center it starts, and its damage when fired 
+        to the left (None for Ganon's damage).
 
     Methods
     -------
@@ -732,6 +803,11 @@ class Ganon(Bosses):
     
     """
 
+    volley = (
+        (50, 47, None), (31, 8, 20), (42, -54, None), (-5, -113, None), 
+        (37, -150, None), (33, -212, None), (50, -257, None)
+    )
+
     def __init__(
         self, x: float, y: float, width: int, height: int, hero: object
     ) -> None:
@@ -944,50 +1020,13 @@ class Ganon(Bosses):
                 )
                 if self.atk_timer <= 0:
                     self.actual_ganon["Attack"] = 0
-                    self.new_projectiles = [
-                                Projectile(
-                                    self.rect.left -50, self.rect.centery + 47,
-                                    -10, 0, self.TAG, self.damage, 35*2, 14*2, 
-                                    self.images["GProjectile"][1]
-                                ),
-                                Projectile(
-                                    self.rect.left -31, self.rect.centery + 8,
-                                    -10, 0, self.TAG, 20, 35*2, 14*2, 
-                                    self.images["GProjectile"][1]
-                                ),
-                                Projectile(
-                                    self.rect.left -42, self.rect.centery - 54, 
-                                    -10, 0, self.TAG, self.damage, 35*2, 14*2, 
-                                    self.images["GProjectile"][1]
-                                ),
-                                Projectile(
-                                    self.rect.left + 5, 
-                                    self.rect.centery - 113, -10, 0, self.TAG, 
-                                    self.damage, 35*2, 14*2, 
-                                    self.images["GProjectile"][1]
-                                ),
-                                Projectile(
-                                    self.rect.left - 37, 
-                                    self.rect.centery - 150, -10, 0, self.TAG, 
-                                    self.damage, 35*2, 14*2, 
-                                    self.images["GProjectile"][1]
-                                ),
-                                Projectile(
-                                    self.rect.left - 33, 
-                                    self.rect.centery - 212, -10, 0, self.TAG, 
-                                    self.damage, 35*2, 14*2, 
-                                    self.images["GProjectile"][1]
-                                ),                    
-                                Projectile(
-                                    self.rect.left - 50, 
-                                    self.rect.centery - 257, -10, 0, self.TAG, 
-                                    self.damage, 35*2, 14*2, 
-                                    self.images["GProjectile"][1]
-                                ),
-                    ]
-
-                    for projectile in self.new_projectiles:
-                        self.projectiles.append(projectile)
+                    for out, dy, damage in self.volley:
+                        projectile_system.fire(
+                            self.projectiles, self.rect.left - out, 
+                            self.rect.centery + dy, -10, 0, self.TAG, 
+                            damage or self.damage, 35*2, 14*2, 
+                            self.images["GProjectile"][1]
+                        )
                     self.atk_timer = self.atk_cooldown + self.atk_long 
 
             if self.hero.rect.x - self.rect.x  > 0:
@@ -998,45 +1037,12 @@ class Ganon(Bosses):
 
                 if self.atk_timer <= 0:
                     self.actual_ganon["Attack"] = 0
-                    self.new_projectiles = [
-                        Projectile(
-                            self.rect.right +50, self.rect.centery + 47, 10, 0, 
-                            self.TAG, 20, 35*2, 14*2, 
-                            self.images["GProjectile"][0]
-                        ),
-                        Projectile(
-                            self.rect.right +31, self.rect.centery + 8, 10, 0, 
-                            self.TAG, 20, 35*2, 14*2, 
-                            self.images["GProjectile"][0]
-                        ),
-                        Projectile(
-                            self.rect.right +42, self.rect.centery - 54, 10, 0, 
-                            self.TAG, 20, 35*2, 14*2, 
-                            self.images["GProjectile"][0]
-                        ),
-                        Projectile(
-                            self.rect.right - 5, self.rect.centery  - 113, 10, 
-                            0, self.TAG, 20, 35*2, 14*2, 
-                            self.images["GProjectile"][0]
-                        ),
-                        Projectile(
-                            self.rect.right + 37, self.rect.centery - 150, 10, 
-                            0, self.TAG, 20, 35*2, 14*2, 
-                            self.images["GProjectile"][0]
-                        ),
-                        Projectile(
-                            self.rect.right + 33, self.rect.centery  - 212, 10, 
-                            0, self.TAG, 20, 35*2, 14*2, 
-                            self.images["GProjectile"][0]
-                        ),                    
-                        Projectile(
-                            self.rect.right + 50, self.rect.centery - 257, 10, 
-                            0, self.TAG, 20, 35*2, 14*2, 
-                            self.images["GProjectile"][0]
-                        ),
-                    ]
-                    for projectile in self.new_projectiles:
-                        self.projectiles.append(projectile)
+                    for out, dy, _ in self.volley:
+                        projectile_system.fire(
+                            self.projectiles, self.rect.right + out, 
+                            self.rect.centery + dy, 10, 0, self.TAG, 20, 
+                            35*2, 14*2, self.images["GProjectile"][0]
+                        )
                     self.atk_timer = self.atk_cooldown + self.atk_long
 
     def distance(self, other: object) -> float:
@@ -1127,14 +1133,14 @@ class Ganon(Bosses):
                 self.teleport_cooldown <= 0
             ):
                 self.actual_ganon["Immune"] = 0
-                self.rect.x = 0.1 * self.screen_width
+                self.rect.x = self.arena_x + 0.1 * self.screen_width
                 self.rect.y = 0 
             elif (
                 self.hero.rect.centerx - self.rect.centerx > 0 and 
                 self.teleport_cooldown <= 0
             ):
                 self.actual_ganon["Immune"] = 8
-                self.rect.x = 0.8 * self.screen_width
+                self.rect.x = self.arena_x + 0.8 * self.screen_width
                 self.rect.y = 0 
 
 class Demagorgon(Bosses):
@@ -1475,4 +1481,109 @@ class Demagorgon(Bosses):
             self.move()
             self.attack()
         
-        return super().update()
\ No newline at end of file
+        return super().update()
+
+class BossRoster:
+    """
+    Spawn order of the bosses, holding how to build each one instead of 
+    the boss itself.
+
+    Attributes
+    ----------
+    factories : list[tuple]
+        The boss class and its (x, y, width, height) for every boss 
+        still in the roster, in spawn order.
+    ready : list
+        Bosses already built, the first ones of `factories`.
+    prefetch : threading.Thread or None
+        Worker thread decoding the image files of the bosses.
+
+    Methods
+    -------
+    prepare(hero) -> None
+        Builds the next boss, if its images are decoded.
+    pop(hero, arena_x) -> Bosses
+        Removes and returns the next boss, building it if needed.
+
+    Notes
+    -----
+    The images of each boss are in the folder of `assets` with the name 
+    of its class. Files whose frames are in the asset pack or the 
+    texture atlas are not decoded again.
+    """
+
+    def __init__(self, factories: list[tuple]) -> None:
+        """
+        Initializes the roster and starts decoding the boss images.
+
+        Parameters
+        ----------
+        factories : list[tuple]
+            The boss class and its (x, y, width, height), in spawn 
+            order.
+
+        Returns
+        -------
+        None
+        """
+        self.factories = list(factories)
+        self.ready = []
+        main_directory = os.path.dirname(os.path.dirname(__file__))
+        assets_directory = os.path.join(main_directory, "assets")
+
+        paths = AssetLoader.find_images(
+            assets_directory, [boss.__name__ for boss, _ in self.factories]
+        )
+        self.prefetch = surface_cache.prefetch(paths) if paths else None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of bosses still in the roster.
+        """
+        return len(self.factories)
+
+    def prepare(self, hero: object) -> None:
+        """
+        Builds the next boss that is not built yet, at most one per 
+        call, once the worker has decoded the images. Called every frame 
+        before the boss phase, so the bosses are ready when it starts.
+
+        Parameters
+        ----------
+        hero : object
+            The current hero, given to the boss.
+
+        Returns
+        -------
+        None
+        """
+        if self.prefetch is not None and self.prefetch.is_alive():
+            return
+        if len(self.ready) < len(self.factories):
+            boss, (x, y, width, height) = self.factories[len(self.ready)]
+            self.ready.append(boss(x, y, width, height, hero))
+
+    def pop(self, hero: object, arena_x: int = 0) -> Bosses:
+        """
+        Removes the next boss from the roster and puts it in the arena.
+
+        Parameters
+        ----------
+        hero : object
+            The current hero, given to the boss.
+        arena_x : int
+            World coordinate of the left edge of the arena.
+
+        Returns
+        -------
+        Bosses
+            The next boss, built now if `prepare` did not build it yet.
+        """
+        boss, (x, y, width, height) = self.factories.pop(0)
+        if self.ready:
+            boss = self.ready.pop(0)
+            boss.new_hero(hero)
+        else:
+            boss = boss(x, y, width, height, hero)
+        boss.enter(arena_x)
+        return boss
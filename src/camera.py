@@ -2,27 +2,30 @@ import pygame
 
 class Camera:
     """
-    Class responsible for changing the visible part of the game
+    Class responsible for changing the visible part of the game. The 
+    entities keep their positions in the world, the camera only moves 
+    them to the screen when they are drawn.
     
     Atributes
     ---------
     TAG : str
         General identifier of the class.
     position_x : int
-        Coordinate of the top-left corner of the screen, which 
-        will be updated with the hero's movement.
+        World coordinate of the left edge of the screen, which will be
+        updated with the hero's movement.
     WIDTH: int
         Screen width.
-    fix_x : int
-        Coordinates of the top-left corner, but fixed in the initial
-        coordinate system.
     boss_fase : bool
         Bool of when the player is on boss fase.
+    boss_x : int
+        Value of `position_x` where the boss fase starts.
         
     Methods
     -------
     update_coods(hero, main) -> None
         Updates the coordinate of the attributes.
+    apply(rect) -> pygame.Rect
+        Returns where a rect of the world is on the screen.
     """
     
     
@@ -45,8 +48,8 @@ class Camera:
         self.TAG = "Camera"
         self.position_x = x_init
         self.WIDTH = WIDTH
-        self.fix_x = x_init + self.WIDTH // 2
         self.boss_fase = False
+        self.boss_x = 132 * 50
     
     def update_coods(self, hero: object, main: object):
         """
@@ -61,11 +64,150 @@ class Camera:
         """
         
         if hero.TAG == "Player":
-            if self.fix_x <= (132 * (-50)) + 700 and not self.boss_fase:
+            if self.position_x >= self.boss_x and not self.boss_fase:
                 self.boss_fase = True
                 main.is_changed = True
-            if hero.rect.centerx >= self.fix_x and not self.boss_fase:
+            if hero.rect.centerx >= self.WIDTH // 2 and not self.boss_fase:
                 self.position_x = hero.rect.centerx - self.WIDTH // 2
-                self.fix_x -= self.position_x
-            else:
-                self.position_x = 0
+
+    def apply(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Returns where a rect of the world is on the screen.
+
+        Parameters
+        ----------
+        rect : pygame.Rect
+            A rect in world coordinates.
+
+        Returns
+        -------
+        pygame.Rect
+            A moved copy of `rect`.
+        """
+
+        return rect.move(-self.position_x, 0)
+
+class Culling:
+    """
+    Decides which entities are drawn and which are simulated, from 
+    the screen rectangle grown by a margin.
+
+    Atributes
+    ---------
+    TAG : str
+        General identifier of the class.
+    view : pygame.Rect
+        The screen rectangle.
+    margin : int
+        Distance out of the screen where entities are still drawn.
+    sleep_margin : int
+        Distance out of the screen where monsters still act.
+    sleep : bool
+        Whether the monsters beyond `sleep_margin` stop acting.
+    culled : int
+        Entities not drawn in the last frame.
+    simulated : int
+        Entities updated in the last frame.
+
+    Methods
+    -------
+    follow(camera) -> None
+        Moves the areas to where the camera is.
+    visible(entity) -> bool
+        Tells whether an entity must be drawn.
+    awake(entity) -> bool
+        Tells whether a monster must be updated.
+    """
+
+    def __init__(
+        self, view: pygame.Rect, margin: int = 100, 
+        sleep_margin: int = None, sleep: bool = True
+    ) -> None:
+        """
+        Initializes the culling.
+
+        Parameters
+        ----------
+        view : pygame.Rect
+            The screen rectangle.
+        margin : int
+            Distance out of the screen where entities are still drawn.
+        sleep_margin : int
+            Distance out of the screen where monsters still act, the 
+            screen width by default.
+        sleep : bool
+            Whether the monsters beyond `sleep_margin` stop acting.
+
+        Returns
+        -------
+        None
+        """
+
+        self.TAG = "Culling"
+        self.view = view
+        self.margin = margin
+        if sleep_margin is None:
+            sleep_margin = view.width
+        self.sleep_margin = sleep_margin
+        self.sleep = sleep
+        self.drawn_area = view.inflate(2 * margin, 2 * margin)
+        self.awake_area = view.inflate(2 * sleep_margin, 2 * sleep_margin)
+        self.culled = 0
+        self.simulated = 0
+
+    def follow(self, camera: Camera) -> None:
+        """
+        Moves the areas to the part of the world the camera shows.
+
+        Parameters
+        ----------
+        camera : Camera
+            The camera of the game.
+
+        Returns
+        -------
+        None
+        """
+
+        self.drawn_area.x = camera.position_x + self.view.x - self.margin
+        self.awake_area.x = (
+            camera.position_x + self.view.x - self.sleep_margin
+        )
+
+    def visible(self, entity: object) -> bool:
+        """
+        Tells whether an entity is close enough to the screen to be 
+        drawn.
+
+        Parameters
+        ----------
+        entity : object
+            Any object with a rect.
+
+        Returns
+        -------
+        bool
+            False if only the projectiles of the entity are drawn.
+        """
+
+        return self.drawn_area.colliderect(entity.rect)
+
+    def awake(self, entity: object) -> bool:
+        """
+        Tells whether a monster is close enough to the screen to act. 
+        Dying monsters always act, so they finish dying.
+
+        Parameters
+        ----------
+        entity : object
+            A monster.
+
+        Returns
+        -------
+        bool
+            False if the monster sleeps this frame.
+        """
+
+        if not self.sleep or entity.life <= 0:
+            return True
+        return self.awake_area.colliderect(entity.rect)
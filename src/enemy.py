@@ -7,7 +7,7 @@ src_path = os.path.join(current_dir, '..')
 sys.path.append(src_path)
 
 from src.assets import Sprites
-from src.weapon import Projectile
+from src.weapon import projectile_system
 
 class Monsters:
     """
@@ -56,6 +56,8 @@ class Monsters:
         Update the position and the hero himself.
     draw(screen, camera) -> None
         Draws the monster and its projectiles on the screen.
+    scroll(screen, camera) -> None
+        Draws the projectiles of the monster.
     on_collision(other) -> None
         Handles collision detection and response for the monster.
 
@@ -147,23 +149,34 @@ class Monsters:
             The surface where the monster and its projectiles will be 
             drawn.
         camera : object
-            The camera object, used to adjust the monster's position 
-            based on its `position_x` attribute.
+            The camera object, used to move the monster from the world 
+            to the screen.
 
         Returns
         -------
         None
         """
-        self.sprites.draw(screen)
+        self.sprites.draw(screen, camera)
+        self.scroll(screen, camera)
 
+    def scroll(self, screen: pygame.Surface, camera: object) -> None:
+        """
+        Draws the projectiles of the monster, without drawing the 
+        monster. Called directly for monsters out of the screen.
 
-        if camera.TAG == "Camera":
-            self.rect.x -= camera.position_x
-        for projectile in self.projectiles:
-            projectile.draw(screen, camera)
-            if not screen.get_rect().colliderect(projectile.rect):
-                self.projectiles.remove(projectile)
-                del projectile
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the projectiles will be drawn.
+        camera : object
+            The camera object, used to move the projectiles from the 
+            world to the screen.
+
+        Returns
+        -------
+        None
+        """
+        projectile_system.draw(self.projectiles, screen, camera)
                         
     def on_collision(self, other : object) -> None:  
         """
@@ -177,18 +190,24 @@ class Monsters:
         from the monster's projectiles list. If a projectile collides 
         with the "Player", the player's health is reduced by the 
         projectile's damage, and the projectile is removed from the 
-        monster's projectiles list.
+        monster's projectiles list. Given the tile map, the monster and 
+        the projectiles are resolved against its tiles.
 
         Parameters
         ----------
         other : object
             The object that the monster is colliding with. This can be 
-            a "Ground", "Projectile", or "Player".
+            a "Ground", "Projectile", "Player" or the "TileMap".
 
         Returns
         -------
         None
         """
+        if other.TAG == "TileMap":
+            for tile in other.touching(self.rect):
+                self.on_collision(tile)
+            other.discard(self.projectiles)
+            return
 
         if (other.TAG == "Ground" and self.rect.colliderect(other) and 
             self.rect.bottom > other.rect.top and 
@@ -196,16 +215,12 @@ class Monsters:
         ):
                 self.rect.bottom = other.rect.top
 
-        for projectile in self.projectiles:
-            if other.TAG == "Ground":
-                if projectile.rect.colliderect(other):
-                    self.projectiles.remove(projectile)
-                    del projectile
+        if other.TAG in ("Ground", "Player") and self.projectiles:
+            hits = projectile_system.hits(self.projectiles, other.rect)
             if other.TAG == "Player":
-                if projectile.rect.colliderect(other):
-                    other.life -= projectile.damage
-                    self.projectiles.remove(projectile)
-                    del projectile
+                for index in hits:
+                    other.life -= self.projectiles[index].damage
+            projectile_system.release_all(self.projectiles, hits)
 
 class Dummy(Monsters):
     """
@@ -257,6 +272,8 @@ class Dummy(Monsters):
         Handles the mechanic of movement of dummy monster.
     draw(screen, camera) -> None
         Draws the dummy and its associated sprites on the screen.
+    scroll(screen, camera) -> None
+        Turns the dummy back at the left edge of the world.
     """
 
     def __init__(
@@ -432,21 +449,36 @@ class Dummy(Monsters):
         screen : pygame.Surface
             The surface where the dummy and its sprites will be drawn.
         camera : object
-            The camera object, used to adjust the dummy's position 
-            based on the camera's `position_x` and `fix_x`.
+            The camera object, used to move the dummy from the world to
+            the screen.
 
         """
 
         super().draw(screen, camera)
-        if camera.TAG == "Camera":
-            self.init_x -= camera.position_x
-            if (self.rect.x < camera.fix_x - (screen.get_size()[0] // 2) and 
-                self.to_left
-            ):
-                self.speed_x *= -1
-                self.to_left = True
-                self.to_right = False
-        self.sprites.draw(screen)
+        self.sprites.draw(screen, camera)
+
+    def scroll(self, screen: pygame.Surface, camera: object) -> None:
+        """
+        Draws the projectiles of the dummy, without drawing it, and 
+        turns it back at the left edge of the world.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the projectiles will be drawn.
+        camera : object
+            The camera object, used to move the projectiles from the 
+            world to the screen.
+
+        Returns
+        -------
+        None
+        """
+        super().scroll(screen, camera)
+        if self.rect.x < 0 and self.to_left:
+            self.speed_x *= -1
+            self.to_left = True
+            self.to_right = False
 
 class Mage(Monsters):
     """
@@ -625,8 +657,7 @@ class Mage(Monsters):
         if self.projectile_cooldown > 0:
             self.projectile_cooldown -= 1
 
-        for projectile in self.projectiles:
-            projectile.update()
+        projectile_system.update(self.projectiles)
             
         if self.life <= 0:
             if self.to_left:
@@ -664,21 +695,21 @@ class Mage(Monsters):
 
         if self.projectile_cooldown <= 0:
             if self.to_left:
-                new_projectile = Projectile(
-                    self.rect.left, self.rect.centery, - 20, 0, self.TAG, 
-                    self.damage, 50, 30, self.image_projectile_l
+                projectile_system.fire(
+                    self.projectiles, self.rect.left, self.rect.centery, 
+                    - 20, 0, self.TAG, self.damage, 50, 30, 
+                    self.image_projectile_l
                 )
-                self.projectiles.append(new_projectile)
                 self.sprites.assets(
                     self.rect, "Attack", self.actual_mage, "L", 
                     self.fps["Attack"], self.images, self.adj, "M"
                 )
             else:
-                new_projectile = Projectile(
-                    self.rect.right, self.rect.centery, 20, 0, self.TAG, 
-                    self.damage, 50, 30, self.image_projectile_r
+                projectile_system.fire(
+                    self.projectiles, self.rect.right, self.rect.centery, 
+                    20, 0, self.TAG, self.damage, 50, 30, 
+                    self.image_projectile_r
                 )
-                self.projectiles.append(new_projectile)
                 self.sprites.assets(
                     self.rect, "Attack", self.actual_mage, "R", 
                     self.fps["Attack"], self.images, self.adj, "M"
@@ -753,8 +784,8 @@ class Flying(Monsters):
         Handles collision detection and response for the flying monster.
     update() -> None
         Updates the flying enemy's states.
-    draw(screen, camera) -> None
-        Draws the flying enemy.
+    scroll(screen, camera) -> None
+        Draws the projectiles and advances the attack animation.
     attack() -> None 
         Handles the flying enemy's attack behavior.
     
@@ -963,8 +994,7 @@ class Flying(Monsters):
         if self.projectile_cooldown > 0:
             self.projectile_cooldown -= 1
 
-        for projectile in self.projectiles:
-            projectile.update()
+        projectile_system.update(self.projectiles)
             
         if self.life <= 0:
             if self.to_left:
@@ -985,15 +1015,16 @@ class Flying(Monsters):
             self.attack()
             self.move()
     
-    def draw(self, screen : pygame.Surface, camera: object) -> None:
+    def scroll(self, screen : pygame.Surface, camera: object) -> None:
         """
-        Draws the flying enemy and its current animation state to the 
+        Draws the projectiles of the flying enemy and advances its 
+        attack animation, which also runs while it is out of the 
         screen.
 
         Parameters
         ----------
         screen : pygame.Surface
-            The screen or surface where the enemy's sprite should be 
+            The screen or surface where the projectiles should be 
             drawn.
         camera : object
             The camera used for adjusting the enemy's position on the 
@@ -1004,7 +1035,7 @@ class Flying(Monsters):
         None
         """
 
-        super().draw(screen, camera)
+        super().scroll(screen, camera)
         
         if self.to_right and not self.life <= 0:
             if self.actual_flying["Attack"] >= len(self.images["FAttack"]):
@@ -1040,10 +1071,9 @@ class Flying(Monsters):
         """
 
         if self.projectile_cooldown <= 0:
-            new_projectile = Projectile(
-                self.rect.left, self.rect.bottom, 0, 20, self.TAG, 20, 40, 60, 
-                self.image_projectile
+            projectile_system.fire(
+                self.projectiles, self.rect.left, self.rect.bottom, 0, 20, 
+                self.TAG, 20, 40, 60, self.image_projectile
             )
-            self.projectiles.append(new_projectile)
             self.projectile_cooldown = self.cool_down
             self.is_attacking = True
\ No newline at end of file
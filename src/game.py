@@ -1,16 +1,24 @@
 import pygame
-import os, sys, random
+import os, sys
+from typing import Iterator
 
 current_dir = os.path.dirname(os.path.abspath(__file__))  
 src_path = os.path.join(current_dir, '..')  
 sys.path.append(src_path)
 
 from src.player import Knight, Yokai, Ninja
-from src.camera import Camera
+from src.camera import Camera, Culling
+from src.parallax import Parallax, ParallaxLayer
 from src.score import Score
 from src.maker import maping
-from src.boss import Balrog, Ganon, Demagorgon
-from src.assets import Herolife, Bar, Bosslife
+from src.ground import TileLayer, TileMap
+from src.snapshot import WorldSnapshot
+from src.spatial import SpatialHash
+from src.boss import Balrog, Ganon, Demagorgon, BossRoster
+from src.assets import Herolife, Bar, Bosslife, Hud
+from src.assets import surface_cache, load_frame
+from src.atlas import frame_key
+from src.weapon import projectile_system
 
 class GameManager:
     """
@@ -27,26 +35,52 @@ class GameManager:
         The currently active hero instance.
     camera : Camera
         Camera object to manage the visible game area.
+    culling : Culling
+        Skips drawing the entities out of the screen and updating the 
+        monsters far from it.
     grounds : list
         List of ground objects in the game world.
+    tile_layer : TileLayer
+        The static grounds, pre-rendered in chunks one screen wide.
+    props : list
+        The grounds drawn one by one, like blocks and obelisks.
+    tilemap : TileMap
+        Kinds of the static grounds cell by cell, which the entities 
+        collide with instead of the ground objects.
+    colliders : SpatialHash
+        The props in cells of one tile, so each entity is only tested 
+        against the props around it.
+    blocks : list
+        The grounds that can be pushed, put back in their cells every 
+        frame.
+    pair_tests : int
+        Pairs of objects tested for collision in the last frame.
+    projectile_system : ProjectileSystem
+        Pool of the projectiles, which drops the ones that leave the 
+        screen.
     enemies : list
         List of enemies in the game world.
     bosses : list
         List of bosses currently active in the game.
-    order : list
-        List defining the spawn order of bosses.
+    order : BossRoster
+        Spawn order of the bosses, built in the background before the 
+        boss phase.
     life_bar : Herolife
         Hero's health bar object.
     hero_timer : Bar
         Timer for hero switching cooldown.
+    hud : Hud
+        Draws the health bars and the timer from cached surfaces.
     _keys_trade : list
         Attributes shared among heroes when switching.
     score_text : Score
         Used to show the score in the game screen.
-    bg_images : list
-        Background images for parallax scrolling.
+    parallax : Parallax
+        Background layers for parallax scrolling.
     bg_boss : Surface
         Background image for boss fights.
+    snapshot : WorldSnapshot
+        State of the world right after it was built, used to restart.
     pos_x : int
         X-coordinate for background scrolling.
     pos_x_p : int
@@ -65,6 +99,10 @@ class GameManager:
         and camera.
     collision_decetion() -> None
         Detects and handles collisions between game entities.
+    fight() -> None
+        Resolves the hits between the hero and the enemies and bosses.
+    nearby(entity) -> Iterator[object]
+        Yields the props that may touch an entity this frame.
     elimination(change_state) -> None
         Removes defeated enemies or bosses, and transitions state 
         if the hero dies.
@@ -72,6 +110,8 @@ class GameManager:
         Draws all game elements to the screen.
     trade(event) -> None
         Switches between available heroes.
+    reset() -> None
+        Puts the world back as it was when the game was built.
     """
 
     def __init__(self, main: object) -> None:
@@ -105,18 +145,28 @@ class GameManager:
         self.WIDTH = main.WIDTH
         self.HEIGHT = main.HEIGHT
         self.main = main
+        tiles = [g for g in self.grounds if TileLayer.is_static(g)]
+        self.tile_layer = TileLayer(tiles, self.WIDTH)
+        self.tilemap = TileMap(tiles)
+        self.props = [g for g in self.grounds if not TileLayer.is_static(g)]
+        self.colliders = SpatialHash(50, self.props)
+        self.blocks = [g for g in self.grounds if g.sub_TAG == "Block"]
+        self.pair_tests = 0
+        self.projectile_system = projectile_system
+        self.culling = Culling(pygame.Rect(0, 0, self.WIDTH, self.HEIGHT))
         self.bosses = []
-        self.order = [
-            Ganon(1100, 500, 150, 220, self.hero),
-            Balrog(1000, 100, 140, 180, self.hero),
-            Demagorgon(1000, 400, 100, 300, self.hero),
-        ]
+        self.order = BossRoster([
+            (Ganon, (1100, 500, 150, 220)),
+            (Balrog, (1000, 100, 140, 180)),
+            (Demagorgon, (1000, 400, 100, 300)),
+        ])
         self.life_bar = Herolife(self.hero, 400, 50, 15, 40, 40, 20)
         self.hero_timer = Bar(
             self.hero.trade_cooldown_time, 20, 70, 240, 20, 
             (255, 255, 255), (160, 32, 240)
         )
         self.bosses_life = []
+        self.hud = Hud()
         self._keys_trade = [
             "rect", "speed_x", "speed_y", "jump_count", "is_running",
             "on_ground", "to_left", "to_right", "from_the_front",
@@ -130,25 +180,49 @@ class GameManager:
         )
         
         #BackGround image
-        self.bg_images = []
+        layers = []
         Background_path = os.path.join(main.assets_path, "Background")
         image_path = os.path.join(Background_path, "boss_fase.png")
-        self.bg_boss = pygame.image.load(image_path).convert_alpha()
-        self.bg_boss = pygame.transform.scale(
-            self.bg_boss, (self.WIDTH, self.HEIGHT)
+        size = (self.WIDTH, self.HEIGHT)
+        self.bg_boss = load_frame(
+            frame_key(image_path, None, size),
+            lambda: pygame.transform.scale(surface_cache.load(image_path), size)
         )
         
         #Parallax
         for i in range(1, 4):
             image_path = os.path.join(Background_path, f"background_{i}.png")
-            bg_image = pygame.image.load(image_path).convert_alpha()
-            bg_image = pygame.transform.scale(
-                bg_image, (self.WIDTH, self.HEIGHT)
+            bg_image = load_frame(
+                frame_key(image_path, None, size),
+                lambda: pygame.transform.scale(
+                    surface_cache.load(image_path), size
+                )
             )
-            self.bg_images.append(bg_image)
+            layers.append(ParallaxLayer(bg_image, i == 1))
+        self.parallax = Parallax(layers)
         self.pos_x = -self.WIDTH
         self.pos_x_p = -self.WIDTH
 
+        # Taken last, so that a restart keeps every loaded image
+        self.snapshot = WorldSnapshot(self, [main])
+
+    def reset(self) -> None:
+        """
+        Puts the heroes, enemies, bosses, ground and camera back as 
+        they were when the game was built, without loading anything.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        snapshot = self.snapshot
+        snapshot.restore()
+        self.snapshot = snapshot
+
     def music(self, main: object, volume: float) -> None:
         """
         Manages background music based on the current game state.
@@ -165,27 +239,21 @@ class GameManager:
         None
         """
         if main.is_changed:
-            music_dir_path = os.path.join(main.assets_path, "Music")
             if self.camera.boss_fase:
-                music_num = random.randint(1, 5)
-                music_path = os.path.join(
-                    music_dir_path, "Boss", f"B{music_num}.mp3"
-                )
-                pygame.mixer.music.load(music_path)
+                main.music_manager.play("Boss", volume)
             elif self.hero.can_push_block:
-                music_num = random.randint(1, 4)
-                music_path = os.path.join(
-                    music_dir_path, "Obelisk", f"O{music_num}.mp3"
-                )
-                pygame.mixer.music.load(music_path)
+                main.music_manager.play("Obelisk", volume)
             else:
-                music_num = random.randint(1, 5)
-                music_path = os.path.join(
-                    music_dir_path, "World", f"W{music_num}.mp3"
-                )
-                pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(-1)
+                main.music_manager.play("World", volume)
+        elif not self.camera.boss_fase:
+            # The next track is read before it is needed, when the
+            # arena or an obelisk is close
+            near_x = self.camera.boss_x - 2 * self.WIDTH
+            if self.camera.position_x >= near_x:
+                main.music_manager.prefetch("Boss")
+            if self.hero.has_collision_obelisk:
+                if not self.hero.can_push_block:
+                    main.music_manager.prefetch("Obelisk")
         main.is_changed = False
 
     def on_event(self, event: pygame.event.Event, main: object) -> None:
@@ -206,19 +274,22 @@ class GameManager:
         self.trade(event)
         self.hero.on_event(event, main)
 
-    def on_key_pressed(self) -> None:
+    def on_key_pressed(self, key_map: object = None) -> None:
         """
         Handles continuous key presses for hero movement and actions.
 
         Parameters
         ----------
-        None
+        key_map : object, optional
+            The held keys, indexed by key code. If not provided, the 
+            keyboard is read, replays give the keys of their frames.
 
         Returns
         -------
         None
         """
-        key_map = pygame.key.get_pressed()
+        if key_map is None:
+            key_map = pygame.key.get_pressed()
         self.hero.on_key_pressed(key_map, self.main)
         self.hero.actions(key_map)
 
@@ -235,28 +306,36 @@ class GameManager:
         -------
         None
         """
+        self.hero.min_x = self.camera.position_x
         self.hero.update()
         self.life_bar.update(self.hero)
         self.hero_timer.update(self.hero.trade_cooldown)
         self.camera.update_coods(self.hero, self.main)
+        self.culling.follow(self.camera)
         points = self.hero.points
         self.score_text.update(points)
 
         if self.camera.boss_fase:
             if len(self.bosses) == 0 and len(self.order) != 0:
-                self.bosses.append(self.order[0])
+                self.bosses.append(
+                    self.order.pop(self.hero, self.camera.position_x)
+                )
                 self.bosses_life.append(
-                    Bosslife(self.order[0].life, 200, 750, 1000, 
+                    Bosslife(self.bosses[0].life, 200, 750, 1000, 
                              40,(0, 255, 0), (255, 0, 0)
                     )
                 )
-                del self.order[0]
+        else:
+            self.order.prepare(self.hero)
 
         for ground in self.grounds:
             ground.update()
 
+        self.culling.simulated = len(self.bosses)
         for monster in self.enemies:
-            monster.update()
+            if self.culling.awake(monster):
+                monster.update()
+                self.culling.simulated += 1
             monster.new_hero(self.hero)
 
         for boss in self.bosses:
@@ -267,7 +346,10 @@ class GameManager:
     def collision_decetion(self) -> None:
         """
         Detects and resolves collisions between all entities in the 
-        game, such as the hero, enemies, bosses, and ground objects.
+        game, such as the hero, enemies, bosses, and ground objects. 
+        Each entity collides with the tile map, then with the props in 
+        the cells around it, and the tested pairs are counted in 
+        pair_tests.
 
         Parameters
         ----------
@@ -277,31 +359,101 @@ class GameManager:
         -------
         None
         """
-        for ground in self.grounds:
+        self.pair_tests = 0
+        for block in self.blocks:
+            self.colliders.move(block)
+
+        self.fight()
+        self.hero.on_collision(self.tilemap)
+        for ground in self.nearby(self.hero):
             ground.on_collision(self.hero)
             self.hero.on_collision(ground)
 
-            for enemie in self.enemies:
-                self.hero.on_collision(enemie)
-                enemie.on_collision(self.hero)
+        for enemie in self.enemies:
+            enemie.on_collision(self.tilemap)
+            for ground in self.nearby(enemie):
                 enemie.on_collision(ground)
                 ground.on_collision(enemie)
 
-            for boss in self.bosses:
-                boss.on_collision(self.hero)
-                self.hero.on_collision(boss)
+        for boss in self.bosses:
+            boss.on_collision(self.tilemap)
+            for ground in self.nearby(boss):
                 ground.on_collision(boss)
                 boss.on_collision(ground)
 
-            if ground.sub_TAG == "Block":
-                for gro in self.grounds:
-                    ground.on_collision(gro)
+        for block in self.blocks:
+            block.on_collision(self.tilemap)
+            for ground in self.nearby(block):
+                block.on_collision(ground)
+
+        #the grounds may have moved someone into a fight
+        self.fight()
+
+    def fight(self) -> None:
+        """
+        Resolves the hits between the hero and the enemies and bosses.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        for enemie in self.enemies:
+            self.hero.on_collision(enemie)
+            enemie.on_collision(self.hero)
+        for boss in self.bosses:
+            boss.on_collision(self.hero)
+            self.hero.on_collision(boss)
+        self.pair_tests += len(self.enemies) + len(self.bosses)
+
+    def nearby(self, entity: object) -> Iterator[object]:
+        """
+        Yields the props that may touch an entity or its projectiles, 
+        in the order of the map, and counts them as tested pairs. The 
+        projectiles are looked around as the one rect that holds them 
+        all. When a prop pushes the entity, the props left are looked 
+        for again around its new place.
+
+        Parameters
+        ----------
+        entity : object
+            Any entity with a rect, and maybe projectiles.
+
+        Returns
+        -------
+        Iterator[object]
+            The props close to it.
+        """
+        start = 0
+        while True:
+            rect = entity.rect.copy()
+            rects = [rect]
+            projectiles = getattr(entity, "projectiles", None)
+            if projectiles:
+                rects.append(
+                    projectiles[0].rect.unionall([p.rect for p in projectiles])
+                )
+            # Most entities are far from every prop
+            if not self.colliders.occupied(*rects):
+                return
+            grounds = self.colliders.query(*rects, start=start)
+            for ground in grounds:
+                self.pair_tests += 1
+                yield ground
+                if entity.rect != rect:
+                    start = self.colliders.keys[id(ground)] + 1
+                    break
+            else:
+                return
 
     def elimination(self, change_state) -> None:
         """
-        Eliminates defeated enemies or bosses, and transitions to 
-        the game over state if the hero dies or to the win state if
-        finished the game.
+        Eliminates defeated enemies or bosses and the projectiles out 
+        of the screen, and transitions to the game over state if the 
+        hero dies or to the win state if finished the game.
 
         Parameters
         ----------
@@ -312,15 +464,21 @@ class GameManager:
         -------
         None
         """
+        view = pygame.Rect(self.camera.position_x, 0, self.WIDTH, self.HEIGHT)
+        for shooter in [self.hero, *self.enemies, *self.bosses]:
+            self.projectile_system.cull(shooter.projectiles, view)
+
         for monster in self.enemies:
             if monster.is_dead:
                 self.hero.points += 10
+                self.projectile_system.clear(monster.projectiles)
                 self.enemies.remove(monster)
                 del monster
 
         for boss in self.bosses:
             if boss.is_dead:
                 self.hero.points += 30
+                self.projectile_system.clear(boss.projectiles)
                 self.bosses.remove(boss)
                 self.bosses_life.pop(0)
                 del boss
@@ -345,44 +503,57 @@ class GameManager:
         -------
         None
         """
-        screen.fill([0, 0, 0])
-
-        # Parallax background
+        # Parallax background, the back layer is opaque and covers the
+        # whole screen
         if self.hero.speed_x > 0:
             speed = min(self.hero.speed_x, self.hero.speed_x_max)
         else:
             speed = max(self.hero.speed_x, self.hero.speed_x_min)
-        if self.camera.fix_x >= 690:
+        if self.camera.position_x <= 10:
             speed = 0
 
         self.pos_x -= speed // 3
         self.pos_x_p -= speed // 5
-        x = 0
-        for i in self.bg_images:
-            for j in range(8):
-                screen.blit(
-                    i, (self.pos_x + x * self.pos_x_p + j * self.WIDTH, 0)
-                )
-            x += 1
+        offsets = [self.pos_x + x * self.pos_x_p for x in range(3)]
+
+        # The parallax only shows beside the boss fight background
+        boss_rect = self.bg_boss.get_rect()
+        boss_rect.x = self.camera.boss_x - self.camera.position_x
+        area = screen.get_rect()
+        if boss_rect.colliderect(area):
+            if boss_rect.left > 0:
+                area.width = boss_rect.left
+            else:
+                area.width -= boss_rect.right
+                area.left = boss_rect.right
+        self.parallax.draw(screen, offsets, area)
 
         # Boss fight background
-        screen.blit(
-            self.bg_boss, (((132 * 50) - 700) + self.camera.fix_x, 0)
-        )
+        screen.blit(self.bg_boss, boss_rect)
 
-        for ground in self.grounds:
+        self.tile_layer.draw(screen, self.camera)
+        for ground in self.props:
             ground.draw(screen, self.camera)
 
+        self.culling.culled = 0
         for monster in self.enemies:
-            monster.draw(screen, self.camera)
+            if self.culling.visible(monster):
+                monster.draw(screen, self.camera)
+            else:
+                monster.scroll(screen, self.camera)
+                self.culling.culled += 1
 
         for boss in self.bosses:
-            boss.draw(screen, self.camera)
-            self.bosses_life[0].draw(screen)
+            if self.culling.visible(boss):
+                boss.draw(screen, self.camera)
+            else:
+                boss.scroll(screen, self.camera)
+                self.culling.culled += 1
 
         self.hero.draw(screen, self.camera)
-        self.life_bar.draw(screen)
-        self.hero_timer.draw(screen)
+        self.hud.draw(
+            screen, [self.life_bar, self.hero_timer] + self.bosses_life[:1]
+        )
         self.score_text.draw(screen)
 
     def trade(self, event: pygame.event.Event) -> None:
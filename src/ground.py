@@ -1,4 +1,21 @@
 import pygame
+import os, sys
+from typing import Iterator, Optional
+from array import array
+from itertools import chain
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+current_dir = os.path.dirname(os.path.abspath(__file__))  
+src_path = os.path.join(current_dir, '..')  
+sys.path.append(src_path)
+
+from src.assets import surface_cache, load_frame, paste
+from src.atlas import frame_key
+from src.weapon import projectile_system
 
 class Ground:
     """
@@ -12,7 +29,8 @@ class Ground:
     sub_TAG : str
         Specific identifier of the class.
     image : pygame.Surface
-        Image associated with the object.
+        Image associated with the object, shared through the surface 
+        cache with every tile that uses the same file and size.
     rect : pygame.Rect
         Rectangular boundary defining the object's position and size.
         
@@ -55,8 +73,7 @@ class Ground:
         """
         self.TAG = "Ground"
         self.sub_TAG = "Ground"
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (width, height))
+        self.image = surface_cache.get(image_path, (width, height))
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -77,8 +94,7 @@ class Ground:
         None
         """
         if camera.TAG == "Camera":
-            self.rect.x -= camera.position_x
-            screen.blit(self.image, self.rect)
+            screen.blit(self.image, camera.apply(self.rect))
 
     def update(self) -> None:
         """
@@ -205,7 +221,8 @@ class Block(Ground):
 
     def on_collision(self, other) -> None:
         """
-        Handles collisions with other objects.
+        Handles collisions with other objects, or with the tiles of the 
+        tile map.
 
         Parameters
         ----------
@@ -216,6 +233,10 @@ class Block(Ground):
         -------
         None
         """
+        if other.TAG == "TileMap":
+            for tile in other.touching(self.rect):
+                self.on_collision(tile)
+            return
         super().on_collision(other)
         if other.TAG == "Ground" and self.rect.colliderect(other.rect):
             if (
@@ -353,7 +374,6 @@ class Invisible(Ground):
     def draw(self, screen: pygame.Surface, camera) -> None:
         """
         Placeholder for object draws.
-        Updates the coordinate of ground.
 
         Parameters
         ----------
@@ -367,8 +387,7 @@ class Invisible(Ground):
         -------
         None
         """
-        if camera.TAG == "Camera":
-            self.rect.x -= camera.position_x
+        pass
 
 class Obelisk:
     
@@ -382,8 +401,6 @@ class Obelisk:
         General identifier of the class.
     sub_TAG : str
         Specific identifier of the class.
-    sheet_im: pygame.Surface
-        Image of the sheet of sprites passed.
     images : list
         List with the imagens used to animation.
     image : pygame.Surface
@@ -432,11 +449,16 @@ class Obelisk:
         """
         self.TAG = "Obelisk"
         self.sub_TAG = "Obelisk"
-        self.sheet_im = pygame.image.load(image_path).convert_alpha()
         self.images = []
         for i in range(14):
-            image = self.sheet_im.subsurface((i*190, 0), (190, 380))
-            image = pygame.transform.scale(image, (width, height))
+            area = (i*190, 0, 190, 380)
+            image = load_frame(
+                frame_key(image_path, area, (width, height)),
+                lambda: pygame.transform.scale(
+                    surface_cache.get(image_path).subsurface(area), 
+                    (width, height)
+                )
+            )
             self.images.append(image)
         self.num_image = 0
         self.rect = self.images[0].get_rect()
@@ -462,12 +484,12 @@ class Obelisk:
         None
         """
         if camera.TAG == "Camera":
-            self.rect.x -= camera.position_x
+            rect = camera.apply(self.rect)
             if self.touched and self.num_image < 14:
-                screen.blit(self.images[int(self.num_image)], self.rect)
+                screen.blit(self.images[int(self.num_image)], rect)
                 self.num_image += 0.25
             else: 
-                screen.blit(self.images[0], self.rect)
+                screen.blit(self.images[0], rect)
                 self.num_image = 0
                 self.touched = False
             
@@ -500,3 +522,554 @@ class Obelisk:
         None
         """
         pass
+
+class TileLayer:
+    """
+    Static tiles of the map pre-rendered into chunks, so the terrain
+    is drawn with one blit per visible chunk instead of one per tile.
+
+    Attributes
+    ----------
+    TAG : str
+        General identifier of the class.
+    tiles : list
+        The static tiles, whose kinds are also kept in the tile map 
+        for the collisions.
+    chunk_width : int
+        Width of each chunk, usually the screen width.
+    chunks : list
+        (surface, top) of each chunk, or None for empty chunks.
+    x : int
+        Horizontal position of the first chunk in the world.
+    blits : int
+        Number of chunks drawn in the last frame.
+
+    Methods
+    -------
+    is_static(ground) -> bool
+        Tells whether a ground object belongs in the layer.
+    draw(screen, camera) -> None
+        Draws the chunks that are on the screen.
+    """
+
+    static_tags = ("Ground", "Spike", "Invisible")
+
+    def __init__(self, tiles: list, chunk_width: int) -> None:
+        """
+        Renders the tiles into chunks of `chunk_width` pixels.
+
+        Parameters
+        ----------
+        tiles : list
+            The static tiles, at their initial positions.
+        chunk_width : int
+            Width of each chunk.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "TileLayer"
+        self.tiles = tiles
+        self.chunk_width = chunk_width
+        self.blits = 0
+
+        # Invisible tiles only collide, they have nothing to draw
+        visible = [tile for tile in tiles if tile.sub_TAG != "Invisible"]
+        self.x = min((tile.rect.x for tile in visible), default=0)
+        right = max((tile.rect.right for tile in visible), default=0)
+        self.chunks = []
+        for left in range(self.x, right, chunk_width):
+            inside = [
+                tile for tile in visible
+                if tile.rect.right > left and tile.rect.x < left + chunk_width
+            ]
+            if not inside:
+                self.chunks.append(None)
+                continue
+            top = min(tile.rect.top for tile in inside)
+            bottom = max(tile.rect.bottom for tile in inside)
+            size = (chunk_width, bottom - top)
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            for tile in inside:
+                paste(
+                    surface, tile.image, 
+                    (tile.rect.x - left, tile.rect.y - top)
+                )
+            # Run-length encoding skips the transparent runs when drawn
+            surface = surface_cache.converted(surface)
+            surface.set_alpha(255, pygame.RLEACCEL)
+            self.chunks.append((surface, top))
+
+    @classmethod
+    def is_static(cls, ground: object) -> bool:
+        """
+        Tells whether a ground object never moves nor animates, so it
+        can be pre-rendered.
+
+        Parameters
+        ----------
+        ground : object
+            An object of the grounds list.
+
+        Returns
+        -------
+        bool
+            True for plain grounds, spikes and invisible grounds.
+        """
+        return ground.sub_TAG in cls.static_tags
+
+    def draw(self, screen: pygame.Surface, camera) -> None:
+        """
+        Draws the chunks that intersect the screen.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the chunks will be drawn.
+        camera : Camera
+            The camera used to adjust the position of the layer.
+
+        Returns
+        -------
+        None
+        """
+        if camera.TAG == "Camera":
+            x = self.x - camera.position_x
+            self.blits = 0
+            first = max(0, -x // self.chunk_width)
+            last = (screen.get_width() - x - 1) // self.chunk_width
+            for i in range(first, min(last + 1, len(self.chunks))):
+                if self.chunks[i] is not None:
+                    surface, top = self.chunks[i]
+                    screen.blit(surface, (x + i * self.chunk_width, top))
+                    self.blits += 1
+
+class Tile:
+    """
+    A solid rectangle of the tile map, with the attributes the 
+    entities look at when they collide with a ground.
+
+    Attributes
+    ----------
+    TAG : str
+        General identifier, the same as every ground.
+    sub_TAG : str
+        Kind of the tile, such as "Ground" or "Spike".
+    rect : pygame.Rect
+        Area it covers in the world.
+    """
+
+    def __init__(self, sub_TAG: str, rect: pygame.Rect) -> None:
+        """
+        Initializes the tile.
+
+        Parameters
+        ----------
+        sub_TAG : str
+            Kind of the tile.
+        rect : pygame.Rect
+            Area it covers in the world.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "Ground"
+        self.sub_TAG = sub_TAG
+        self.rect = rect
+
+class TileMap:
+    """
+    Kinds of the static tiles of the map in a byte array, one byte per
+    cell of the grid, so the collisions with the terrain are answered by
+    looking at cells instead of ground objects.
+
+    Attributes
+    ----------
+    TAG : str
+        General identifier of the class.
+    size : int
+        Side of the cells, in pixels.
+    columns : int
+        Number of cells in each row.
+    rows : int
+        Number of rows.
+    cells : bytearray
+        Kind of each cell, row by row, as an index of `kinds`.
+    colliders : list[Tile]
+        Rectangles covering the cells of the same kind, merged when the
+        map is built, in the order of their first cell.
+    owners : array
+        Index in `colliders` of the rectangle covering each cell, or -1.
+    blocks : dict[tuple, tuple]
+        Colliders under each block of cells looked at, by its first and
+        last column and row.
+    batch : int
+        Number of rects from which `hit` reads the cells with NumPy, 
+        which costs more than it saves for fewer.
+
+    Methods
+    -------
+    merge() -> None
+        Covers the cells with as few rectangles as it can find.
+    counts() -> tuple[int, int]
+        Returns the number of tiles and of colliders.
+    index(x, y) -> int
+        Returns the position in `cells` of the cell at a point.
+    kind_at(x, y) -> str
+        Returns the kind of the tile at a point.
+    solid_at(x, y) -> bool
+        Tells whether there is a tile at a point.
+    spike_at(x, y) -> bool
+        Tells whether there is a spike at a point.
+    ground_below(x, y) -> Optional[int]
+        Returns the top of the first tile under a point.
+    under(rect) -> tuple[int, ...]
+        Returns the colliders under a rect.
+    touching(rect) -> Iterator[Tile]
+        Yields the colliders a rect touches, in the order of the map.
+    hit(rects) -> list[int]
+        Returns which of many rects touch a tile.
+    discard(projectiles) -> None
+        Gives the projectiles that hit a tile back to the pool.
+    """
+
+    kinds = ("", "Ground", "Spike", "Invisible")
+    batch = 24
+
+    def __init__(self, tiles: list, size: int = 50) -> None:
+        """
+        Fills the cells under the tiles with their kinds.
+
+        Parameters
+        ----------
+        tiles : list
+            The static tiles, one cell each.
+        size : int
+            Side of the cells, the tile size of the map by default.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "TileMap"
+        self.size = size
+        self.columns = max((t.rect.right for t in tiles), default=0) // size
+        self.rows = max((t.rect.bottom for t in tiles), default=0) // size
+        self.cells = bytearray(self.columns * self.rows)
+        for tile in tiles:
+            index = self.index(tile.rect.x, tile.rect.y)
+            self.cells[index] = self.kinds.index(tile.sub_TAG)
+        self.merge()
+
+    def merge(self) -> None:
+        """
+        Covers the cells with rectangles of a single kind. From the 
+        first free cell, in the order of the map, a rectangle grows 
+        along the row and then down while the cells match, so long runs 
+        and solid blocks become one collider without seams between the 
+        tiles.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        columns, size = self.columns, self.size
+        self.colliders = []
+        self.owners = array("i", [-1]) * len(self.cells)
+        self.blocks = {}
+        for first, kind in enumerate(self.cells):
+            if not kind or self.owners[first] >= 0:
+                continue
+            row, column = divmod(first, columns)
+            width = 1
+            while (
+                column + width < columns and 
+                self.cells[first + width] == kind and 
+                self.owners[first + width] < 0
+            ):
+                width += 1
+            height = 1
+            while row + height < self.rows and all(
+                self.cells[index] == kind and self.owners[index] < 0
+                for index in range(
+                    first + height * columns, 
+                    first + height * columns + width
+                )
+            ):
+                height += 1
+
+            number = len(self.colliders)
+            for line in range(height):
+                start = first + line * columns
+                self.owners[start:start + width] = array("i", [number]) * width
+            self.colliders.append(Tile(
+                self.kinds[kind], pygame.Rect(
+                    column * size, row * size, width * size, height * size
+                )
+            ))
+
+    def counts(self) -> tuple[int, int]:
+        """
+        Returns how many colliders the tiles had before and after they
+        were merged.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple[int, int]
+            The cells with a tile and the merged colliders.
+        """
+        return len(self.cells) - self.cells.count(0), len(self.colliders)
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Returns the position in `cells` of the cell at a point, or -1
+        out of the map.
+
+        Parameters
+        ----------
+        x : int
+            Horizontal position in the world.
+        y : int
+            Vertical position in the world.
+
+        Returns
+        -------
+        int
+            Index of the cell.
+        """
+        column, row = x // self.size, y // self.size
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return row * self.columns + column
+        return -1
+
+    def kind_at(self, x: int, y: int) -> str:
+        """
+        Returns the kind of the tile at a point.
+
+        Parameters
+        ----------
+        x : int
+            Horizontal position in the world.
+        y : int
+            Vertical position in the world.
+
+        Returns
+        -------
+        str
+            The sub_TAG of the tile, or "" for an empty cell.
+        """
+        index = self.index(x, y)
+        return self.kinds[self.cells[index]] if index >= 0 else ""
+
+    def solid_at(self, x: int, y: int) -> bool:
+        """
+        Tells whether there is a tile at a point.
+
+        Parameters
+        ----------
+        x : int
+            Horizontal position in the world.
+        y : int
+            Vertical position in the world.
+
+        Returns
+        -------
+        bool
+            True if the cell has any tile.
+        """
+        index = self.index(x, y)
+        return index >= 0 and self.cells[index] != 0
+
+    def spike_at(self, x: int, y: int) -> bool:
+        """
+        Tells whether there is a spike at a point.
+
+        Parameters
+        ----------
+        x : int
+            Horizontal position in the world.
+        y : int
+            Vertical position in the world.
+
+        Returns
+        -------
+        bool
+            True if the cell has a spike.
+        """
+        return self.kind_at(x, y) == "Spike"
+
+    def ground_below(self, x: int, y: int) -> Optional[int]:
+        """
+        Returns the top of the first tile at or under a point.
+
+        Parameters
+        ----------
+        x : int
+            Horizontal position in the world.
+        y : int
+            Vertical position in the world.
+
+        Returns
+        -------
+        Optional[int]
+            The top of the tile, or None if the column is empty.
+        """
+        column = x // self.size
+        if not 0 <= column < self.columns:
+            return None
+        for row in range(max(0, y // self.size), self.rows):
+            if self.cells[row * self.columns + column]:
+                return row * self.size
+        return None
+
+    def under(self, rect: pygame.Rect) -> tuple[int, ...]:
+        """
+        Returns the colliders under a rect. The map does not change, so 
+        the colliders under each block of cells are read from `owners` 
+        once and kept in `blocks`.
+
+        Parameters
+        ----------
+        rect : pygame.Rect
+            Any rect of the world.
+
+        Returns
+        -------
+        tuple[int, ...]
+            Indexes in `colliders`, in the order of the map.
+        """
+        left, top, width, height = rect
+        size = self.size
+        key = (
+            left // size, (left + width - 1) // size, 
+            top // size, (top + height - 1) // size
+        )
+        found = self.blocks.get(key)
+        if found is not None:
+            return found
+
+        columns = self.columns
+        first, last = max(0, key[0]), min(columns - 1, key[1])
+        top, bottom = max(0, key[2]), min(self.rows - 1, key[3])
+        numbers = set()
+        if first > last:
+            top = bottom + 1
+        for row in range(top * columns, (bottom + 1) * columns, columns):
+            numbers.update(self.owners[row + first:row + last + 1])
+        numbers.discard(-1)
+        found = self.blocks[key] = tuple(sorted(numbers))
+        return found
+
+    def touching(self, rect: pygame.Rect) -> Iterator[Tile]:
+        """
+        Yields the colliders a rect touches, in the order of the map. 
+        When the rect is pushed while they are resolved, the colliders 
+        left are looked for again around its new place.
+
+        Parameters
+        ----------
+        rect : pygame.Rect
+            The rect of an entity, which the caller may move.
+
+        Returns
+        -------
+        Iterator[Tile]
+            The colliders under the rect.
+        """
+        found = self.under(rect)
+        while found:
+            box = rect.copy()
+            for number in found:
+                yield self.colliders[number]
+                if rect != box:
+                    found = [n for n in self.under(rect) if n > number]
+                    break
+            else:
+                return
+
+    def hit(self, rects: list[pygame.Rect]) -> list[int]:
+        """
+        Returns which rects touch a tile, like `under` for each rect 
+        but at once. With NumPy and at least `batch` rects, the cells 
+        under all the rects are read from `cells` together, a column 
+        and a row of each rect at a time; without it, each rect is 
+        tested against the merged colliders.
+
+        Parameters
+        ----------
+        rects : list[pygame.Rect]
+            Any rects of the world, like the ones of projectiles.
+
+        Returns
+        -------
+        list[int]
+            Indexes of the rects touching a tile, from the first to the
+            last.
+        """
+        if not rects or not self.cells:
+            return []
+        if len(rects) < self.batch:
+            return [
+                index for index, rect in enumerate(rects) if self.under(rect)
+            ]
+        if numpy is None:
+            colliders = [collider.rect for collider in self.colliders]
+            return [
+                index for index, rect in enumerate(rects) 
+                if rect.collidelist(colliders) >= 0
+            ]
+
+        boxes = numpy.fromiter(
+            chain.from_iterable(rects), numpy.int64, 4 * len(rects)
+        ).reshape(-1, 4)
+        size = self.size
+        first = numpy.maximum(boxes[:, 0] // size, 0)
+        last = numpy.minimum(
+            (boxes[:, 0] + boxes[:, 2] - 1) // size, self.columns - 1
+        )
+        top = numpy.maximum(boxes[:, 1] // size, 0)
+        bottom = numpy.minimum(
+            (boxes[:, 1] + boxes[:, 3] - 1) // size, self.rows - 1
+        )
+        inside = (first <= last) & (top <= bottom)
+        if not inside.any():
+            return []
+
+        first, last = first[inside], last[inside]
+        top, bottom = top[inside], bottom[inside]
+        grid = numpy.frombuffer(self.cells, numpy.uint8)
+        grid = grid.reshape(self.rows, self.columns)
+        touch = numpy.zeros(len(first), bool)
+        for down in range(int((bottom - top).max()) + 1):
+            row = numpy.minimum(top + down, bottom)
+            for across in range(int((last - first).max()) + 1):
+                touch |= grid[row, numpy.minimum(first + across, last)] > 0
+        return numpy.flatnonzero(inside)[touch].tolist()
+
+    def discard(self, projectiles: list) -> None:
+        """
+        Gives the projectiles that hit a tile back to the pool.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of an entity, changed in place.
+
+        Returns
+        -------
+        None
+        """
+        if projectiles:
+            projectile_system.release_all(
+                projectiles, self.hit(projectile_system.rects(projectiles))
+            )
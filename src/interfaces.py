@@ -1,12 +1,13 @@
-import pygame, random, os
-from typing import List
-from game import GameManager
-from score import Score
+import pygame, os
+from typing import List, Optional
+from src.score import Score
+from src.assets import surface_cache
 
 def f_reset_game(main: object):
     """
-    Auxiliar function that resets the game state by recreating
-    the GameManager.
+    Auxiliar function that resets the game state by restoring the 
+    GameManager to the snapshot taken when it was built. A recording
+    of the game goes on with the reset marked in it.
 
     Parameters
     ----------
@@ -17,8 +18,8 @@ def f_reset_game(main: object):
     -------
     None
     """
-    del main.states["game"]
-    main.states["game"] = GameManager(main)
+    main.states["game"].reset()
+    main.record_reset()
     main.change_state("game", True)
 
 class Button:
@@ -35,6 +36,8 @@ class Button:
         Button image in the hover state.
     rect : pygame.Rect
         Rectangular area of the button for collision detection.
+    is_hover : bool
+        Whether the button was last drawn in the hover state.
 
     Methods
     -------
@@ -42,6 +45,9 @@ class Button:
         Draws the button on the screen, changing its appearance based 
         on mouse hover.
 
+    refresh(screen, background) -> pygame.Rect or None
+        Draws the button again only if the mouse entered or left it.
+
     change_state(event, main, state, music_bool) -> None
         Changes the game state when the button is clicked.
 
@@ -80,13 +86,14 @@ class Button:
         None
         """
         self.images_path = images_path
-        image_init = pygame.image.load(self.images_path[0]).convert_alpha()
+        image_init = surface_cache.load(self.images_path[0])
         self.image_init = pygame.transform.scale(image_init, (width, height))
-        image_hover = pygame.image.load(self.images_path[1]).convert_alpha()
+        image_hover = surface_cache.load(self.images_path[1])
         self.image_hover = pygame.transform.scale(image_hover, (width, height))
         self.rect = self.image_init.get_rect()
         self.rect.x = x
         self.rect.y = y
+        self.is_hover = False
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -103,11 +110,38 @@ class Button:
         None
         """
         mouse_position = pygame.mouse.get_pos()
-        if self.rect.collidepoint(mouse_position[0], mouse_position[1]):
+        self.is_hover = self.rect.collidepoint(mouse_position)
+        if self.is_hover:
             screen.blit(self.image_hover, self.rect)
         else:
             screen.blit(self.image_init, self.rect)
 
+    def refresh(
+        self, screen: pygame.Surface, background: pygame.Surface
+    ) -> Optional[pygame.Rect]:
+        """
+        Draws the button again, over its piece of the background, only 
+        if the mouse entered or left it since the last draw.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The screen where the button is drawn.
+        background : pygame.Surface
+            The image behind the button, as big as the screen.
+
+        Returns
+        -------
+        pygame.Rect or None
+            The area that changed, or None if nothing changed.
+        """
+        mouse_position = pygame.mouse.get_pos()
+        if self.rect.collidepoint(mouse_position) == self.is_hover:
+            return None
+        screen.blit(background, self.rect, self.rect)
+        self.draw(screen)
+        return self.rect
+
     def change_state(
         self, event: pygame.event.Event, 
         main: object, state: str, music_bool: bool
@@ -175,6 +209,34 @@ class Button:
             if event.button == 1 and has_collision:
                 main.is_running = False
 
+def f_refresh_buttons(
+    screen: pygame.Surface, background: pygame.Surface, buttons: List[Button]
+) -> List[pygame.Rect]:
+    """
+    Auxiliar function that draws again the buttons whose hover state 
+    changed.
+
+    Parameters
+    ----------
+    screen : pygame.Surface
+        The screen where the buttons are drawn.
+    background : pygame.Surface
+        The image behind the buttons, as big as the screen.
+    buttons : list[Button]
+        The buttons of the screen.
+
+    Returns
+    -------
+    list[pygame.Rect]
+        The areas of the screen that changed.
+    """
+    rects = []
+    for button in buttons:
+        rect = button.refresh(screen, background)
+        if rect is not None:
+            rects.append(rect)
+    return rects
+
 class Menu:
     """
     Represents the menu screen with buttons for starting the game, 
@@ -190,15 +252,29 @@ class Menu:
         Button for quitting the game.
     image_menu : pygame.Surface
         Background image of the menu screen.
+    main : object
+        The main game instance, used to follow the loading.
+    load_rect : pygame.Rect
+        Area of the loading bar, under the start button.
+    is_drawn : bool
+        Whether the window still shows the menu, so only what changed 
+        has to be drawn.
+    is_loaded : bool
+        Whether the loading had ended when the menu was last drawn.
+    progress : float
+        Progress of the loading bar when it was last drawn.
 
     Methods
     -------
     music(main, volume) -> None
         Plays a random music track when the menu is displayed.
 
-    draw(screen) -> None
+    draw(screen) -> list[pygame.Rect]
         Draws the menu screen and the buttons.
 
+    draw_progress(screen) -> None
+        Draws the loading bar.
+
     on_event(event, main) -> None
         Handles user input (clicking buttons and pressing keys).
     """
@@ -229,11 +305,16 @@ class Menu:
         self.b_start = Button(555, 300, 290, 120, start_images)
         self.b_tutorial = Button(555, 425, 290, 120, tutorial_images)
         self.b_exit = Button(555, 550, 290, 120, quit_images)
+        self.main = main
+        self.load_rect = pygame.Rect(600, 405, 200, 12)
+        self.is_drawn = False
+        self.is_loaded = False
+        self.progress = 0
         
         # Image
         dimention_screen = main.screen.get_size()
         image_path = os.path.join(main.assets_path, "Interfaces", "Menu.png")
-        image_menu = pygame.image.load(image_path).convert_alpha()
+        image_menu = surface_cache.load(image_path)
         self.image_menu = pygame.transform.scale(image_menu, dimention_screen)
 
     def music(self, main: object, volume: float) -> None:
@@ -252,20 +333,16 @@ class Menu:
         None
         """
         if main.is_changed:
-            music_dir_path = os.path.join(main.assets_path, "Music")
-            
-            music_num = random.randint(1, 4)
-            music_path = os.path.join(
-                music_dir_path, "Menu", f"M{music_num}.mp3"
-            )
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(-1)  
+            main.music_manager.play("Menu", volume)
         main.is_changed = False
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """
-        Draws the menu screen and its interactive buttons.
+        Draws the menu screen and its interactive buttons. While the 
+        game is loading, the start button does not react to the mouse 
+        and a bar shows the progress. Once the menu is on the window, 
+        only the buttons the mouse entered or left and the loading bar 
+        are drawn again.
 
         Parameters
         ----------
@@ -274,12 +351,51 @@ class Menu:
 
         Returns
         -------
-        None
+        list[pygame.Rect]
+            The areas of the screen that changed.
         """
+        loader = self.main.loader
+        buttons = [self.b_tutorial, self.b_exit]
+        if self.is_drawn and self.is_loaded == loader.done:
+            if loader.done:
+                buttons.append(self.b_start)
+            rects = f_refresh_buttons(screen, self.image_menu, buttons)
+            if not loader.done and loader.progress != self.progress:
+                self.draw_progress(screen)
+                rects.append(self.load_rect)
+            return rects
+
         screen.blit(self.image_menu, (0, 0))
-        self.b_start.draw(screen)
+        if loader.done:
+            self.b_start.draw(screen)
+        else:
+            screen.blit(self.b_start.image_init, self.b_start.rect)
+            self.draw_progress(screen)
         self.b_tutorial.draw(screen)
         self.b_exit.draw(screen)
+        self.is_drawn = True
+        self.is_loaded = loader.done
+        return [screen.get_rect()]
+
+    def draw_progress(self, screen: pygame.Surface) -> None:
+        """
+        Draws the loading bar over the start button.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface on which the menu is drawn.
+
+        Returns
+        -------
+        None
+        """
+        self.progress = self.main.loader.progress
+        progress = self.load_rect.copy()
+        progress.width = self.load_rect.width * self.progress
+        pygame.draw.rect(screen, (60, 60, 60), self.load_rect)
+        pygame.draw.rect(screen, (255, 255, 255), progress)
+        pygame.draw.rect(screen, (0, 0, 0), self.load_rect, 2)
 
     def on_event(self, event:pygame.event.Event, main: object) -> None:
         """
@@ -297,11 +413,15 @@ class Menu:
         -------
         None
         """
+        self.b_exit.exit(event, main)
+
+        # The other states only exist after the loading
+        if not main.loader.done:
+            return
+
         self.b_start.change_state(event, main, "game", True) 
         
         self.b_tutorial.change_state(event, main, "tutorial", False)
-        
-        self.b_exit.exit(event, main)
 
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
@@ -326,13 +446,16 @@ class Pause:
         Used to show the score in pause screen.
     image_pause : pygame.Surface
         Background image of the pause screen.
+    is_drawn : bool
+        Whether the window still shows the pause screen, so only what 
+        changed has to be drawn.
 
     Methods
     -------
     music(main, volume) -> None
         Placeholder method for playing music in the pause menu.
 
-    draw(screen) -> None
+    draw(screen) -> list[pygame.Rect]
         Draws the pause screen and the buttons.
 
     on_event(event, main) -> None
@@ -375,10 +498,11 @@ class Pause:
         
         dimention_screen = main.screen.get_size()
         image_path = os.path.join(main.assets_path, "Interfaces", "Pause.png")
-        image_pause = pygame.image.load(image_path).convert_alpha()
+        image_pause = surface_cache.load(image_path)
         self.image_pause = pygame.transform.scale(
             image_pause, dimention_screen
         )
+        self.is_drawn = False
 
     def music(self, main: object, volume: float) -> None:
         """
@@ -397,7 +521,7 @@ class Pause:
         """
         pass
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """
         Draws the pause screen and its interactive buttons.
 
@@ -408,17 +532,26 @@ class Pause:
 
         Returns
         -------
-        None
+        list[pygame.Rect]
+            The areas of the screen that changed.
         """
-        screen.blit(self.image_pause, (0, 0))
-        
         points = self.main.states["game"].hero.points
         self.score_text.update(points)
+        # The score is composed again when it changes, which happens 
+        # rarely enough to draw the whole screen
+        if self.is_drawn and self.score_text.surface is not None:
+            buttons = [self.b_continue, self.b_restart, self.b_quit]
+            return f_refresh_buttons(screen, self.image_pause, buttons)
+
+        screen.blit(self.image_pause, (0, 0))
+        
         self.score_text.draw(screen)
         
         self.b_continue.draw(screen)
         self.b_restart.draw(screen)
         self.b_quit.draw(screen)
+        self.is_drawn = True
+        return [screen.get_rect()]
 
     def on_event(self, event: pygame.event.Event, main: object) -> None:
         """
@@ -468,13 +601,16 @@ class Game_Over:
         Used to show the score in game over screen.
     image_over : pygame.Surface
         Background image of the game over screen.
+    is_drawn : bool
+        Whether the window still shows the game over screen, so only what 
+        changed has to be drawn.
 
     Methods
     -------
     music(main, volume) -> None
         Plays a random game over music track.
 
-    draw(screen) -> None
+    draw(screen) -> list[pygame.Rect]
         Draws the game over screen and its buttons.
 
     on_event(event, main) -> None
@@ -516,8 +652,9 @@ class Game_Over:
         
         dimention_screen = main.screen.get_size()
         image_path = os.path.join(main.assets_path, "Interfaces", "Over.png")
-        image_over = pygame.image.load(image_path).convert_alpha()
+        image_over = surface_cache.load(image_path)
         self.image_over = pygame.transform.scale(image_over, dimention_screen)
+        self.is_drawn = False
 
     def music(self, main: object, volume: float) -> None:
         """
@@ -535,17 +672,10 @@ class Game_Over:
         None
         """
         if main.is_changed:
-            music_dir_path = os.path.join(main.assets_path, "Music")
-            music_num = random.randint(1, 4)
-            music_path = os.path.join(
-                music_dir_path, "Over", f"D{music_num}.mp3"
-            )
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(-1)  
+            main.music_manager.play("Over", volume)
         main.is_changed = False
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """
         Draws the game over screen and its buttons.
 
@@ -556,17 +686,26 @@ class Game_Over:
 
         Returns
         -------
-        None
+        list[pygame.Rect]
+            The areas of the screen that changed.
         """
-        screen.blit(self.image_over, (0, 0))
-        
         points = self.main.states["game"].hero.points
         self.score_text.update(points)
+        # The score is composed again when it changes, which happens 
+        # rarely enough to draw the whole screen
+        if self.is_drawn and self.score_text.surface is not None:
+            buttons = [self.b_restart, self.b_tutorial, self.b_quit]
+            return f_refresh_buttons(screen, self.image_over, buttons)
+
+        screen.blit(self.image_over, (0, 0))
+        
         self.score_text.draw(screen)
         
         self.b_restart.draw(screen)
         self.b_tutorial.draw(screen)
         self.b_quit.draw(screen)
+        self.is_drawn = True
+        return [screen.get_rect()]
 
     def on_event(self, event: pygame.event.Event, main: object) -> None:
         """
@@ -616,13 +755,15 @@ class Tutorial:
         The index of the current tutorial image.
     images : list of pygame.Surface
         A list containing the images that make up the tutorial.
+    is_drawn : bool
+        Whether the window still shows the current image.
     
     Methods
     -------
     music(main, volume) -> None
         Placeholder method for playing music in the tutorial.
 
-    draw(screen) -> None
+    draw(screen) -> list[pygame.Rect]
         Draws the game over screen and its buttons.
 
     on_event(event, main) -> None
@@ -658,8 +799,9 @@ class Tutorial:
         ]
         self.images = []
         for i in range(4):
-            image = pygame.image.load(images_path[i]).convert_alpha()
+            image = surface_cache.load(images_path[i])
             self.images.append(pygame.transform.scale(image, dimention_screen))
+        self.is_drawn = False
 
     def music(self, main: object, volume: float) -> None:
         """
@@ -677,18 +819,10 @@ class Tutorial:
         None
         """
         if main.is_changed:
-            music_dir_path = os.path.join(main.assets_path, "Music")
-            
-            music_num = random.randint(1, 4)
-            music_path = os.path.join(
-                music_dir_path, "Menu", f"M{music_num}.mp3"
-            )
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(-1)  
+            main.music_manager.play("Menu", volume)
         main.is_changed = False
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """
         Draws the current tutorial image on the screen and updates
         the image display based on the timer.
@@ -700,17 +834,26 @@ class Tutorial:
 
         Returns
         -------
-        None
+        list[pygame.Rect]
+            The areas of the screen that changed.
         """
+        rects = []
         self.timer += 1
         if self.timer >= self.duration and self.idx_image < 4:
             self.timer = 0
             screen.blit(self.images[self.idx_image], (0,0))
             self.idx_image += 1
+            self.is_drawn = True
+            rects.append(screen.get_rect())
+        elif not self.is_drawn and self.idx_image > 0:
+            screen.blit(self.images[self.idx_image - 1], (0,0))
+            self.is_drawn = True
+            rects.append(screen.get_rect())
         if self.timer >= self.duration and self.idx_image >= 4:
             self.main.change_state("menu", False)
             self.timer = self.duration
             self.idx_image = 0
+        return rects
     
     def on_event(self, event: pygame.event.Event, main: object) -> None:
         """
@@ -756,12 +899,15 @@ class Win:
         A button to quit to the main menu.
     image_win : pygame.Surface
         The background image displayed on the win screen.
+    is_drawn : bool
+        Whether the window still shows the win screen, so only what 
+        changed has to be drawn.
         
     Methods
     -------
     music(main, volume) -> None
         Plays random background music for the win screen.
-    draw(screen) -> None
+    draw(screen) -> list[pygame.Rect]
         Draws the win screen background and buttons on the screen.
     on_event(event, main)
         Handles events for the win screen, including button interactions
@@ -804,8 +950,9 @@ class Win:
         
         dimention_screen = main.screen.get_size()
         image_path = os.path.join(main.assets_path, "Interfaces", "Win.png")
-        image_win = pygame.image.load(image_path).convert_alpha()
+        image_win = surface_cache.load(image_path)
         self.image_win = pygame.transform.scale(image_win, dimention_screen)
+        self.is_drawn = False
     
     def music(self, main: object, volume: float) -> None:
         """
@@ -824,17 +971,10 @@ class Win:
         None
         """
         if main.is_changed:
-            music_dir_path = os.path.join(main.assets_path, "Music")
-            music_num = random.randint(1, 5)
-            music_path = os.path.join(
-                music_dir_path, "Win", f"V{music_num}.mp3"
-            )
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(-1)  
+            main.music_manager.play("Win", volume)
         main.is_changed = False
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
         """
         Draws the win screen background and buttons on the screen.
 
@@ -845,16 +985,25 @@ class Win:
 
         Returns
         -------
-        None
+        list[pygame.Rect]
+            The areas of the screen that changed.
         """
-        screen.blit(self.image_win, (0, 0))
-        
         points = self.main.states["game"].hero.points
         self.score_text.update(points)
+        # The score is composed again when it changes, which happens 
+        # rarely enough to draw the whole screen
+        if self.is_drawn and self.score_text.surface is not None:
+            buttons = [self.b_again, self.b_quit]
+            return f_refresh_buttons(screen, self.image_win, buttons)
+
+        screen.blit(self.image_win, (0, 0))
+        
         self.score_text.draw(screen)
         
         self.b_again.draw(screen)
         self.b_quit.draw(screen)
+        self.is_drawn = True
+        return [screen.get_rect()]
     
     def on_event(self, event: pygame.event.Event, main: object) -> None:
         """
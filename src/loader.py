@@ -0,0 +1,203 @@
+import pygame
+import os, sys
+import threading
+from typing import Callable, Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.assets import surface_cache
+from src.atlas import manifest_sources
+from src.pack import pack_sources
+
+class AssetLoader:
+    """
+    Loads the game while the window is already showing something. The
+    image files are read and decoded on worker threads, and the objects
+    that use them are built on the main thread, one per `step`, which
+    only has to convert the decoded images.
+
+    Attributes
+    ----------
+    paths : list[str]
+        Image files decoded by the workers.
+    tasks : list[tuple]
+        Name and build function of each object still to be built.
+    total : int
+        Number of files plus number of tasks, used for the progress.
+    decoded : int
+        Number of files already decoded.
+    built : int
+        Number of tasks already built.
+    threads : list[threading.Thread]
+        The worker threads.
+
+    Methods
+    -------
+    add(name, build) -> None
+        Adds an object to be built after the files are decoded.
+    step() -> tuple or None
+        Builds the next object, if the files are ready.
+    finish() -> list
+        Builds everything left, waiting for the workers.
+    find_images(directory, folders) -> list
+        Lists the image files of some folders of the assets.
+    """
+
+    def __init__(self, paths: list[str], workers: int = 2) -> None:
+        """
+        Initializes the loader and starts the worker threads.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Image files to decode.
+        workers : int
+            Number of worker threads.
+
+        Returns
+        -------
+        None
+        """
+        self.paths = list(paths)
+        self.tasks = []
+        self.total = len(self.paths)
+        self.decoded = 0
+        self.built = 0
+        self.lock = threading.Lock()
+        self.queue = list(reversed(self.paths))
+        self.threads = [
+            threading.Thread(target=self.work, daemon=True)
+            for _ in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def work(self) -> None:
+        """
+        Worker loop, decodes files until the queue is empty.
+
+        Returns
+        -------
+        None
+        """
+        while True:
+            with self.lock:
+                if not self.queue:
+                    return
+                path = self.queue.pop()
+            surface_cache.decode([path])
+            with self.lock:
+                self.decoded += 1
+
+    def add(
+        self, name: Optional[str], build: Callable[[], object]
+    ) -> None:
+        """
+        Adds an object to be built on the main thread.
+
+        Parameters
+        ----------
+        name : str or None
+            Name returned with the object by `step`, None for tasks 
+            whose result is not kept.
+        build : Callable[[], object]
+            Function that builds the object.
+
+        Returns
+        -------
+        None
+        """
+        self.tasks.append((name, build))
+        self.total += 1
+
+    @property
+    def decoding(self) -> bool:
+        """
+        Whether the workers are still decoding files.
+        """
+        return self.decoded < len(self.paths)
+
+    @property
+    def progress(self) -> float:
+        """
+        Loaded fraction, from 0 to 1.
+        """
+        if self.total == 0:
+            return 1
+        return (self.decoded + self.built) / self.total
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether every file was decoded and every object built.
+        """
+        return not self.decoding and not self.tasks
+
+    def step(self) -> Optional[tuple]:
+        """
+        Builds the next object, once the workers have decoded all the
+        files. Called once per frame by the main loop.
+
+        Returns
+        -------
+        tuple or None
+            The name and the built object, or None if nothing was
+            built.
+        """
+        if self.decoding or not self.tasks:
+            return None
+        name, build = self.tasks.pop(0)
+        result = build()
+        self.built += 1
+        if not self.tasks:
+            # Files that no object used are not kept in memory
+            surface_cache.discard(self.paths)
+        return name, result
+
+    def finish(self) -> list[tuple]:
+        """
+        Waits for the workers and builds every object left.
+
+        Returns
+        -------
+        list[tuple]
+            The name and the built object of each task.
+        """
+        for thread in self.threads:
+            thread.join()
+        results = []
+        while self.tasks:
+            results.append(self.step())
+        return results
+
+    @staticmethod
+    def find_images(directory: str, folders: list[str]) -> list[str]:
+        """
+        Lists the PNG files of some folders of the assets, leaving out
+        the ones already in the asset pack or the texture atlas.
+
+        Parameters
+        ----------
+        directory : str
+            The assets folder.
+        folders : list[str]
+            Folders of `directory` that are listed.
+
+        Returns
+        -------
+        list[str]
+            Paths of the image files.
+        """
+        packed = manifest_sources() | pack_sources()
+        paths = []
+        for folder in folders:
+            for root, _, files in os.walk(os.path.join(directory, folder)):
+                for file in sorted(files):
+                    path = os.path.join(root, file)
+                    source = os.path.relpath(path, directory)
+                    source = source.replace(os.sep, "/")
+                    if file.endswith(".png") and source not in packed:
+                        paths.append(path)
+        return paths
@@ -1,6 +1,7 @@
 import os
 import sys
-import random
+import time
+import argparse
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
 import pygame
@@ -10,9 +11,14 @@ src_path = os.path.join(current_dir, '..')
 sys.path.append(src_path)
 
 from src.interfaces import Menu, Game_Over, Pause, Tutorial, Win
+from src.assets import surface_cache
 from src.game import GameManager
-
-pygame.init()
+from src.loader import AssetLoader
+from src.music import MusicManager
+from src.atlas import manifest_sources
+from src.pack import pack_is_current, build_pack
+from src.replay import Recorder, Replay
+from src.profiler import FrameProfiler
 
 class Main:
     """
@@ -31,35 +37,75 @@ class Main:
         Indicates whether the game is running.
     states : dict
         A dictionary holding all game states (menu, game, 
-        pause, game over, tutorial and win).
+        pause, game over, tutorial and win). Only the menu exists 
+        until the loader builds the others.
+    loader : AssetLoader
+        Loads the other states while the menu is shown.
     current_state : object
         The current active state of the game.
     is_changed : bool
         Indicates if the game state has changed.
     volume : float
         The volume level of background music.
+    music_manager : MusicManager
+        Plays the music of the states, with fades between tracks.
+    headless : bool
+        Whether the game runs without a screen, sound or drawing.
+    recorder : Recorder or None
+        Writes the input of each frame of the game, when recording.
+    recorded : list
+        Events the game got in a frame it did not step, for the log.
+    profiler : FrameProfiler
+        Times the phases of the frames and draws them over the screen, 
+        turned on and off with F3.
 
     Methods
     -------
     run()
         Executes the main game loop.
+    record_reset()
+        Writes a reset of the game to the log of the recorder.
+    stop_recording()
+        Closes the log of the recorder.
+    simulate(frames) -> tuple[int, float]
+        Steps the game without drawing, as fast as it can.
+    load_step()
+        Builds the next state, if its assets are ready.
+    finish_loading()
+        Builds every state left, without drawing.
     change_state(state, music_bool)
         Changes the current game state.
     """
 
-    def __init__(self):
+    def __init__(self, headless: bool = False, recorder: Recorder = None):
         """
         Initializes the main game setup, including screen 
         dimensions, states, and music.
 
         Parameters
         ----------
-        None
+        headless : bool
+            Whether to run on the dummy drivers of SDL, which need no 
+            screen nor sound card, and skip converting the images.
+        recorder : Recorder, optional
+            Writes the input of the game to a log, so it can be 
+            replayed.
 
         Returns
         -------
         None
         """
+        self.headless = headless
+        self.recorder = recorder
+        self.recorded = []
+        self.profiler = FrameProfiler()
+        if headless:
+            # Chosen before pygame starts, it would look for a screen
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            surface_cache.convert = False
+        pygame.init()
+
         self.WIDTH = 1400
         self.HEIGHT = 800
         screen_size = (self.WIDTH, self.HEIGHT)
@@ -71,25 +117,35 @@ class Main:
             os.path.dirname(path_game), "assets"
         )
         
-        self.states = {
-            "menu": Menu(self),
-            "game": GameManager(self),
-            "pause": Pause(self),
-            "over": Game_Over(self),
-            "tutorial": Tutorial(self),
-            "win": Win(self)
-        }
+        # The menu is shown right away, the other states are built by 
+        # the loader while it is on screen
+        self.states = {"menu": Menu(self)}
         self.current_state = self.states["menu"]
+        # The bosses are loaded later by the roster of the game
+        folders = ["Background", "Ground", "Heart", "Interfaces"]
+        pack_current = pack_is_current()
+        if not pack_current:
+            folders.append("Atlas")
+        if not pack_current and not manifest_sources():
+            folders += ["Knight", "Yokai", "Ninja", "Dummy", "Flying", "Mage"]
+        images = AssetLoader.find_images(self.assets_path, folders)
+        self.loader = AssetLoader(images)
+        if not pack_current:
+            # Rebuilt when the PNG files change, used by the next states
+            self.loader.add(None, lambda: build_pack(self))
+        self.loader.add("game", lambda: GameManager(self))
+        self.loader.add("pause", lambda: Pause(self))
+        self.loader.add("over", lambda: Game_Over(self))
+        self.loader.add("tutorial", lambda: Tutorial(self))
+        self.loader.add("win", lambda: Win(self))
         self.is_changed = False
         
         #Music init
         self.volume = 0.3
-        music_menu_path = os.path.join(self.assets_path, "Music", "Menu")
-        music_num = random.randint(1, 2)
-        music_path = os.path.join(music_menu_path, f"M{music_num}.mp3")
-        pygame.mixer.music.load(music_path)
-        pygame.mixer.music.set_volume(self.volume)
-        pygame.mixer.music.play(-1)
+        self.music_manager = MusicManager(
+            os.path.join(self.assets_path, "Music")
+        )
+        self.music_manager.play("Menu", self.volume)
 
     def run(self):
         """
@@ -105,31 +161,177 @@ class Main:
         None
         """
         clock = pygame.time.Clock()
+        profiler = self.profiler
 
         while self.is_running:
+            self.load_step()
+            profiler.start()
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     self.is_running = False
+                if event.type == pygame.WINDOWEXPOSED:
+                    self.current_state.is_drawn = False
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle()
+                    # The state is drawn again over the overlay
+                    self.current_state.is_drawn = False
+                    continue
                 if event.type == pygame.KEYDOWN:
                     if (
                         event.key == pygame.K_ESCAPE 
-                        and self.current_state == self.states["game"]
+                        and self.current_state == self.states.get("game")
                     ):
                         self.change_state("pause", False)
                         break
+                if self.current_state == self.states.get("game"):
+                    self.recorded.append(event)
                 self.current_state.on_event(event, self)
+            profiler.mark("events")
 
-            if self.current_state == self.states["game"]:
-                self.current_state.on_key_pressed()
+            if self.current_state == self.states.get("game"):
+                key_map = pygame.key.get_pressed()
+                if self.recorder is not None:
+                    self.recorder.frame(key_map, self.recorded)
+                self.recorded = []
+                self.current_state.on_key_pressed(key_map)
+                profiler.mark("on_key_pressed")
                 self.current_state.update()
+                profiler.mark("update")
                 self.current_state.collision_decetion()
+                profiler.mark("collision_decetion")
                 self.current_state.elimination(self.change_state)
+                profiler.mark("elimination")
             self.current_state.music(self, self.volume)
-            self.current_state.draw(self.screen)
-            pygame.display.flip()
+            self.music_manager.update()
+            profiler.mark("music")
+            # The interfaces return the areas that changed, nothing is
+            # sent to the window while they stay still
+            rects = self.current_state.draw(self.screen)
+            profiler.mark("draw")
+            if profiler.enabled:
+                overlay = profiler.draw(self.screen)
+                if rects is not None:
+                    rects = [*rects, overlay]
+                profiler.mark("overlay")
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+            profiler.mark("flip")
+            profiler.end_frame()
             clock.tick(30)
 
+            # The log ends with the game, a replay stops there as well
+            if (
+                self.recorder is not None and self.recorder.frames and 
+                self.current_state != self.states.get("game") and 
+                self.current_state != self.states.get("pause")
+            ):
+                self.stop_recording()
+
+        self.stop_recording()
+
+    def record_reset(self):
+        """
+        Writes a reset of the game to the log, with the events the 
+        game got before it, so a replay resets the game at the same 
+        frame. Called right after the game is reset.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if self.recorder is not None:
+            self.recorder.reset(self.recorded)
+        self.recorded = []
+
+    def stop_recording(self):
+        """
+        Closes the log of the recorder, if there is one.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def simulate(self, frames: int) -> tuple[int, float]:
+        """
+        Steps the game as fast as the CPU allows, without events, 
+        music, drawing or waiting for the clock. The steps stop early 
+        when the game is over or won.
+
+        Parameters
+        ----------
+        frames : int
+            Number of steps to simulate.
+
+        Returns
+        -------
+        tuple[int, float]
+            The steps simulated and how many were simulated per second.
+        """
+        self.finish_loading()
+        self.change_state("game", False)
+        game = self.states["game"]
+
+        steps = 0
+        start = time.perf_counter()
+        while steps < frames and self.current_state is game:
+            pygame.event.pump()
+            game.on_key_pressed()
+            game.update()
+            game.collision_decetion()
+            game.elimination(self.change_state)
+            steps += 1
+        elapsed = time.perf_counter() - start
+        return steps, steps / elapsed if elapsed else 0.0
+
+    def load_step(self):
+        """
+        Builds the next state whose assets are ready, at most one 
+        per frame.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        loaded = self.loader.step()
+        if loaded is not None and loaded[0] is not None:
+            name, state = loaded
+            self.states[name] = state
+
+    def finish_loading(self):
+        """
+        Waits for the loader and builds every state left.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        for name, state in self.loader.finish():
+            if name is not None:
+                self.states[name] = state
+
     def change_state(self, state, music_bool: bool):
         """
         Changes the current game state.
@@ -147,10 +349,61 @@ class Main:
         None
         """
         self.current_state = self.states[state]
+        # The window still shows the last state
+        self.current_state.is_drawn = False
         self.is_changed = music_bool
 
 
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Reads the options of the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        The options, those given to the program by default.
+
+    Returns
+    -------
+    argparse.Namespace
+        `headless`, `frames`, `record`, `replay` and `fast`.
+    """
+    parser = argparse.ArgumentParser(description="Shattered")
+    parser.add_argument(
+        "--headless", action="store_true", 
+        help="simulate the game without a screen and report its speed"
+    )
+    parser.add_argument(
+        "--frames", type=int, default=1000, 
+        help="steps to simulate in the headless mode"
+    )
+    parser.add_argument(
+        "--record", metavar="LOG", 
+        help="write the input of the game to a log"
+    )
+    parser.add_argument(
+        "--replay", metavar="LOG", 
+        help="play the game of a log again"
+    )
+    parser.add_argument(
+        "--fast", action="store_true", 
+        help="replay without waiting between frames"
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    game = Main()
-    game.run()
+    args = parse_args()
+    recorder = Recorder(args.record) if args.record else None
+    game = Main(args.headless, recorder)
+    if args.replay:
+        start = time.perf_counter()
+        steps = Replay(args.replay).run(game, args.fast)
+        elapsed = time.perf_counter() - start
+        print(f"{steps} frames replayed in {elapsed:.2f} s")
+    elif args.headless:
+        steps, rate = game.simulate(args.frames)
+        print(f"{steps} steps simulated, {rate:.1f} steps per second")
+    else:
+        game.run()
     pygame.quit()
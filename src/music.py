@@ -0,0 +1,247 @@
+import pygame
+import os, sys
+import io
+import random
+import threading
+import time
+from typing import Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+class MusicManager:
+    """
+    Plays the background music of the game. The next track of a
+    category is picked ahead of time and its file is read on a thread,
+    so a transition only fades the current track out, starts the new
+    one from memory and fades it in, one step per frame.
+
+    Attributes
+    ----------
+    tracks : dict[str, list[str]]
+        Music files of each category, the folders of `directory`.
+    fade_frames : int
+        Number of frames of each fade.
+    upcoming : dict[str, str]
+        Track already picked for the next time each category plays.
+    pending : str or None
+        Track waiting for the fade out to end.
+    level : float
+        Fade level, from 0 (silent) to 1 (full volume).
+    stalls : list[float]
+        Seconds the frame loop spent starting each track.
+
+    Methods
+    -------
+    prefetch(category) -> None
+        Picks the next track of a category and reads it on a thread.
+    play(category, volume) -> None
+        Starts the transition to a track of a category.
+    update() -> None
+        Advances the transition, called once per frame.
+    report() -> dict
+        Returns the stall times of the transitions.
+    """
+
+    def __init__(
+        self, directory: str, fade_frames: int = 15, seed: int = None
+    ) -> None:
+        """
+        Lists the music files of each category.
+
+        Parameters
+        ----------
+        directory : str
+            Folder with one folder of music files per category.
+        fade_frames : int
+            Number of frames of each fade.
+        seed : int
+            Seed of the random choice of tracks.
+
+        Returns
+        -------
+        None
+        """
+        self.tracks = {}
+        for folder in sorted(os.listdir(directory)):
+            path = os.path.join(directory, folder)
+            if os.path.isdir(path):
+                files = sorted(os.listdir(path))
+                self.tracks[folder] = [
+                    os.path.join(path, file) for file in files
+                    if file.endswith(".mp3")
+                ]
+        self.fade_frames = max(1, fade_frames)
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.data = {}
+        self.reading = set()
+        self.upcoming = {}
+        self.current = None
+        self.playing = None
+        self.pending = None
+        self.volume = 0
+        self.level = 0
+        self.stalls = []
+
+    def choose(self, category: str) -> Optional[str]:
+        """
+        Picks the next track of a category, trying not to repeat the
+        track that is playing.
+
+        Parameters
+        ----------
+        category : str
+            Name of the music folder.
+
+        Returns
+        -------
+        str or None
+            Path of the track, or None if the category has no tracks.
+        """
+        if category not in self.upcoming:
+            tracks = self.tracks.get(category, [])
+            if not tracks:
+                return None
+            others = [path for path in tracks if path != self.current]
+            self.upcoming[category] = self.random.choice(others or tracks)
+        return self.upcoming[category]
+
+    def read(self, path: str) -> None:
+        """
+        Reads a music file into memory, runs on a thread.
+
+        Parameters
+        ----------
+        path : str
+            Path of the track.
+
+        Returns
+        -------
+        None
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        with self.lock:
+            self.data[path] = data
+            self.reading.discard(path)
+
+    def fetch(self, path: str) -> None:
+        """
+        Starts reading a track on a thread, unless it was already read
+        or is being read.
+
+        Parameters
+        ----------
+        path : str
+            Path of the track.
+
+        Returns
+        -------
+        None
+        """
+        with self.lock:
+            if path in self.data or path in self.reading:
+                return
+            self.reading.add(path)
+        threading.Thread(target=self.read, args=(path,), daemon=True).start()
+
+    def prefetch(self, category: str) -> None:
+        """
+        Picks the next track of a category and starts reading it, so it
+        is ready when the category plays.
+
+        Parameters
+        ----------
+        category : str
+            Name of the music folder.
+
+        Returns
+        -------
+        None
+        """
+        path = self.choose(category)
+        if path is not None:
+            self.fetch(path)
+
+    def play(self, category: str, volume: float) -> None:
+        """
+        Starts the transition to the next track of a category. The
+        current track fades out and the new one starts in a later
+        `update`.
+
+        Parameters
+        ----------
+        category : str
+            Name of the music folder.
+        volume : float
+            Volume of the new track at the end of the fade in.
+
+        Returns
+        -------
+        None
+        """
+        self.prefetch(category)
+        path = self.upcoming.pop(category, None)
+        if path is None:
+            return
+        self.pending = path
+        self.volume = volume
+
+    def update(self) -> None:
+        """
+        Fades the music one step, and starts the pending track once the
+        old one is silent and the new one was read.
+
+        Returns
+        -------
+        None
+        """
+        step = 1 / self.fade_frames
+        if self.pending is None:
+            if self.level < 1:
+                self.level = min(1, self.level + step)
+                pygame.mixer.music.set_volume(self.volume * self.level)
+            return
+
+        if self.level > 0:
+            self.level = max(0, self.level - step)
+            pygame.mixer.music.set_volume(self.volume * self.level)
+            return
+
+        with self.lock:
+            data = self.data.pop(self.pending, None)
+        if data is None:
+            # Still being read, the music stays silent meanwhile
+            self.fetch(self.pending)
+            return
+
+        start = time.perf_counter()
+        # The stream reads from this buffer while it plays
+        self.playing = io.BytesIO(data)
+        pygame.mixer.music.load(self.playing, "mp3")
+        pygame.mixer.music.set_volume(0)
+        pygame.mixer.music.play(-1)
+        self.stalls.append(time.perf_counter() - start)
+        self.current = self.pending
+        self.pending = None
+        self.level = 0
+
+    def report(self) -> dict[str, float]:
+        """
+        Returns how long the transitions stalled the frame loop.
+
+        Returns
+        -------
+        dict[str, float]
+            Number of transitions and the mean and worst stall, in
+            milliseconds.
+        """
+        if not self.stalls:
+            return {"transitions": 0, "mean_ms": 0.0, "worst_ms": 0.0}
+        return {
+            "transitions": len(self.stalls),
+            "mean_ms": 1000 * sum(self.stalls) / len(self.stalls),
+            "worst_ms": 1000 * max(self.stalls),
+        }
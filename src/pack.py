@@ -0,0 +1,373 @@
+import pygame
+import os, sys
+import json
+import mmap
+import hashlib
+import struct
+from typing import Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+main_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+assets_directory = os.path.join(main_directory, "assets")
+pack_path = os.path.join(assets_directory, "Pack", "frames.pack")
+magic = b"SHATPACK"
+header = struct.Struct("<8sI")
+
+def content_hash(directory: str = assets_directory) -> str:
+    """
+    Hashes the content of every PNG file of the assets, except the
+    generated ones, to know when the pack must be rebuilt.
+
+    Parameters
+    ----------
+    directory : str
+        The assets folder.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-1 of the names and bytes of the files.
+    """
+    sha = hashlib.sha1()
+    for root, folders, files in os.walk(directory):
+        folders[:] = sorted(f for f in folders if f not in ("Atlas", "Pack"))
+        for file in sorted(files):
+            if file.endswith(".png"):
+                path = os.path.join(root, file)
+                name = os.path.relpath(path, directory).replace(os.sep, "/")
+                sha.update(name.encode())
+                with open(path, "rb") as data:
+                    sha.update(data.read())
+    return sha.hexdigest()
+
+class AssetPack:
+    """
+    Pack file with frames stored as raw BGRA pixels, the format of
+    `convert_alpha` surfaces. The file is memory-mapped and each frame
+    is a surface created over the mapped bytes, so there is no decoding,
+    scaling or copying when the game starts.
+
+    Attributes
+    ----------
+    hash : str
+        `content_hash` of the assets when the pack was built.
+    frames : dict[str, list]
+        Offset, width and height of each frame, keyed by `frame_key`.
+    hits : int
+        Number of frames served from the pack.
+
+    Methods
+    -------
+    frame(key) -> pygame.Surface or None
+        Returns the frame as a surface over the mapped file.
+    close() -> None
+        Closes the file.
+
+    Notes
+    -----
+    The file is mapped copy-on-write, so the surfaces can be changed
+    without changing the file.
+    """
+
+    def __init__(self, path: str = pack_path) -> None:
+        """
+        Maps the pack file and reads its index.
+
+        Parameters
+        ----------
+        path : str
+            Path of the pack file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        ValueError
+            If the file is not a pack.
+        """
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if self.map.size() < header.size:
+            raise ValueError(f"{path} is not a pack!")
+        name, size = header.unpack_from(self.map)
+        if name != magic:
+            raise ValueError(f"{path} is not a pack!")
+        index = json.loads(self.map[header.size:header.size + size])
+        self.hash = index["hash"]
+        self.frames = index["frames"]
+        self.start = index["start"]
+        self.view = memoryview(self.map)
+        self.hits = 0
+
+    def frame(self, key: str) -> Optional[pygame.Surface]:
+        """
+        Returns the frame stored under `key`.
+
+        Parameters
+        ----------
+        key : str
+            The name of the frame, built with `frame_key`.
+
+        Returns
+        -------
+        pygame.Surface or None
+            A surface sharing the memory of the mapped file, or None if
+            the frame is not in the pack.
+        """
+        value = self.frames.get(key)
+        if value is None:
+            return None
+        self.hits += 1
+        offset, width, height = value
+        offset += self.start
+        pixels = self.view[offset:offset + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), "BGRA")
+
+    def close(self) -> None:
+        """
+        Closes the file. Surfaces made by `frame` must not be used
+        after that.
+
+        Returns
+        -------
+        None
+        """
+        self.view.release()
+        self.map.close()
+
+class PackBuilder:
+    """
+    Collects frames and writes them in a pack file.
+
+    Attributes
+    ----------
+    frames : dict[str, pygame.Surface]
+        Recorded frames, keyed by `frame_key`.
+
+    Methods
+    -------
+    record(key, surface) -> None
+        Stores a frame to be written.
+    save(path, content) -> int
+        Writes the pack file.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty builder.
+        """
+        self.frames = {}
+
+    def record(self, key: str, surface: pygame.Surface) -> None:
+        """
+        Stores a frame to be written. Frames recorded twice are kept
+        once.
+
+        Parameters
+        ----------
+        key : str
+            The name of the frame, built with `frame_key`.
+        surface : pygame.Surface
+            The frame at its final size.
+
+        Returns
+        -------
+        None
+        """
+        self.frames.setdefault(key, surface)
+
+    def save(self, path: str = pack_path, content: str = "") -> int:
+        """
+        Writes the index and the pixels of every frame. The file is
+        written aside and then moved, so a running game never reads a
+        pack that is half written.
+
+        Parameters
+        ----------
+        path : str
+            Path of the pack file.
+        content : str
+            `content_hash` of the assets the frames came from.
+
+        Returns
+        -------
+        int
+            Size of the file in bytes.
+        """
+        frames = {}
+        offset = 0
+        for key, surface in self.frames.items():
+            width, height = surface.get_size()
+            frames[key] = [offset, width, height]
+            offset += width * height * 4
+
+        # The pixels start at a multiple of 16 bytes after the index
+        index = {"hash": content, "frames": frames, "start": 0}
+        size = len(json.dumps(index)) + 16
+        index["start"] = header.size + size + (-(header.size + size) % 16)
+        data = json.dumps(index).encode().ljust(size)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as file:
+            file.write(header.pack(magic, len(data)))
+            file.write(data)
+            file.write(bytes(index["start"] - file.tell()))
+            for surface in self.frames.values():
+                file.write(pygame.image.tobytes(surface, "BGRA"))
+            size = file.tell()
+        os.replace(path + ".tmp", path)
+        return size
+
+_pack = None
+_pack_loaded = False
+_builder = None
+_content = None
+
+def current_hash() -> str:
+    """
+    Returns the `content_hash` of the assets, computed once per run.
+    """
+    global _content
+    if _content is None:
+        _content = content_hash()
+    return _content
+
+def get_pack() -> Optional[AssetPack]:
+    """
+    Returns the game's pack, mapping it the first time it is needed.
+
+    Returns
+    -------
+    AssetPack or None
+        The pack, or None if it does not exist, was built from other
+        assets or a build is running.
+    """
+    global _pack, _pack_loaded
+    if not _pack_loaded:
+        _pack_loaded = True
+        if _builder is None:
+            try:
+                _pack = AssetPack()
+            except (FileNotFoundError, KeyError, ValueError):
+                _pack = None
+            if _pack is not None and _pack.hash != current_hash():
+                _pack.close()
+                _pack = None
+    return _pack
+
+def pack_is_current() -> bool:
+    """
+    Tells whether the pack exists and matches the assets.
+
+    Returns
+    -------
+    bool
+        False if the pack must be built.
+    """
+    return get_pack() is not None
+
+def pack_sources() -> set:
+    """
+    Returns the source files with frames in the current pack.
+
+    Returns
+    -------
+    set[str]
+        Source files relative to `assets`, empty if there is no pack.
+    """
+    pack = get_pack()
+    if pack is None:
+        return set()
+    return {key.split("|")[0] for key in pack.frames}
+
+def pack_frame(key: str) -> Optional[pygame.Surface]:
+    """
+    Returns a frame from the game's pack.
+
+    Parameters
+    ----------
+    key : str
+        The name of the frame, built with `frame_key`.
+
+    Returns
+    -------
+    pygame.Surface or None
+        The frame, or None if there is no pack or the frame is not in
+        it.
+    """
+    pack = get_pack()
+    if pack is None:
+        return None
+    return pack.frame(key)
+
+def record_pack(key: str, surface: pygame.Surface) -> None:
+    """
+    Gives a loaded frame to the pack builder, when one is running.
+
+    Parameters
+    ----------
+    key : str
+        The name of the frame, built with `frame_key`.
+    surface : pygame.Surface
+        The frame at its final size.
+
+    Returns
+    -------
+    None
+    """
+    if _builder is not None:
+        _builder.record(key, surface)
+
+def build_pack(main: object) -> PackBuilder:
+    """
+    Builds the pack by creating a game and every boss, recording the
+    frames they load, and maps the new pack.
+
+    Parameters
+    ----------
+    main : object
+        The main game instance, used to create the game.
+
+    Returns
+    -------
+    PackBuilder
+        The builder with the recorded frames.
+    """
+    global _builder, _pack, _pack_loaded
+    from src.game import GameManager
+
+    if _pack is not None:
+        _pack.close()
+    _builder = PackBuilder()
+    _pack = None
+    _pack_loaded = True
+    try:
+        game = GameManager(main)
+        if game.order.prefetch is not None:
+            game.order.prefetch.join()
+        for _ in range(len(game.order)):
+            game.order.prepare(game.hero)
+        builder = _builder
+        builder.save(pack_path, current_hash())
+        return builder
+    finally:
+        _builder = None
+        _pack_loaded = False
+
+if __name__ == "__main__":
+    # `Sprites` talks to `src.pack`, not to this `__main__` module
+    from src.pack import build_pack
+    pygame.init()
+    screen = pygame.display.set_mode((1400, 800), pygame.HIDDEN)
+
+    class Settings:
+        WIDTH, HEIGHT = screen.get_size()
+        assets_path = assets_directory
+
+    builder = build_pack(Settings())
+    size = os.path.getsize(pack_path)
+    print(f"{len(builder.frames)} frames, {size / 2**20:.1f} MiB")
+    pygame.quit()
@@ -0,0 +1,211 @@
+import pygame
+import os, sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.assets import surface_cache
+
+class ParallaxLayer:
+    """
+    One background image repeated along the x axis.
+
+    Attributes
+    ----------
+    TAG : str
+        General identifier of the class.
+    image : pygame.Surface
+        The image of the layer, as wide as the screen.
+    width : int
+        Width of the image, the period of the repetition.
+    opaque : bool
+        Whether the image has no transparent pixels.
+
+    Methods
+    -------
+    wrap(x) -> int
+        Returns the position of the copy that covers the screen's left
+        edge.
+    draw(screen, x) -> int
+        Draws the copies of the image that intersect the screen.
+    """
+
+    def __init__(self, image: pygame.Surface, opaque: bool = False) -> None:
+        """
+        Initializes the layer.
+
+        Parameters
+        ----------
+        image : pygame.Surface
+            The image of the layer.
+        opaque : bool
+            Whether the image has no transparent pixels, in which case
+            it is converted to be drawn without blending.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "ParallaxLayer"
+        self.image = image
+        if opaque:
+            self.image = surface_cache.converted(image, False)
+        self.width = image.get_width()
+        self.opaque = opaque
+
+    def wrap(self, x: int) -> int:
+        """
+        Returns the position of the copy that covers the screen's left
+        edge.
+
+        Parameters
+        ----------
+        x : int
+            Position of any copy of the image.
+
+        Returns
+        -------
+        int
+            A position between `-width` and 0.
+        """
+        return x % self.width - self.width if x % self.width else 0
+
+    def draw(self, screen: pygame.Surface, x: int) -> int:
+        """
+        Draws the copies of the image that intersect the screen, two at
+        most when the screen is as wide as the image.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the layer will be drawn.
+        x : int
+            Position of any copy of the image.
+
+        Returns
+        -------
+        int
+            Number of blits.
+        """
+        blits = 0
+        x = self.wrap(x)
+        while x < screen.get_width():
+            screen.blit(self.image, (x, 0))
+            x += self.width
+            blits += 1
+        return blits
+
+class Parallax:
+    """
+    The parallax layers of the background, drawn from the back to the
+    front. While the layers keep their distance to each other, they are
+    drawn flattened into one opaque image.
+
+    Attributes
+    ----------
+    TAG : str
+        General identifier of the class.
+    layers : list[ParallaxLayer]
+        The layers, the first one at the back.
+    flatten : bool
+        Whether the layers can be flattened.
+    flat : ParallaxLayer or None
+        The flattened layers, built for the distances in `flat_key`.
+    flat_key : tuple or None
+        Distances of the layers to the first one in `flat`.
+    blits : int
+        Number of blits in the last frame.
+
+    Methods
+    -------
+    draw(screen, offsets, area) -> None
+        Draws the layers at their positions.
+    """
+
+    def __init__(self, layers: list, flatten: bool = True) -> None:
+        """
+        Initializes the background.
+
+        Parameters
+        ----------
+        layers : list[ParallaxLayer]
+            The layers, the first one at the back.
+        flatten : bool
+            Whether the layers can be flattened.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "Parallax"
+        self.layers = layers
+        self.flatten = flatten
+        self.flat = None
+        self.flat_key = None
+        self.last_key = None
+        self.blits = 0
+
+    def build_flat(self, key: tuple) -> ParallaxLayer:
+        """
+        Draws every layer on one opaque image, with the first layer at
+        0 and the others at their distances to it.
+
+        Parameters
+        ----------
+        key : tuple
+            Distances of the layers to the first one.
+
+        Returns
+        -------
+        ParallaxLayer
+            A layer with the flattened image.
+        """
+        first = self.layers[0]
+        surface = pygame.Surface(first.image.get_size())
+        first.draw(surface, 0)
+        for layer, x in zip(self.layers[1:], key):
+            layer.draw(surface, x)
+        return ParallaxLayer(surface, True)
+
+    def draw(
+        self, screen: pygame.Surface, offsets: list[int],
+        area: pygame.Rect = None
+    ) -> None:
+        """
+        Draws the layers at their positions.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the layers will be drawn.
+        offsets : list[int]
+            Position of each layer.
+        area : pygame.Rect
+            Part of the screen where the background shows, all of it
+            by default.
+
+        Returns
+        -------
+        None
+        """
+        self.blits = 0
+        if area is not None and area.width <= 0:
+            return
+        screen.set_clip(area)
+
+        # The layers are flattened once they stop moving apart, so a
+        # still camera draws one opaque image instead of every layer
+        key = tuple(x - offsets[0] for x in offsets[1:])
+        width = self.layers[0].width
+        key = tuple(x % width for x in key)
+        if self.flatten and key == self.last_key:
+            if key != self.flat_key:
+                self.flat = self.build_flat(key)
+                self.flat_key = key
+            self.blits = self.flat.draw(screen, offsets[0])
+        else:
+            for layer, x in zip(self.layers, offsets):
+                self.blits += layer.draw(screen, x)
+        self.last_key = key
+        screen.set_clip(None)
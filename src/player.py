@@ -5,7 +5,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(current_dir, '..')  
 sys.path.append(src_path)
 
-from src.weapon import Projectile, Shield, Attack
+from src.weapon import Shield, Attack, projectile_system
 from src.assets import Sprites
 
 class Player:
@@ -30,6 +30,8 @@ class Player:
         A flag indicating if the player is dead.
     rect : pygame.Rect
         A rectangle defining the player's position and dimensions.
+    min_x : int
+        Leftmost position of the player, the left edge of the screen.
     gravity_y : int
         The gravity effect on the player's vertical movement.
     speed_y : int
@@ -131,6 +133,7 @@ class Player:
         self.rect = pygame.Rect(x, y, width, height)
         self.rect.x = x
         self.rect.y = y
+        self.min_x = 0
         
         self.gravity_y = 2 
         self.speed_y = 0
@@ -189,14 +192,7 @@ class Player:
 
         """
 
-        if camera.TAG == "Camera":
-            self.rect.x -= camera.position_x
-
-        for projectile in self.projectiles:
-            projectile.draw(screen, camera)
-            if not screen.get_rect().colliderect(projectile.rect):
-                self.projectiles.remove(projectile)
-                del projectile
+        projectile_system.draw(self.projectiles, screen, camera)
 
         if self.action == "Jump":
 
@@ -325,8 +321,8 @@ class Player:
             if self.to_right:
                 self.speed_x = 0
             self.rect.x += max(self.speed_x, self.speed_x_min)
-        if self.rect.x <= 0:
-            self.rect.x = 0
+        if self.rect.x <= self.min_x:
+            self.rect.x = self.min_x
         
             # If in the air, is_running is True to maintain constant 
             # velocity.
@@ -340,8 +336,7 @@ class Player:
             self.invincibility_cooldown -= 1
             self.hurt_cooldown -= 1
 
-        for projectile in self.projectiles:
-            projectile.update()
+        projectile_system.update(self.projectiles)
 
         if self.projectile_cooldown > 0:
             self.projectile_cooldown -= 1
@@ -450,7 +445,8 @@ class Player:
         """
         Handles collision detection and response for the player with 
         various game objects. If the player collides with an Obelisk, 
-        then he can push the block. 
+        then he can push the block. Given the tile map, the player and 
+        the projectiles are resolved against its tiles.
 
         Parameters
         ----------
@@ -461,6 +457,11 @@ class Player:
         -------
         None
         """
+        if other.TAG == "TileMap":
+            for tile in other.touching(self.rect):
+                self.on_collision(tile)
+            other.discard(self.projectiles)
+            return
         if other.TAG == "Ground" and self.rect.colliderect(other):
             if (
                 self.rect.bottom > other.rect.top and 
@@ -505,39 +506,27 @@ class Player:
                 self.speed_x = 0
                 self.speed_y = 0
 
-            for projectile in other.projectiles:
+            for index in projectile_system.hits(other.projectiles, self.rect):
 
-                if (
-                    self.rect.colliderect(projectile) and 
-                    self.invincibility_cooldown <= 0
-                ):
-                    self.life -= projectile.damage
+                if self.invincibility_cooldown <= 0:
+                    self.life -= other.projectiles[index].damage
                     self.invincibility_cooldown = self.invincibility_time
                     self.action = "Hurt"
                     self.hurt_cooldown = self.hurt_time
                     self.speed_x = 0
                     self.speed_y = 0
 
-        for projectile in self.projectiles:
-                if (
-                    other.TAG == "Monster" and 
-                    projectile.rect.colliderect(other)
-                ):
+        if other.TAG in ("Monster", "Ground") and self.projectiles:
+            hits = projectile_system.hits(self.projectiles, other.rect)
+            if other.TAG == "Monster":
+                for index in reversed(hits):
+                    projectile = self.projectiles[index]
                     if (
                         not projectile.who == "Yokai" or 
                         not other.sub_TAG == "Ganon"
                     ):
                             other.life -= projectile.damage
-                    self.projectiles.remove(projectile)
-                    del projectile
-
-                    
-                if (
-                    other.TAG == "Ground" and 
-                    projectile.rect.colliderect(other)
-                ):
-                    self.projectiles.remove(projectile)
-                    del projectile
+            projectile_system.release_all(self.projectiles, hits)
                     
         if other.TAG == "Obelisk" and self.rect.colliderect(other.rect):
             self.has_collision_obelisk = True
@@ -807,11 +796,14 @@ class Knight(Player):
 
         if self.shield is not None:
             if other.TAG == "Monster":
-                for projectile in other.projectiles:
-                    self.damage = projectile.damage
+                if other.projectiles:
+                    self.damage = other.projectiles[0].damage
+                hits = projectile_system.hits(
+                    other.projectiles, self.shield.rect
+                )
+                for index in reversed(hits):
                     self.shield.reflect(
-                        self.TAG, projectile, self.projectiles, 
-                        other.projectiles
+                        self.TAG, index, self.projectiles, other.projectiles
                     )
 
     def update(self) -> None:
@@ -848,9 +840,9 @@ class Knight(Player):
         super().draw(screen, camera)
 
         if self.invincibility_cooldown >= 0 :
-            self.sprites.draw(screen,128)
+            self.sprites.draw(screen, camera, 128)
         else:
-            self.sprites.draw(screen)
+            self.sprites.draw(screen, camera)
         
 
 class Yokai(Player):
@@ -1088,27 +1080,27 @@ class Yokai(Player):
         ):
             self.attack_time = 0
             if key_map[pygame.K_w]:  
-                new_projectile = Projectile(
-                    self.rect.centerx, self.rect.centery, 0, -20, 
-                    self.sub_TAG, self.damage, 30, 30, self.image_projectile_u
+                projectile_system.fire(
+                    self.projectiles, self.rect.centerx, self.rect.centery, 
+                    0, -20, self.sub_TAG, self.damage, 30, 30, 
+                    self.image_projectile_u
                 )
-                self.projectiles.append(new_projectile)
                 self.action = "Attack_2"
                 self.actual["Attack_2"] = 0
             elif self.from_the_front: 
-                new_projectile = Projectile(
-                    self.rect.centerx, self.rect.top, 20, 0, self.sub_TAG, 
-                    self.damage, 30, 30, self.image_projectile_r
+                projectile_system.fire(
+                    self.projectiles, self.rect.centerx, self.rect.top, 20, 
+                    0, self.sub_TAG, self.damage, 30, 30, 
+                    self.image_projectile_r
                 )
-                self.projectiles.append(new_projectile)
                 self.action = "Attack"
                 self.actual["Attack"] = 0
             else:
-                new_projectile = Projectile(
-                    self.rect.centerx, self.rect.top, -20, 0, self.sub_TAG, 
-                    self.damage, 30, 30, self.image_projectile_l
+                projectile_system.fire(
+                    self.projectiles, self.rect.centerx, self.rect.top, -20, 
+                    0, self.sub_TAG, self.damage, 30, 30, 
+                    self.image_projectile_l
                 )
-                self.projectiles.append(new_projectile)
                 self.action = "Attack"
                 self.actual["Attack"] = 0
 
@@ -1143,9 +1135,9 @@ class Yokai(Player):
         super().draw(screen, camera)
 
         if self.invincibility_cooldown >= 0 :
-            self.sprites.draw(screen,128)
+            self.sprites.draw(screen, camera, 128)
         else:
-            self.sprites.draw(screen)
+            self.sprites.draw(screen, camera)
 
 class Ninja(Player):
     """
@@ -1439,6 +1431,6 @@ class Ninja(Player):
         super().draw(screen, camera)
 
         if self.invincibility_cooldown >= 0 :
-            self.sprites.draw(screen,128)
+            self.sprites.draw(screen, camera, 128)
         else:
-            self.sprites.draw(screen)
\ No newline at end of file
+            self.sprites.draw(screen, camera)
\ No newline at end of file
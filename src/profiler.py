@@ -0,0 +1,284 @@
+import pygame
+import os, sys
+import time
+from array import array
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.score import get_font
+
+class FrameProfiler:
+    """
+    Times each phase of the frames of the main loop into a ring buffer,
+    and draws the last frames as a stacked graph with counters in a
+    corner of the screen. While it is off, timing a phase only checks a
+    flag.
+
+    Attributes
+    ----------
+    TAG : str
+        Identifier tag for the profiler.
+    phases : tuple
+        Names of the phases, in the order they happen in a frame. The 
+        drawing of the overlay is its own phase, apart from the one of 
+        the game.
+    colors : tuple
+        Color of each phase in the graph.
+    scale : int
+        Milliseconds at the top of the graph.
+    budget : float
+        Milliseconds of a frame at 30 frames per second, drawn as a 
+        line across the graph.
+    size : int
+        Number of frames kept.
+    enabled : bool
+        Whether the frames are timed and the overlay drawn.
+    times : array
+        Seconds of each phase of each frame kept, `len(phases)` values
+        per frame, the oldest ones overwritten.
+    starts : array
+        When each frame kept started, from `time.perf_counter`.
+    index : int
+        Frame of the buffer being timed.
+    count : int
+        Number of frames timed, up to `size`.
+    last : float
+        When the phase being timed started.
+    slots : dict[str, int]
+        Position of each phase in the times of a frame.
+    width : int
+        Width of the graph, 2 pixels per frame.
+    height : int
+        Height of the graph, `scale` milliseconds.
+    panel : pygame.Rect
+        Size of the overlay.
+
+    Methods
+    -------
+    toggle() -> None
+        Turns the profiler on or off.
+    start() -> None
+        Starts timing a frame.
+    mark(phase) -> None
+        Ends the timing of a phase of the frame.
+    end_frame() -> None
+        Keeps the frame in the buffer.
+    frame(age) -> list[float]
+        Returns the times of the phases of a frame kept.
+    counters() -> dict
+        Returns the frame rate and the mean times of the frames kept.
+    draw(screen) -> pygame.Rect
+        Draws the graph and the counters.
+    """
+
+    phases = (
+        "events", "on_key_pressed", "update", "collision_decetion",
+        "elimination", "music", "draw", "overlay", "flip"
+    )
+    colors = (
+        (200, 200, 200), (255, 220, 0), (80, 160, 255), (255, 80, 80),
+        (255, 150, 0), (180, 100, 255), (80, 220, 120), (255, 120, 200),
+        (0, 220, 220)
+    )
+    scale = 50
+    budget = 1000 / 30
+
+    def __init__(self, size: int = 120) -> None:
+        """
+        Initializes a profiler that is off.
+
+        Parameters
+        ----------
+        size : int
+            Number of frames kept, one column of the graph each.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "FrameProfiler"
+        self.size = size
+        self.enabled = False
+        self.slots = {phase: slot for slot, phase in enumerate(self.phases)}
+        self.times = array("d", [0.0]) * (size * len(self.phases))
+        self.starts = array("d", [0.0]) * size
+        self.index = 0
+        self.count = 0
+        self.last = 0.0
+        self.width = 2 * size
+        self.height = 100
+        self.panel = pygame.Rect(0, 0, self.width + 180, 158)
+
+    def toggle(self) -> None:
+        """
+        Turns the profiler on or off. The frames timed before are
+        forgotten when it is turned on, and the frame going on is timed
+        from then.
+
+        Returns
+        -------
+        None
+        """
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.index = 0
+            self.count = 0
+            self.start()
+
+    def start(self) -> None:
+        """
+        Starts timing a frame, with its phases at zero.
+
+        Returns
+        -------
+        None
+        """
+        if not self.enabled:
+            return
+        self.last = time.perf_counter()
+        self.starts[self.index] = self.last
+        first = self.index * len(self.phases)
+        for slot in range(first, first + len(self.phases)):
+            self.times[slot] = 0.0
+
+    def mark(self, phase: str) -> None:
+        """
+        Ends the timing of a phase, which lasted since the frame started
+        or the last phase ended. A phase marked twice adds up.
+
+        Parameters
+        ----------
+        phase : str
+            One of `phases`.
+
+        Returns
+        -------
+        None
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        slot = self.index * len(self.phases) + self.slots[phase]
+        self.times[slot] += now - self.last
+        self.last = now
+
+    def end_frame(self) -> None:
+        """
+        Keeps the frame timed in the buffer, in place of the oldest one
+        when it is full.
+
+        Returns
+        -------
+        None
+        """
+        if not self.enabled:
+            return
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def frame(self, age: int) -> list[float]:
+        """
+        Returns the times of the phases of a frame kept.
+
+        Parameters
+        ----------
+        age : int
+            0 for the last frame timed, 1 for the one before, and so on,
+            less than `count`.
+
+        Returns
+        -------
+        list[float]
+            Seconds of each of the `phases`.
+        """
+        index = (self.index - 1 - age) % self.size
+        first = index * len(self.phases)
+        return list(self.times[first:first + len(self.phases)])
+
+    def counters(self) -> dict:
+        """
+        Returns the frame rate and the times of the frames kept.
+
+        Returns
+        -------
+        dict
+            `fps`, the `mean` and `max` milliseconds of the frames, and
+            the mean milliseconds of each phase in `phases`.
+        """
+        frames = [self.frame(age) for age in range(self.count)]
+        totals = [sum(frame) * 1000 for frame in frames]
+        count = len(frames) or 1
+        fps = 0.0
+        if self.count > 1:
+            newest = self.starts[(self.index - 1) % self.size]
+            oldest = self.starts[(self.index - self.count) % self.size]
+            if newest > oldest:
+                fps = (self.count - 1) / (newest - oldest)
+        return {
+            "fps": fps,
+            "mean": sum(totals) / count,
+            "max": max(totals, default=0.0),
+            "phases": {
+                phase: sum(frame[slot] for frame in frames) * 1000 / count
+                for slot, phase in enumerate(self.phases)
+            }
+        }
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Draws the graph of the frames kept, the newest on the right, and
+        the counters, on an opaque panel at the top right corner.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the overlay will be drawn.
+
+        Returns
+        -------
+        pygame.Rect
+            The area of the screen drawn on.
+        """
+        panel = self.panel.copy()
+        panel.topright = (screen.get_width() - 10, 10)
+        pygame.draw.rect(screen, (20, 20, 20), panel)
+        left, bottom = panel.x + 10, panel.bottom - 10
+        top = bottom - self.height
+        pixels = self.height / self.scale
+
+        for age in range(self.count):
+            x = left + self.width - 2 * (age + 1)
+            y = bottom
+            for slot, seconds in enumerate(self.frame(age)):
+                height = min(round(seconds * 1000 * pixels), y - top)
+                if height > 0:
+                    y -= height
+                    pygame.draw.rect(
+                        screen, self.colors[slot], (x, y, 2, height)
+                    )
+        line = bottom - round(self.budget * pixels)
+        pygame.draw.line(
+            screen, (255, 255, 255), (left, line), 
+            (left + self.width - 1, line)
+        )
+
+        counters = self.counters()
+        lines = [
+            (f"{counters['fps']:.1f} fps", (255, 255, 255)),
+            (
+                f"{counters['mean']:.1f} ms, max {counters['max']:.1f}", 
+                (255, 255, 255)
+            )
+        ]
+        lines += [
+            (f"{phase[:11]} {counters['phases'][phase]:.2f}", color)
+            for phase, color in zip(self.phases, self.colors)
+        ]
+        font = get_font(None, 18)
+        x = left + self.width + 10
+        for number, (text, color) in enumerate(lines):
+            image = font.render(text, True, color)
+            screen.blit(image, (x, panel.y + 6 + 13 * number))
+        return panel
@@ -0,0 +1,383 @@
+import pygame
+import os, sys
+import random
+import struct
+from typing import Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+magic = b"SHATPLAY"
+header = struct.Struct("<8sIQH")
+event_format = struct.Struct("<Bi")
+# The keys the heroes read while they are held, the others only matter
+# through their events
+watched_keys = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_v)
+event_types = (pygame.KEYDOWN, pygame.KEYUP)
+# Number of events that marks a reset of the game instead of a frame
+reset_mark = 255
+
+class KeyState:
+    """
+    Held keys of a frame, read like the result of
+    `pygame.key.get_pressed`.
+
+    Attributes
+    ----------
+    pressed : frozenset
+        Codes of the keys held.
+
+    Methods
+    -------
+    from_mask(mask, keys) -> KeyState
+        Returns the keys held from the bits of a frame of a log.
+    mask(key_map, keys) -> int
+        Returns the bits of the keys held in a key map.
+    """
+
+    def __init__(self, pressed: frozenset = frozenset()) -> None:
+        """
+        Initializes the state.
+
+        Parameters
+        ----------
+        pressed : frozenset
+            Codes of the keys held.
+
+        Returns
+        -------
+        None
+        """
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        """
+        Tells whether a key is held.
+
+        Parameters
+        ----------
+        key : int
+            A key code, like `pygame.K_a`.
+
+        Returns
+        -------
+        bool
+            True if the key is held.
+        """
+        return key in self.pressed
+
+    @classmethod
+    def from_mask(cls, mask: int, keys: tuple) -> "KeyState":
+        """
+        Returns the keys held from the bits of a frame.
+
+        Parameters
+        ----------
+        mask : int
+            One bit for each key of `keys`, the first key in the lowest
+            bit.
+        keys : tuple
+            The keys watched by the log.
+
+        Returns
+        -------
+        KeyState
+            The keys whose bit is set.
+        """
+        return cls(key for bit, key in enumerate(keys) if mask >> bit & 1)
+
+    @staticmethod
+    def mask(key_map: object, keys: tuple) -> int:
+        """
+        Returns the bits of the keys held in a key map.
+
+        Parameters
+        ----------
+        key_map : object
+            The result of `pygame.key.get_pressed` or a KeyState.
+        keys : tuple
+            The keys watched by the log.
+
+        Returns
+        -------
+        int
+            One bit for each key, the first key in the lowest bit.
+        """
+        return sum(1 << bit for bit, key in enumerate(keys) if key_map[key])
+
+class Recorder:
+    """
+    Writes the input of each frame of the game to a binary log, with
+    the seed of the random numbers, so the game can be played again
+    exactly as it was.
+
+    The log starts with `header`: `magic`, the version, the seed and
+    the number of keys watched, followed by their codes. Each frame is
+    then one byte for every 8 keys held, with the first key in the
+    lowest bit, the number of key events, and each event as its kind
+    (0 for a press, 1 for a release) and key code. A reset of the game
+    is written as a frame with no keys held and `reset_mark` events,
+    followed by the events given to the game before the reset.
+
+    Attributes
+    ----------
+    TAG : str
+        Identifier tag for the recorder.
+    path : str
+        Path of the log.
+    seed : int
+        Seed given to `random` when the recording started.
+    keys : tuple
+        The keys whose state is kept in every frame.
+    width : int
+        Bytes of the held keys in each frame.
+    frames : int
+        Number of frames written.
+    file : io.BufferedWriter
+        The open log.
+
+    Methods
+    -------
+    frame(key_map, events) -> None
+        Writes the input of a frame.
+    reset(events) -> None
+        Writes a reset of the game and seeds `random` again.
+    close() -> None
+        Finishes the log.
+    """
+
+    version = 2
+
+    def __init__(
+        self, path: str, seed: Optional[int] = None,
+        keys: tuple = watched_keys
+    ) -> None:
+        """
+        Opens the log and seeds `random`, which must be done before the
+        first frame of the game.
+
+        Parameters
+        ----------
+        path : str
+            Path of the log, replaced if it exists.
+        seed : int, optional
+            Seed of the random numbers. If not provided, one is chosen.
+        keys : tuple
+            The keys whose state is kept in every frame.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "Recorder"
+        self.path = path
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.keys = tuple(keys)
+        self.width = (len(self.keys) + 7) // 8
+        self.frames = 0
+        self.file = open(path, "wb")
+        self.file.write(
+            header.pack(magic, self.version, self.seed, len(self.keys))
+        )
+        self.file.write(struct.pack(f"<{len(self.keys)}i", *self.keys))
+        random.seed(self.seed)
+
+    def frame(self, key_map: object, events: list) -> None:
+        """
+        Writes the input of a frame, the held keys and the key events
+        given to the game.
+
+        Parameters
+        ----------
+        key_map : object
+            The result of `pygame.key.get_pressed`.
+        events : list
+            The events given to `GameManager.on_event`, of which only
+            the key presses and releases are kept.
+
+        Returns
+        -------
+        None
+        """
+        mask = KeyState.mask(key_map, self.keys)
+        data = bytearray(mask.to_bytes(self.width, "little"))
+        data += self.pack(events)
+        self.file.write(data)
+        self.frames += 1
+
+    def reset(self, events: list) -> None:
+        """
+        Writes a reset of the game, which must be done right after
+        `GameManager.reset`, and seeds `random` as at the start so the
+        new game can be replayed from there.
+
+        Parameters
+        ----------
+        events : list
+            The events given to the game since its last frame, before
+            it was reset.
+
+        Returns
+        -------
+        None
+        """
+        data = bytearray(self.width)
+        data.append(reset_mark)
+        data += self.pack(events)
+        self.file.write(data)
+        random.seed(self.seed)
+
+    @staticmethod
+    def pack(events: list) -> bytes:
+        """
+        Returns the number of key events and the events.
+
+        Parameters
+        ----------
+        events : list
+            Events of which only the key presses and releases are kept,
+            less than `reset_mark` of them.
+
+        Returns
+        -------
+        bytes
+            The events as written in the log.
+        """
+        events = [event for event in events if event.type in event_types]
+        data = bytearray([len(events)])
+        for event in events:
+            kind = event_types.index(event.type)
+            data += event_format.pack(kind, event.key)
+        return bytes(data)
+
+    def close(self) -> None:
+        """
+        Writes what is left of the log and closes it.
+
+        Returns
+        -------
+        None
+        """
+        self.file.close()
+
+class Replay:
+    """
+    Plays a log of a `Recorder` again, feeding its frames to the game
+    through `GameManager.on_event` and `GameManager.on_key_pressed`
+    after seeding `random` the same way.
+
+    Attributes
+    ----------
+    TAG : str
+        Identifier tag for the replay.
+    seed : int
+        Seed of the random numbers of the recording.
+    keys : tuple
+        The keys watched by the log.
+    frames : list[tuple[KeyState, list]]
+        The held keys and the key events of each frame. The resets of
+        the game have None in place of the keys.
+
+    Methods
+    -------
+    run(main, fast) -> int
+        Plays the frames in the game of `main`.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Reads a log.
+
+        Parameters
+        ----------
+        path : str
+            Path of the log.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the file is not a log of this version.
+        """
+        self.TAG = "Replay"
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if len(data) < header.size:
+            raise ValueError(f"{path} is not a replay log")
+        label, version, self.seed, count = header.unpack_from(data)
+        if label != magic or version != Recorder.version:
+            raise ValueError(f"{path} is not a replay log")
+        offset = header.size
+        self.keys = struct.unpack_from(f"<{count}i", data, offset)
+        offset += 4 * count
+        width = (count + 7) // 8
+
+        self.frames = []
+        while offset < len(data):
+            mask = int.from_bytes(data[offset:offset + width], "little")
+            total = data[offset + width]
+            offset += width + 1
+            keys = KeyState.from_mask(mask, self.keys)
+            if total == reset_mark:
+                keys = None
+                total = data[offset]
+                offset += 1
+            events = []
+            for _ in range(total):
+                kind, key = event_format.unpack_from(data, offset)
+                offset += event_format.size
+                events.append(pygame.event.Event(event_types[kind], key=key))
+            self.frames.append((keys, events))
+
+    def run(self, main: object, fast: bool = False) -> int:
+        """
+        Starts a new game and plays the frames in it, until they end or
+        the game is lost or won, resetting it where the recording did.
+        The game is drawn unless `main` is headless.
+
+        Parameters
+        ----------
+        main : Main
+            The game, with its states built or being built.
+        fast : bool
+            Whether to play the frames as fast as they can be computed,
+            instead of 30 per second.
+
+        Returns
+        -------
+        int
+            Number of frames played.
+        """
+        main.finish_loading()
+        main.change_state("game", False)
+        game = main.states["game"]
+        random.seed(self.seed)
+        clock = pygame.time.Clock()
+
+        steps = 0
+        for key_map, events in self.frames:
+            if main.current_state is not game:
+                break
+            pygame.event.pump()
+            for event in events:
+                game.on_event(event, main)
+            if key_map is None:
+                game.reset()
+                random.seed(self.seed)
+                continue
+            game.on_key_pressed(key_map)
+            game.update()
+            game.collision_decetion()
+            game.elimination(main.change_state)
+            steps += 1
+            if not main.headless:
+                main.current_state.draw(main.screen)
+                pygame.display.flip()
+            if not fast:
+                clock.tick(30)
+        return steps
@@ -1,5 +1,32 @@
 import pygame, os, sys
 
+# Fonts are shared by every score, keyed by (font file, size)
+fonts = {}
+# Largest size that fits, keyed by (font file, initial size, text 
+# length, width, height)
+fitted_sizes = {}
+
+def get_font(font_path: str, size: int) -> pygame.font.Font:
+    """
+    Returns the font of a file and size, loading it only once.
+
+    Parameters
+    ----------
+    font_path : str or None
+        The font file, None for the default font.
+    size : int
+        The font size.
+
+    Returns
+    -------
+    pygame.font.Font
+        The shared font object.
+    """
+    key = (font_path, size)
+    if key not in fonts:
+        fonts[key] = pygame.font.Font(font_path, size)
+    return fonts[key]
+
 class Score:
     """
     Represents a score display element that shows text and a 
@@ -30,6 +57,12 @@ class Score:
     font_stile : str
         The style or name of the font file.
         Defaults to None.
+    font_path : str or None
+        Path of the font file, None for the default font.
+    surface : pygame.Surface or None
+        The text and its background, composed when the value changes.
+    rect : pygame.Rect or None
+        Where `surface` is drawn.
 
     Methods
     -------
@@ -37,6 +70,8 @@ class Score:
         Renders the score display onto the given Pygame surface.
     update(value) -> None
         Updates the numerical value of the score.
+    compose() -> None
+        Renders the text and its background in one surface.
     adj_font(text, size_init) -> Font
         Adjusts the font size dynamically to fit within the specified
         width and height.
@@ -92,6 +127,19 @@ class Score:
         self.transparece = transparece
         self.font_stile = font_stile
 
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        interfaces_path = os.path.join(
+            path_game, os.pardir, "assets", "Interfaces"
+        )
+        if self.font_stile is not None:
+            self.font_path = os.path.join(
+                interfaces_path, f"{self.font_stile}"
+            )
+        else:
+            self.font_path = None
+        self.surface = None
+        self.rect = None
+
     def draw(self, screen: pygame.Surface) -> None:
         """
         Renders the score display onto the given Pygame surface.
@@ -105,20 +153,11 @@ class Score:
         -------
         None
         """
-        message = f"{self.text}: {self.Value}"
-        
-        font = self.adj_font(message, self.size_font)
-        text_format = font.render(message, True, (255, 255, 255))
-        
-        rect_max = pygame.rect.Rect(self.x, self.y, self.width, self.height)
-        rect_text = text_format.get_rect(center=rect_max.center)
-        
-        rect_surface = pygame.Surface(rect_text.size, pygame.SRCALPHA)
-        rect_surface.fill(self.back_color)
-        rect_surface.set_alpha(self.transparece)
-        
-        screen.blit(rect_surface, rect_text)
-        screen.blit(text_format, rect_text)
+        if self.surface is None:
+            self.compose()
+        screen.blit(
+            self.surface, self.rect, special_flags=pygame.BLEND_PREMULTIPLIED
+        )
 
     def update(self, value: int) -> None:
         """
@@ -133,7 +172,45 @@ class Score:
         -------
         None
         """
-        self.Value = value
+        if value != self.Value:
+            self.Value = value
+            self.surface = None
+
+    def compose(self) -> None:
+        """
+        Renders the text over its background in one surface, with the 
+        colors premultiplied by the alpha, so drawing it blends like 
+        drawing the background and then the text.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        message = f"{self.text}: {self.Value}"
+        
+        font = self.adj_font(message, self.size_font)
+        text_format = font.render(message, True, (255, 255, 255))
+        # White text premultiplied by its alpha is the coverage of the 
+        # glyphs, which is the text rendered over black
+        coverage = font.render(message, True, (255, 255, 255), (0, 0, 0))
+        text_format.blit(
+            coverage, (0, 0), special_flags=pygame.BLEND_RGB_MULT
+        )
+        
+        rect_max = pygame.rect.Rect(self.x, self.y, self.width, self.height)
+        self.rect = text_format.get_rect(center=rect_max.center)
+        
+        alpha = self.transparece
+        back_color = [c * alpha // 255 for c in self.back_color[:3]]
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.surface.fill((*back_color, alpha))
+        self.surface.blit(
+            text_format, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED
+        )
 
     def adj_font(self, text: str, size_init: int) -> pygame.font.Font:
         """
@@ -158,21 +235,16 @@ class Score:
             If the text cannot fit within the specified dimensions
             even with the smallest font size.
         """
-        size = size_init
-        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
-        interfaces_path = os.path.join(
-            path_game, os.pardir, "assets", "Interfaces"
+        key = (
+            self.font_path, size_init, len(text), self.width, self.height
         )
-        if self.font_stile is not None:
-            font_path = os.path.join(interfaces_path, f"{self.font_stile}")
-        else:
-            font_path = None
-
+        size = fitted_sizes.get(key, size_init)
         while True:
-            font = pygame.font.Font(font_path, size)
+            font = get_font(self.font_path, size)
             width, height = font.size(text)
             if width <= self.width and height <= self.height:
+                fitted_sizes[key] = size
                 return font
             size -= 1
             if size < 1:
-                raise ValueError("Text doesn't fit!")
\ No newline at end of file
+                raise ValueError("Text doesn't fit!")
@@ -0,0 +1,157 @@
+import pygame
+import os, sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+class WorldSnapshot:
+    """
+    Copy of the state of every game object reachable from a root
+    object, taken once, to put the world back as it was without
+    building it again.
+
+    Attributes
+    ----------
+    states : list[tuple]
+        Each object with a frozen copy of its attributes.
+
+    Methods
+    -------
+    restore() -> None
+        Puts every object back in the captured state.
+
+    Notes
+    -----
+    Game objects are the instances of classes written in `src`. Lists,
+    dicts, sets and rects are copied, and the surfaces, fonts and other
+    objects are kept by reference, so restoring never loads an image.
+    The objects are restored in place, so every reference to them stays
+    valid. Objects created after the snapshot are not restored, they
+    are just dropped from the lists that held them.
+    """
+
+    def __init__(self, root: object, skip: list = ()) -> None:
+        """
+        Captures the state of `root` and of every game object reachable
+        from it.
+
+        Parameters
+        ----------
+        root : object
+            The object the capture starts from, usually the
+            GameManager.
+        skip : list
+            Objects that are kept by reference but not captured, like
+            the main game instance.
+
+        Returns
+        -------
+        None
+        """
+        self.skip = {id(obj) for obj in skip}
+        self.states = []
+        seen = {id(root)}
+        pending = [root]
+        while pending:
+            obj = pending.pop()
+            found = []
+            frozen = self.freeze(vars(obj), found)
+            self.states.append((obj, frozen))
+            for other in found:
+                if id(other) not in seen:
+                    seen.add(id(other))
+                    pending.append(other)
+
+    def is_game_object(self, value: object) -> bool:
+        """
+        Tells whether `value` is an instance of a class written in
+        `src`.
+
+        Parameters
+        ----------
+        value : object
+            Any value found in the attributes of a game object.
+
+        Returns
+        -------
+        bool
+            True if the state of `value` must be captured.
+        """
+        if id(value) in self.skip or not hasattr(value, "__dict__"):
+            return False
+        if isinstance(value, type):
+            return False
+        module = sys.modules.get(type(value).__module__)
+        path = getattr(module, "__file__", None) or ""
+        return os.path.dirname(os.path.abspath(path)) == current_dir
+
+    def freeze(self, value: object, found: list) -> object:
+        """
+        Copies the mutable containers of `value`.
+
+        Parameters
+        ----------
+        value : object
+            An attribute of a game object.
+        found : list
+            Receives the game objects found inside `value`.
+
+        Returns
+        -------
+        object
+            A copy that later changes to `value` do not affect.
+        """
+        if type(value) in (list, tuple, set):
+            items = [self.freeze(item, found) for item in value]
+            return items if type(value) is list else type(value)(items)
+        if type(value) is dict:
+            return {
+                key: self.freeze(item, found) for key, item in value.items()
+            }
+        if isinstance(value, pygame.Rect):
+            return value.copy()
+        if self.is_game_object(value):
+            found.append(value)
+        return value
+
+    @staticmethod
+    def thaw(value: object) -> object:
+        """
+        Copies a frozen value again, so the snapshot can be restored
+        more than once.
+
+        Parameters
+        ----------
+        value : object
+            A value made by `freeze`.
+
+        Returns
+        -------
+        object
+            A copy of `value` to be given to a game object.
+        """
+        if type(value) is list:
+            return [WorldSnapshot.thaw(item) for item in value]
+        if type(value) in (tuple, set):
+            return type(value)(WorldSnapshot.thaw(item) for item in value)
+        if type(value) is dict:
+            return {
+                key: WorldSnapshot.thaw(item) for key, item in value.items()
+            }
+        if isinstance(value, pygame.Rect):
+            return value.copy()
+        return value
+
+    def restore(self) -> None:
+        """
+        Puts every captured object back in the captured state.
+
+        Returns
+        -------
+        None
+        """
+        for obj, frozen in self.states:
+            attributes = vars(obj)
+            attributes.clear()
+            attributes.update(self.thaw(frozen))
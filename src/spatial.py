@@ -0,0 +1,195 @@
+import pygame
+import os, sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+class SpatialHash:
+    """
+    Uniform grid over the world, which finds the objects close to a
+    rect without testing every object.
+
+    Attributes
+    ----------
+    TAG : str
+        General identifier of the class.
+    cell_size : int
+        Side of the square cells, in pixels.
+    buckets : dict[tuple, list]
+        Objects touching each (column, row) cell.
+    places : dict[int, list]
+        Cells of each object, by its id.
+    keys : dict[int, int]
+        Insertion order of each object, by its id.
+    columns : dict[int, int]
+        Number of objects touching each column of cells.
+
+    Methods
+    -------
+    cells(rect) -> list[tuple]
+        Returns the cells a rect touches.
+    insert(item) -> None
+        Adds an object to the cells its rect touches.
+    remove(item) -> None
+        Removes an object from the grid.
+    move(item) -> None
+        Puts an object that moved in its new cells.
+    occupied(*rects) -> bool
+        Tells whether an object may be in the cells the rects touch.
+    query(*rects, start) -> list
+        Returns the objects in the cells the rects touch.
+    """
+
+    def __init__(self, cell_size: int = 50, items: list = ()) -> None:
+        """
+        Initializes the grid.
+
+        Parameters
+        ----------
+        cell_size : int
+            Side of the cells, the tile size of the map by default.
+        items : list
+            Objects with a rect, inserted in this order.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "SpatialHash"
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.places = {}
+        self.keys = {}
+        self.columns = {}
+        for item in items:
+            self.insert(item)
+
+    def cells(self, rect: pygame.Rect) -> list[tuple]:
+        """
+        Returns the cells a rect touches.
+
+        Parameters
+        ----------
+        rect : pygame.Rect
+            Any rect of the world.
+
+        Returns
+        -------
+        list[tuple]
+            The (column, row) of each cell.
+        """
+        size = self.cell_size
+        columns = range(rect.left // size, (rect.right - 1) // size + 1)
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        return [(column, row) for column in columns for row in rows]
+
+    def insert(self, item: object) -> None:
+        """
+        Adds an object to the cells its rect touches.
+
+        Parameters
+        ----------
+        item : object
+            Any object with a rect.
+
+        Returns
+        -------
+        None
+        """
+        self.keys.setdefault(id(item), len(self.keys))
+        places = self.cells(item.rect)
+        self.places[id(item)] = places
+        for cell in places:
+            self.buckets.setdefault(cell, []).append(item)
+            self.columns[cell[0]] = self.columns.get(cell[0], 0) + 1
+
+    def remove(self, item: object) -> None:
+        """
+        Removes an object from the grid.
+
+        Parameters
+        ----------
+        item : object
+            An object inserted before.
+
+        Returns
+        -------
+        None
+        """
+        for cell in self.places.pop(id(item), []):
+            bucket = self.buckets[cell]
+            bucket.remove(item)
+            if not bucket:
+                del self.buckets[cell]
+            self.columns[cell[0]] -= 1
+            if not self.columns[cell[0]]:
+                del self.columns[cell[0]]
+
+    def move(self, item: object) -> None:
+        """
+        Puts an object in the cells of its current rect, keeping its
+        place in the order.
+
+        Parameters
+        ----------
+        item : object
+            An object inserted before, whose rect may have moved.
+
+        Returns
+        -------
+        None
+        """
+        if self.places.get(id(item)) != self.cells(item.rect):
+            self.remove(item)
+            self.insert(item)
+
+    def occupied(self, *rects: pygame.Rect) -> bool:
+        """
+        Tells whether any object touches the columns of cells the 
+        rects touch, which is much cheaper than a query and answers 
+        most of them when the objects are few.
+
+        Parameters
+        ----------
+        *rects : pygame.Rect
+            The areas to look around.
+
+        Returns
+        -------
+        bool
+            False if a query of the rects would find nothing.
+        """
+        size, columns = self.cell_size, self.columns
+        for left, _, width, _ in rects:
+            for column in range(left // size, (left + width - 1) // size + 1):
+                if column in columns:
+                    return True
+        return False
+
+    def query(self, *rects: pygame.Rect, start: int = 0) -> list:
+        """
+        Returns the objects in the cells the rects touch, which are the
+        only ones that can collide with them.
+
+        Parameters
+        ----------
+        *rects : pygame.Rect
+            The areas to look around.
+        start : int
+            Objects inserted before this position are left out.
+
+        Returns
+        -------
+        list
+            Each object once, in the order they were inserted.
+        """
+        found = {}
+        for rect in rects:
+            for cell in self.cells(rect):
+                for item in self.buckets.get(cell, ()):
+                    if self.keys[id(item)] >= start:
+                        found[id(item)] = item
+        if len(found) < 2:
+            return list(found.values())
+        return sorted(found.values(), key=lambda item: self.keys[id(item)])
@@ -1,6 +1,144 @@
 import pygame
+from collections import OrderedDict
 from typing import Union
 
+class ScaledImages:
+    """
+    Bounded cache of the projectile images at the sizes they are shot 
+    with, and mirrored when a shield reflects them. Every shooter fires 
+    a few images at a few sizes, so after the first shots no pixels are 
+    scaled or flipped.
+
+    Attributes
+    ----------
+    surfaces : OrderedDict
+        (source, scaled surface) keyed by the id of the source and the 
+        size, or None for the mirrored source, from the least to the 
+        most recently used. The source is kept so its id is not given 
+        to another surface.
+    max_entries : int
+        Scaled surfaces kept before the least recently used are 
+        dropped.
+    hits : int
+        Number of images found already scaled.
+    misses : int
+        Number of images that had to be scaled.
+
+    Methods
+    -------
+    scale(image, size) -> pygame.Surface
+        Returns the image at the size, scaling it if needed.
+    flip(image) -> pygame.Surface
+        Returns the image mirrored, flipping it if needed.
+    hit_rate() -> float
+        Returns the share of the images found already scaled.
+    clear() -> None
+        Drops every scaled image and resets the counters.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        """
+        Initializes an empty cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            Scaled surfaces allowed in the cache.
+        """
+        self.surfaces = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def scale(
+        self, image: pygame.Surface, size: tuple[int, int]
+    ) -> pygame.Surface:
+        """
+        Returns `image` scaled to `size`.
+
+        Parameters
+        ----------
+        image : pygame.Surface
+            The source image, which must not change afterwards.
+        size : tuple[int, int]
+            Width and height of the scaled image.
+
+        Returns
+        -------
+        pygame.Surface
+            The scaled image, shared, so it must not be drawn on.
+        """
+        key = (id(image), size)
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        scaled = pygame.transform.scale(image, size)
+        self.surfaces[key] = (image, scaled)
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return scaled
+
+    def flip(self, image: pygame.Surface) -> pygame.Surface:
+        """
+        Returns `image` mirrored horizontally. The mirrored image is 
+        kept with its own mirror, the source, so a projectile reflected 
+        back gets its first image again.
+
+        Parameters
+        ----------
+        image : pygame.Surface
+            The source image, which must not change afterwards.
+
+        Returns
+        -------
+        pygame.Surface
+            The mirrored image, shared, so it must not be drawn on.
+        """
+        key = (id(image), None)
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        flipped = pygame.transform.flip(image, True, False)
+        self.surfaces[key] = (image, flipped)
+        self.surfaces[(id(flipped), None)] = (flipped, image)
+        while len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return flipped
+
+    def hit_rate(self) -> float:
+        """
+        Returns the share of the images found already scaled.
+
+        Returns
+        -------
+        float
+            Between 0 and 1, or 0 before the first image.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """
+        Drops every scaled image and resets the counters.
+
+        Returns
+        -------
+        None
+        """
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+scaled_images = ScaledImages()
+
 class Projectile:
     """
     Represents a projectile in the game, which can be used by the 
@@ -24,13 +162,14 @@ class Projectile:
     damage : int
         The damage dealt by the projectile upon collision.
     image : pygame.Surface or None
-        The image representing the projectile. If no image is provided, 
-        defaults to None.
+        The image representing the projectile, shared through the 
+        scaled images cache. If no image is provided, defaults to None.
 
     Methods
     -------
-    update() -> None
-        Updates projectiles' attributes of speed.
+    reset(x, y, speed_x, speed_y, who, damage, width, height, image, 
+          adj) -> None
+        Gives the projectile a new shot, reusing its rect.
     draw(screen, camera) -> None
         Draws projectiles.
     """
@@ -78,37 +217,41 @@ class Projectile:
         """
         self.TAG = "Projectile"
         self.rect = pygame.Rect(x, y, width, height) 
+        self.reset(
+            x, y, speed_x, speed_y, who, damage, width, height, image, adj
+        )
+
+    def reset(
+        self, x: float, y: float, speed_x: int, speed_y: int, who: str, 
+        damage: int, width: int, height: int, image:pygame.Surface = None, 
+        adj: float = 0
+    ) -> None:
+        """
+        Gives the projectile a new shot, moving its rect in place so a 
+        projectile from the pool is fired without building a new one.
+
+        Parameters
+        ----------
+        x, y, speed_x, speed_y, who, damage, width, height, image, adj
+            The same as when the projectile is built.
+
+        Returns
+        -------
+        None
+        """
+        self.rect.update(x, y, width, height)
         self.speed_x = speed_x  
         self.speed_y = speed_y
         self.who = who
         self.damage = damage
 
         if image != None:
-            self.image = pygame.transform.scale(
+            self.image = scaled_images.scale(
                 image, (width + adj, height + adj)
             )
         else:
             self.image = None
 
-    def update(self) -> None:
-        """    
-        This method is responsible for updating the movement of all
-        projectiles shot.
-
-        Parameters
-        ----------
-        None 
-
-        Returns
-        -------
-        None
-            This method does not return any value. It modifies the 
-            current attributes of projectiles.
-
-        """
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-
     def draw(self, screen: pygame.Surface, camera: "Camera") -> None:
         """
         Draws the projectiles, adjusting their positions 
@@ -128,11 +271,11 @@ class Projectile:
             the screen by drawing sprites.
         """
 
-        self.rect.x -= camera.position_x
+        rect = camera.apply(self.rect)
         if self.image != None:
-            screen.blit(self.image, self.rect)
+            screen.blit(self.image, rect)
         else:
-            pygame.draw.rect(screen, self.color, self.rect) 
+            pygame.draw.rect(screen, self.color, rect) 
 
 class Shield:
     """
@@ -188,23 +331,25 @@ class Shield:
         self.rect = pygame.Rect(x, y, self.width, self.height) 
     
     def reflect(
-        self, user: "Player", other: "Monster", list1: list, list2: list
+        self, user: "Player", index: int, list1: list, list2: list
     ) -> None:
         """
-        Reflects a projectile upon collision with the shield by 
-        reversing its horizontal speed and flipping its sprite. The 
-        projectile is then added to the Player's projectile list and 
-        removed from the original owner's list.
+        Reflects a projectile that hit the shield by reversing its 
+        horizontal speed and mirroring its sprite, taken from 
+        `scaled_images`. The projectile is 
+        then added to the Player's projectile list and removed from the 
+        original owner's list.
 
         Parameters
         ----------
         user : Player
             The Player using the shield.
-        projectile : Projectile
-            The projectile that collides with the shield.
-        player_projectiles : list
+        index : int
+            Where the projectile is in the enemy's list, as found by 
+            `ProjectileSystem.hits`.
+        list1 : list
             The list of the Player's projectiles.
-        enemy_projectiles : list
+        list2 : list
             The list of the enemy's projectiles.
 
         Returns
@@ -214,12 +359,11 @@ class Shield:
             the projectile lists.
    
         """
-        if other.TAG == "Projectile" and self.rect.colliderect(other.rect):
-            other.speed_x = -other.speed_x
-            other.image = pygame.transform.flip(other.image, True, False)
-            other.who = user
-            list1.append(other)
-            list2.remove(other)
+        other = projectile_system.take(list2, index)
+        other.speed_x = -other.speed_x
+        other.image = scaled_images.flip(other.image)
+        other.who = user
+        list1.append(other)
 
     def update(self, x: float, y: float) -> None:
         """
@@ -291,4 +435,278 @@ class Attack:
         """
         self.TAG = "Attack"
         self.rect = pygame.Rect(x, y, width, height)
-        self.damage = damage    
\ No newline at end of file
+        self.damage = damage
+
+
+class ProjectileSystem:
+    """
+    Pool of the projectiles of every shooter. The projectiles are built 
+    ahead of time and reused: firing takes a free one, and one that 
+    hits something or leaves the screen is given back. Each shooter 
+    keeps its projectiles in its own list, which the system moves, 
+    culls and empties. Hits, culling and drawing are done for a whole 
+    list at once, with the loops over the rects inside pygame.
+
+    Attributes
+    ----------
+    TAG : str
+        Identifier tag for the system.
+    free : list
+        Projectiles ready to be fired.
+    allocated : int
+        Projectiles built because the pool was empty.
+
+    Methods
+    -------
+    fire(projectiles, x, y, speed_x, speed_y, who, damage, width, 
+         height, image, adj) -> Projectile
+        Fires a projectile from the pool into a list.
+    update(projectiles) -> None
+        Moves the projectiles of a list.
+    take(projectiles, index) -> Projectile
+        Removes a projectile from a list without giving it back.
+    release(projectiles, index) -> None
+        Removes a projectile from a list and gives it back to the pool.
+    rects(projectiles) -> list[pygame.Rect]
+        Returns the rects of a list, in its order.
+    hits(projectiles, rect) -> list[int]
+        Returns where the projectiles touching a rect are in a list.
+    release_all(projectiles, indexes) -> None
+        Gives back the projectiles at some places of a list.
+    cull(projectiles, view) -> None
+        Gives back the projectiles out of an area.
+    clear(projectiles) -> None
+        Gives back every projectile of a list.
+    draw(projectiles, screen, camera) -> None
+        Draws the projectiles of a list.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Builds the projectiles of the pool.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of projectiles built ahead of time.
+
+        Returns
+        -------
+        None
+        """
+        self.TAG = "ProjectileSystem"
+        self.free = [
+            Projectile(0, 0, 0, 0, "", 0, 0, 0) for _ in range(capacity)
+        ]
+        self.allocated = 0
+
+    def fire(
+        self, projectiles: list, x: float, y: float, speed_x: int, 
+        speed_y: int, who: str, damage: int, width: int, height: int, 
+        image: pygame.Surface = None, adj: float = 0
+    ) -> Projectile:
+        """
+        Fires a projectile from the pool, or a new one if the pool is 
+        empty, and adds it to the list of its shooter.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of the shooter.
+        x, y, speed_x, speed_y, who, damage, width, height, image, adj
+            The same as when a projectile is built.
+
+        Returns
+        -------
+        Projectile
+            The projectile fired.
+        """
+        args = (x, y, speed_x, speed_y, who, damage, width, height, image, adj)
+        if self.free:
+            projectile = self.free.pop()
+            projectile.reset(*args)
+        else:
+            projectile = Projectile(*args)
+            self.allocated += 1
+        projectiles.append(projectile)
+        return projectile
+
+    def update(self, projectiles: list) -> None:
+        """
+        Moves the projectiles of a list by their speed.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of a shooter.
+
+        Returns
+        -------
+        None
+        """
+        for projectile in projectiles:
+            projectile.rect.move_ip(projectile.speed_x, projectile.speed_y)
+
+    def take(self, projectiles: list, index: int) -> Projectile:
+        """
+        Removes a projectile from a list by moving the last one into 
+        its place, so the list does not shift. Lists changed while they 
+        are walked must be walked backwards.
+
+        Parameters
+        ----------
+        projectiles : list
+            The list that holds the projectile.
+        index : int
+            Where the projectile is in the list.
+
+        Returns
+        -------
+        Projectile
+            The projectile removed.
+        """
+        projectile = projectiles[index]
+        projectiles[index] = projectiles[-1]
+        projectiles.pop()
+        return projectile
+
+    def release(self, projectiles: list, index: int) -> None:
+        """
+        Removes a projectile from a list and gives it back to the pool.
+
+        Parameters
+        ----------
+        projectiles : list
+            The list that holds the projectile.
+        index : int
+            Where the projectile that hit something is in the list.
+
+        Returns
+        -------
+        None
+        """
+        self.free.append(self.take(projectiles, index))
+
+    def rects(self, projectiles: list) -> list[pygame.Rect]:
+        """
+        Returns the rects of the projectiles of a list, which pygame 
+        tests much faster than the projectiles themselves.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of a shooter.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The rect of each projectile, in the order of the list.
+        """
+        return [projectile.rect for projectile in projectiles]
+
+    def hits(self, projectiles: list, rect: pygame.Rect) -> list[int]:
+        """
+        Returns where the projectiles touching a rect are in a list.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of a shooter.
+        rect : pygame.Rect
+            The rect of what they may hit.
+
+        Returns
+        -------
+        list[int]
+            Indexes of the projectiles, from the first to the last.
+        """
+        if not projectiles:
+            return []
+        return rect.collidelistall(self.rects(projectiles))
+
+    def release_all(self, projectiles: list, indexes: list[int]) -> None:
+        """
+        Gives back the projectiles at some places of a list, from the 
+        last to the first, so each one is removed as when the list is 
+        walked backwards.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of a shooter.
+        indexes : list[int]
+            Places of the projectiles, from the first to the last.
+
+        Returns
+        -------
+        None
+        """
+        for index in reversed(indexes):
+            self.release(projectiles, index)
+
+    def cull(self, projectiles: list, view: pygame.Rect) -> None:
+        """
+        Gives back the projectiles that are out of an area.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of a shooter.
+        view : pygame.Rect
+            The area of the world on the screen.
+
+        Returns
+        -------
+        None
+        """
+        inside = self.hits(projectiles, view)
+        if len(inside) < len(projectiles):
+            inside = set(inside)
+            self.release_all(projectiles, [
+                index for index in range(len(projectiles)) 
+                if index not in inside
+            ])
+
+    def clear(self, projectiles: list) -> None:
+        """
+        Gives back every projectile of a list, like the ones of a dead 
+        shooter.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of a shooter.
+
+        Returns
+        -------
+        None
+        """
+        self.free.extend(projectiles)
+        projectiles.clear()
+
+    def draw(
+        self, projectiles: list, screen: pygame.Surface, camera: "Camera"
+    ) -> None:
+        """
+        Draws the projectiles of a list with a single call to pygame.
+
+        Parameters
+        ----------
+        projectiles : list
+            The projectiles of a shooter, each one with an image.
+        screen : pygame.Surface
+            The surface where the projectiles will be drawn.
+        camera : Camera
+            The camera object, used to move the projectiles from the 
+            world to the screen.
+
+        Returns
+        -------
+        None
+        """
+        screen.blits([
+            (projectile.image, camera.apply(projectile.rect)) 
+            for projectile in projectiles
+        ], False)
+
+projectile_system = ProjectileSystem()
@@ -0,0 +1,60 @@
+import pygame
+import unittest
+import tempfile
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.atlas import AtlasBuilder, TextureAtlas, frame_key, assets_directory
+
+class Test_Atlas(unittest.TestCase):
+
+    def setUp(self):
+
+        self.path = os.path.join(assets_directory, "Ground", "Ground_01.png")
+        self.builder = AtlasBuilder(page_size=100)
+        colors = [(255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 60)]
+        for i, size in enumerate([(60, 40), (50, 30), (30, 70)] * 2):
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(colors[i % 3])
+            key = frame_key(self.path, (i, 0, 1, 1), size)
+            self.builder.record(key, surface)
+
+    #frames must fit their page and never overlap
+
+    def test_pack(self):
+
+        places, pages = self.builder.pack()
+
+        self.assertEqual(len(places), 6)
+        rects = []
+        for page, x, y, width, height in places.values():
+            rect = pygame.Rect(x, y, width, height)
+            self.assertTrue(rect.right <= pages[page][0])
+            self.assertTrue(rect.bottom <= pages[page][1])
+            for other_page, other in rects:
+                if other_page == page:
+                    self.assertFalse(rect.colliderect(other))
+            rects.append((page, rect))
+
+    #frames read back from the saved atlas keep their pixels
+
+    def test_save_and_load(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.builder.save(directory)
+            atlas = TextureAtlas(directory)
+
+            for key, surface in self.builder.frames.items():
+                frame = atlas.frame(key)
+                self.assertEqual(frame.get_size(), surface.get_size())
+                self.assertEqual(frame.get_at((5, 5)), surface.get_at((5, 5)))
+            self.assertIsNone(atlas.frame("missing"))
+            self.assertEqual(atlas.misses, 1)
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1000, 1000))
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import io
+import sys, os
+from contextlib import redirect_stderr
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from benchmarks.frame_pipeline import (
+    percentiles, regressions, run, phases, parse_args
+)
+from benchmarks.scenarios import Crowd, scenarios
+from benchmarks.startup import measure
+
+class Test_Frame_Pipeline(unittest.TestCase):
+
+    #the stats are taken by the nearest rank, in milliseconds
+
+    def test_percentiles(self):
+
+        stats = percentiles([i / 1000 for i in range(1, 101)])
+        self.assertEqual(
+            stats, {"p50": 50.0, "p95": 95.0, "p99": 99.0, "mean": 50.5}
+        )
+        self.assertEqual(percentiles([0.002])["p99"], 2.0)
+        self.assertEqual(percentiles([])["p50"], 0.0)
+
+    #a scenario slower than the threshold allows is reported
+
+    def test_regressions(self):
+
+        def results(**times):
+            return {"scenarios": {
+                name: {"frame": {"p95": time}} for name, time in times.items()
+            }}
+
+        baseline = results(walk_map=10.0, crowd=20.0)
+        found = regressions(
+            results(walk_map=12.4, crowd=26.0, new=99.0), baseline, 0.25
+        )
+        self.assertEqual(len(found), 1)
+        self.assertTrue(found[0].startswith("crowd: p95 26.00 ms"))
+        self.assertEqual(
+            regressions(results(walk_map=12.6), baseline, 0.3), []
+        )
+
+    #the counts of the scenarios must be at least 1
+
+    def test_parse_args(self):
+
+        args = parse_args(["--enemies", "3", "--frames", "10"])
+        self.assertEqual((args.enemies, args.frames), (3, 10))
+        for option in ("--enemies", "--frames", "--projectiles"):
+            for value in ("0", "-2", "many"):
+                with self.assertRaises(SystemExit):
+                    with redirect_stderr(io.StringIO()):
+                        parse_args([option, value])
+
+    #each phase of each frame of a scenario is timed
+
+    def test_run(self):
+
+        self.assertEqual(
+            list(scenarios()),
+            [
+                "walk_map", "ganon_volley", "balrog_lightning", "crowd", 
+                "bullet_storm"
+            ]
+        )
+        result = run(Crowd(2), frames=5)
+        self.assertEqual(result["frames"], 5)
+        self.assertEqual(list(result["phases"]), list(phases))
+        self.assertGreater(result["frame"]["p50"], 0)
+        self.assertGreaterEqual(
+            result["frame"]["p99"], result["phases"]["draw"]["p99"]
+        )
+
+    #the characters are loaded from the files in a process of their own
+
+    def test_startup(self):
+
+        self.assertGreater(measure("png", 1), 0)
+
+if __name__ == "__main__":
+    unittest.main()
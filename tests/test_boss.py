@@ -10,7 +10,7 @@ from src.player import Player
 from src.player import Knight, Yokai, Ninja
 from src.enemy import Mage, Flying, Dummy
 from src.weapon import Projectile, Shield, Attack
-from src.boss import Balrog, Ganon, Demagorgon
+from src.boss import Balrog, Ganon, Demagorgon, BossRoster
 from src.ground import Ground
 
 #auxiliary function used to simulate that certain keys have been pressed
@@ -274,6 +274,60 @@ class Test_Dead(unittest.TestCase):
             self.assertTrue(self.Ganon.is_dead)
             self.assertTrue(self.Balrog.is_dead)
 
+class Test_Boss_Roster(unittest.TestCase):
+
+    def setUp(self):
+
+        self.player = Knight(500, 500, 40, 70)
+        self.roster = BossRoster([
+            (Ganon, (1100, 500, 150, 220)),
+            (Balrog, (1000, 100, 140, 180)),
+        ])
+        if self.roster.prefetch is not None:
+            self.roster.prefetch.join()
+
+    #bosses are only built by prepare, one per call
+
+    def test_prepare(self):
+
+        self.assertEqual(len(self.roster.ready), 0)
+        self.roster.prepare(self.player)
+        self.assertEqual(len(self.roster.ready), 1)
+        self.assertEqual(self.roster.ready[0].sub_TAG, "Ganon")
+        for _ in range(5):
+            self.roster.prepare(self.player)
+        self.assertEqual(len(self.roster.ready), 2)
+        self.assertEqual(len(self.roster), 2)
+
+    #pop keeps the spawn order, with or without prepare
+
+    def test_pop(self):
+
+        self.roster.prepare(self.player)
+        ganon = self.roster.pop(self.player)
+        balrog = self.roster.pop(self.player)
+
+        self.assertEqual(ganon.sub_TAG, "Ganon")
+        self.assertEqual(balrog.sub_TAG, "Balrog")
+        self.assertIs(balrog.hero, self.player)
+        self.assertEqual(len(self.roster), 0)
+
+    #the bosses and their attack zones are moved into the arena
+
+    def test_arena(self):
+
+        self.roster.prepare(self.player)
+        ganon = self.roster.pop(self.player, 6600)
+        balrog = self.roster.pop(self.player, 6600)
+
+        self.assertEqual(ganon.rect.x, 7700)
+        self.assertEqual(balrog.rect.x, 7600)
+        self.assertEqual(balrog.all_atks[0].rect.x, 6600)
+        balrog.atk_cooldown = balrog.warning_sign
+        balrog.attack()
+        self.assertGreater(balrog.rect.x, 6600)
+        self.assertLess(balrog.rect.x, 6600 + balrog.screen_width)
+
 if __name__ == "__main__":
     pygame.init()
     pygame.display.set_mode((1000, 1000))  
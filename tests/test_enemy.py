@@ -9,8 +9,9 @@ sys.path.append(src_path)
 from src.player import Player
 from src.player import Knight, Yokai, Ninja
 from src.enemy import Mage, Flying, Dummy
-from src.weapon import Projectile, Shield, Attack
+from src.weapon import Projectile, Shield, Attack, projectile_system
 from src.ground import Ground
+from src.camera import Camera, Culling
 
 class Test_enemy(unittest.TestCase):
 
@@ -142,6 +143,100 @@ class Test_enemy(unittest.TestCase):
         self.assertTrue(self.dummy.is_dead)
         self.assertTrue(self.flying.is_dead)
 
+class Test_Camera(unittest.TestCase):
+
+    def setUp(self):
+
+        self.player = Yokai(0 ,0, 40, 70)
+        self.camera = Camera(1000)
+        self.camera.boss_x = 3000
+        self.main = type("Main", (), {"is_changed": False})()
+
+    #the camera follows the hero without moving the world
+
+    def test_follow(self):
+
+        self.player.rect.centerx = 300
+        self.camera.update_coods(self.player, self.main)
+        self.assertEqual(self.camera.position_x, 0)
+
+        self.player.rect.centerx = 1800
+        self.camera.update_coods(self.player, self.main)
+        self.assertEqual(self.camera.position_x, 1300)
+        self.assertEqual(self.player.rect.centerx, 1800)
+        self.assertEqual(self.camera.apply(self.player.rect).centerx, 500)
+
+        self.player.rect.centerx = 1500
+        self.camera.update_coods(self.player, self.main)
+        self.assertEqual(self.camera.position_x, 1000)
+
+    #the camera stops once it reaches the boss arena
+
+    def test_boss_fase(self):
+
+        self.player.rect.centerx = 3600
+        self.camera.update_coods(self.player, self.main)
+        self.camera.update_coods(self.player, self.main)
+        self.assertTrue(self.camera.boss_fase)
+        self.assertTrue(self.main.is_changed)
+
+        self.player.rect.centerx = 5000
+        self.camera.update_coods(self.player, self.main)
+        self.assertEqual(self.camera.position_x, 3100)
+
+class Test_Culling(unittest.TestCase):
+
+    def setUp(self):
+
+        self.player = Yokai(0 ,0, 40, 70)
+        self.camera = Camera(1000)
+        self.culling = Culling(pygame.Rect(0, 0, 1000, 800), 100, 500)
+
+    #monsters out of the screen are not drawn, far ones also sleep
+
+    def test_areas(self):
+
+        near = Dummy(1050, 0, 50, 80, self.player)
+        out = Dummy(1300, 0, 50, 80, self.player)
+        far = Dummy(2000, 0, 50, 80, self.player)
+
+        self.assertTrue(self.culling.visible(near))
+        self.assertFalse(self.culling.visible(out))
+        self.assertTrue(self.culling.awake(out))
+        self.assertFalse(self.culling.awake(far))
+        far.life = 0
+        self.assertTrue(self.culling.awake(far))
+        self.culling.sleep = False
+        self.assertTrue(self.culling.awake(Dummy(9000, 0, 50, 80, self.player)))
+
+    #a culled monster keeps its projectiles on the screen, in world coordinates
+
+    def test_scroll(self):
+
+        mage = Mage(1200, 0, 80, 150, self.player)
+        image = pygame.Surface((50, 30))
+        mage.projectiles = [
+            Projectile(990, 100, -20, 0, "Monster", 10, 50, 30, image),
+            Projectile(1300, 100, -20, 0, "Monster", 10, 50, 30, image),
+        ]
+        self.camera.position_x = 30
+        mage.scroll(pygame.Surface((1000, 800)), self.camera)
+        projectile_system.cull(mage.projectiles, pygame.Rect(30, 0, 1000, 800))
+
+        self.assertEqual(mage.rect.x, 1200)
+        self.assertEqual(len(mage.projectiles), 1)
+        self.assertEqual(mage.projectiles[0].rect.x, 990)
+
+    #the areas follow the camera through the world
+
+    def test_follow(self):
+
+        out = Dummy(1300, 0, 50, 80, self.player)
+        self.camera.position_x = 400
+        self.culling.follow(self.camera)
+        self.assertTrue(self.culling.visible(out))
+        self.assertFalse(self.culling.visible(Dummy(200, 0, 50, 80, self.player)))
+
 if __name__ == "__main__":
     pygame.init()
     pygame.display.set_mode((1000, 1000))  
@@ -0,0 +1,287 @@
+import pygame
+import unittest
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.ground import Ground, Block, Spike, Invisible, TileLayer, TileMap
+import src.ground as ground
+from src.camera import Camera
+from src.assets import surface_cache
+from src.snapshot import WorldSnapshot
+from src.weapon import projectile_system
+
+class Test_Surface_Cache(unittest.TestCase):
+
+    def setUp(self):
+
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        path_game = os.path.abspath(path_game)
+        ground_path = os.path.join(path_game, os.pardir, "assets", "Ground")
+        self.image_path = os.path.join(ground_path, "Ground_01.png")
+        self.spike_path = os.path.join(ground_path, "Spikes.png")
+        surface_cache.clear()
+
+    #tiles with the same image and size must share a single surface
+
+    def test_shared_surface(self):
+
+        tiles = [
+            Ground(0, 0, 50, 50, self.image_path),
+            Block(50, 0, 50, 50, self.image_path),
+            Invisible(100, 0, 50, 50, self.image_path),
+        ]
+
+        for tile in tiles:
+            self.assertIs(tile.image, tiles[0].image)
+        self.assertEqual(surface_cache.misses, 1)
+        self.assertEqual(surface_cache.hits, 2)
+
+    #a different size or file must not reuse the cached surface
+
+    def test_different_keys(self):
+
+        small = Ground(0, 0, 50, 50, self.image_path)
+        big = Ground(0, 0, 100, 50, self.image_path)
+        spike = Spike(0, 0, 50, 50, self.spike_path)
+
+        self.assertIsNot(small.image, big.image)
+        self.assertIsNot(small.image, spike.image)
+        self.assertEqual(big.image.get_size(), (100, 50))
+        self.assertEqual(surface_cache.misses, 3)
+
+    #the rect of each tile stays independent
+
+    def test_independent_rects(self):
+
+        first = Ground(0, 0, 50, 50, self.image_path)
+        second = Ground(200, 300, 50, 50, self.image_path)
+
+        self.assertEqual(first.rect.topleft, (0, 0))
+        self.assertEqual(second.rect.topleft, (200, 300))
+
+class Test_Tile_Layer(unittest.TestCase):
+
+    def setUp(self):
+
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        path_game = os.path.abspath(path_game)
+        ground_path = os.path.join(path_game, os.pardir, "assets", "Ground")
+        image_path = os.path.join(ground_path, "Ground_01.png")
+        spike_path = os.path.join(ground_path, "Spikes.png")
+        self.tiles = [
+            Ground(x, 700, 50, 50, image_path) for x in range(0, 2000, 50)
+        ]
+        self.tiles += [Spike(x, 650, 50, 50, spike_path) for x in (300, 1500)]
+        self.tiles.append(Invisible(900, 300, 50, 50, image_path))
+        self.layer = TileLayer(self.tiles, 400)
+        self.camera = Camera(400)
+
+    #the chunks look like the tiles drawn one by one
+
+    def test_same_pixels(self):
+
+        self.camera.position_x = 130
+        layer_screen = pygame.Surface((400, 800))
+        self.layer.draw(layer_screen, self.camera)
+        tiles_screen = pygame.Surface((400, 800))
+        for tile in self.tiles:
+            if tile.sub_TAG != "Invisible":
+                tiles_screen.blit(tile.image, self.camera.apply(tile.rect))
+
+        for x in range(0, 400, 7):
+            for y in (640, 660, 690, 710, 749):
+                layer_color = layer_screen.get_at((x, y))
+                tile_color = tiles_screen.get_at((x, y))
+                for a, b in zip(layer_color, tile_color):
+                    self.assertTrue(abs(a - b) <= 1)
+
+    #only the chunks on the screen are drawn, the rects stay in the world
+
+    def test_visible_chunks(self):
+
+        screen = pygame.Surface((400, 800))
+        self.layer.draw(screen, self.camera)
+        self.assertEqual(self.layer.blits, 1)
+
+        self.camera.position_x = 1000
+        self.layer.draw(screen, self.camera)
+        self.assertEqual(self.layer.blits, 2)
+        self.assertEqual(self.tiles[0].rect.x, 0)
+        self.assertEqual(self.tiles[-1].rect.x, 900)
+        self.assertEqual(len(self.layer.chunks), 5)
+
+class Test_Tile_Map(unittest.TestCase):
+
+    def setUp(self):
+
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        path_game = os.path.abspath(path_game)
+        ground_path = os.path.join(path_game, os.pardir, "assets", "Ground")
+        self.image_path = os.path.join(ground_path, "Ground_01.png")
+        spike_path = os.path.join(ground_path, "Spikes.png")
+        tiles = [
+            Ground(x, 700, 50, 50, self.image_path) for x in range(0, 500, 50)
+        ]
+        tiles.append(Spike(300, 650, 50, 50, spike_path))
+        tiles.append(Invisible(450, 300, 50, 50, self.image_path))
+        self.tilemap = TileMap(tiles)
+
+    #each cell tells the kind of its tile
+
+    def test_queries(self):
+
+        self.assertEqual(len(self.tilemap.cells), 10 * 15)
+        self.assertEqual(self.tilemap.kind_at(10, 710), "Ground")
+        self.assertEqual(self.tilemap.kind_at(470, 320), "Invisible")
+        self.assertEqual(self.tilemap.kind_at(10, 600), "")
+        self.assertEqual(self.tilemap.kind_at(-10, 710), "")
+        self.assertTrue(self.tilemap.solid_at(499, 749))
+        self.assertFalse(self.tilemap.solid_at(500, 710))
+        self.assertTrue(self.tilemap.spike_at(320, 660))
+        self.assertFalse(self.tilemap.spike_at(320, 710))
+
+        self.assertEqual(self.tilemap.ground_below(320, 0), 650)
+        self.assertEqual(self.tilemap.ground_below(20, 0), 700)
+        self.assertEqual(self.tilemap.ground_below(470, 400), 700)
+        self.assertIsNone(self.tilemap.ground_below(700, 0))
+
+    #touching tiles of the same kind become a single collider
+
+    def test_merge(self):
+
+        self.assertEqual(self.tilemap.counts(), (12, 3))
+        kinds = [tile.sub_TAG for tile in self.tilemap.colliders]
+        self.assertEqual(kinds, ["Invisible", "Spike", "Ground"])
+
+        tiles = [
+            Ground(x, y, 50, 50, self.image_path)
+            for y in (100, 150) for x in (0, 50, 100)
+        ]
+        tiles += [Ground(x, 200, 50, 50, self.image_path) for x in (0, 150)]
+        tilemap = TileMap(tiles)
+        rects = [tile.rect for tile in tilemap.colliders]
+        self.assertEqual(rects, [
+            pygame.Rect(0, 100, 150, 100), pygame.Rect(0, 200, 50, 50),
+            pygame.Rect(150, 200, 50, 50)
+        ])
+        self.assertEqual(tilemap.owners[tilemap.index(120, 160)], 0)
+        self.assertEqual(tilemap.owners[tilemap.index(20, 20)], -1)
+
+    #a block lands on the tiles, and projectiles in them are removed
+
+    def test_collision(self):
+
+        block = Block(110, 640, 61, 102, self.image_path)
+        found = list(self.tilemap.touching(block.rect))
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0].rect, pygame.Rect(0, 700, 500, 50))
+
+        block.speed_y = 20
+        block.on_collision(self.tilemap)
+        self.assertEqual(block.rect.bottom, 700)
+        self.assertEqual(block.speed_y, 0)
+
+        projectiles = []
+        for x in (100, 320, 600):
+            projectile_system.fire(
+                projectiles, x, 640, 0, 0, "Monster", 0, 20, 20, 
+                pygame.Surface((20, 20))
+            )
+        spike = projectiles[1]
+        self.tilemap.discard(projectiles)
+        self.assertEqual([p.rect.x for p in projectiles], [100, 600])
+        self.assertIs(projectile_system.free[-1], spike)
+        projectile_system.clear(projectiles)
+
+    #many rects are tested at once, with or without numpy
+
+    def test_hit(self):
+
+        rects = [
+            pygame.Rect(100, 640, 20, 20), pygame.Rect(420, 280, 70, 28),
+            pygame.Rect(-30, 700, 31, 5), pygame.Rect(-30, 700, 30, 5),
+            pygame.Rect(480, 500, 40, 60), pygame.Rect(490, 640, 50, 61),
+            pygame.Rect(300, 640, 0, 20), pygame.Rect(600, 700, 20, 20)
+        ]
+        expected = [1, 2, 5]
+        self.assertEqual(self.tilemap.hit(rects), expected)
+
+        #the same rects, as if they were many
+        self.tilemap.batch = 0
+        self.assertEqual(self.tilemap.hit(rects), expected)
+        numpy = ground.numpy
+        ground.numpy = None
+        try:
+            self.assertEqual(self.tilemap.hit(rects), expected)
+        finally:
+            ground.numpy = numpy
+        self.assertEqual(self.tilemap.hit([]), [])
+
+    #the colliders under a rect are read once for each block of cells
+
+    def test_under(self):
+
+        self.assertEqual(
+            self.tilemap.under(pygame.Rect(420, 280, 70, 450)), (0, 2)
+        )
+        self.assertEqual(self.tilemap.under(pygame.Rect(300, 640, 0, 20)), ())
+        self.assertEqual(self.tilemap.under(pygame.Rect(-80, 700, 30, 5)), ())
+        self.assertEqual(
+            self.tilemap.under(pygame.Rect(-30, 700, 31, 5)), (2,)
+        )
+        found = self.tilemap.under(pygame.Rect(310, 660, 10, 10))
+        self.assertEqual(found, (1,))
+        self.assertIs(self.tilemap.under(pygame.Rect(301, 651, 48, 48)), found)
+
+class Test_World_Snapshot(unittest.TestCase):
+
+    def setUp(self):
+
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        path_game = os.path.abspath(path_game)
+        ground_path = os.path.join(path_game, os.pardir, "assets", "Ground")
+        self.image_path = os.path.join(ground_path, "Ground_01.png")
+
+    #restoring puts moved and removed objects back in place
+
+    def test_restore(self):
+
+        world = Invisible(0, 0, 50, 50, self.image_path)
+        blocks = [Block(x, 0, 50, 50, self.image_path) for x in (0, 100)]
+        world.blocks = blocks
+        snapshot = WorldSnapshot(world)
+
+        blocks[0].rect.x += 300
+        blocks[0].is_pushing_r = True
+        blocks.pop()
+        world.blocks.append(Block(500, 0, 50, 50, self.image_path))
+        snapshot.restore()
+
+        self.assertEqual(len(world.blocks), 2)
+        self.assertIs(world.blocks[0], blocks[0])
+        self.assertEqual(world.blocks[0].rect.x, 0)
+        self.assertFalse(world.blocks[0].is_pushing_r)
+        self.assertEqual(world.blocks[1].rect.x, 100)
+        self.assertIs(world.blocks[1].image, blocks[0].image)
+
+    #the same snapshot can be restored more than once
+
+    def test_restore_twice(self):
+
+        block = Block(0, 0, 50, 50, self.image_path)
+        snapshot = WorldSnapshot(block)
+
+        for _ in range(2):
+            block.rect.y += 80
+            block.speed_y = 10
+            snapshot.restore()
+            self.assertEqual(block.rect.y, 0)
+            self.assertEqual(block.speed_y, 0)
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1000, 1000))
+    unittest.main()
@@ -0,0 +1,87 @@
+import pygame
+import unittest
+import sys, os
+from types import SimpleNamespace
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.interfaces import Menu, Pause, Tutorial
+
+class Test_Dirty_Rects(unittest.TestCase):
+
+    def setUp(self):
+
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        path_game = os.path.abspath(path_game)
+        self.screen = pygame.display.get_surface()
+        self.main = SimpleNamespace(
+            screen=self.screen,
+            assets_path=os.path.join(path_game, os.pardir, "assets"),
+            loader=SimpleNamespace(done=False, progress=0.5),
+            states={"game": SimpleNamespace(hero=SimpleNamespace(points=0))},
+        )
+
+    #a still screen is drawn once, then nothing changes
+
+    def test_still(self):
+
+        pause = Pause(self.main)
+        self.assertEqual(pause.draw(self.screen), [self.screen.get_rect()])
+        for _ in range(3):
+            self.assertEqual(pause.draw(self.screen), [])
+
+        self.main.states["game"].hero.points = 10
+        self.assertEqual(pause.draw(self.screen), [self.screen.get_rect()])
+        self.assertEqual(pause.draw(self.screen), [])
+
+        pause.is_drawn = False
+        self.assertEqual(pause.draw(self.screen), [self.screen.get_rect()])
+
+    #only the button the mouse entered or left is drawn again
+
+    def test_hover(self):
+
+        pause = Pause(self.main)
+        pause.draw(self.screen)
+        pause.b_restart.is_hover = True
+        self.assertEqual(pause.draw(self.screen), [pause.b_restart.rect])
+        self.assertFalse(pause.b_restart.is_hover)
+
+        color = self.screen.get_at(pause.b_restart.rect.center)
+        pause.is_drawn = False
+        pause.draw(self.screen)
+        self.assertEqual(self.screen.get_at(pause.b_restart.rect.center), color)
+
+    #the loading bar is drawn only when it moves
+
+    def test_menu(self):
+
+        menu = Menu(self.main)
+        self.assertEqual(menu.draw(self.screen), [self.screen.get_rect()])
+        self.assertEqual(menu.draw(self.screen), [])
+
+        self.main.loader.progress = 0.75
+        self.assertEqual(menu.draw(self.screen), [menu.load_rect])
+
+        self.main.loader.done = True
+        self.assertEqual(menu.draw(self.screen), [self.screen.get_rect()])
+        self.assertEqual(menu.draw(self.screen), [])
+
+    #the tutorial only sends the window a new image
+
+    def test_tutorial(self):
+
+        tutorial = Tutorial(self.main)
+        self.assertEqual(tutorial.draw(self.screen), [self.screen.get_rect()])
+        self.assertEqual(tutorial.draw(self.screen), [])
+
+        tutorial.is_drawn = False
+        self.assertEqual(tutorial.draw(self.screen), [self.screen.get_rect()])
+        self.assertEqual(tutorial.idx_image, 1)
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1400, 800))
+    unittest.main()
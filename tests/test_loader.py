@@ -0,0 +1,70 @@
+import pygame
+import unittest
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.loader import AssetLoader
+from src.assets import surface_cache
+
+class Test_Asset_Loader(unittest.TestCase):
+
+    def setUp(self):
+
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        path_game = os.path.abspath(path_game)
+        self.assets_path = os.path.join(path_game, os.pardir, "assets")
+        ground_path = os.path.join(self.assets_path, "Ground")
+        self.paths = [
+            os.path.join(ground_path, "Ground_01.png"),
+            os.path.join(ground_path, "Spikes.png")
+        ]
+        surface_cache.clear()
+
+    #objects are only built after every file is decoded
+
+    def test_steps(self):
+
+        loader = AssetLoader(self.paths)
+        loader.add("ground", lambda: surface_cache.load(self.paths[0]))
+        self.assertFalse(loader.done)
+
+        for thread in loader.threads:
+            thread.join()
+        self.assertEqual(loader.progress, 2/3)
+        name, image = loader.step()
+
+        self.assertEqual(name, "ground")
+        self.assertIsInstance(image, pygame.Surface)
+        self.assertTrue(loader.done)
+        self.assertEqual(loader.progress, 1)
+        self.assertIsNone(loader.step())
+
+    #decoded files that were not used are dropped at the end
+
+    def test_discard(self):
+
+        loader = AssetLoader(self.paths)
+        loader.add("ground", lambda: surface_cache.load(self.paths[0]))
+        results = loader.finish()
+
+        self.assertEqual([name for name, _ in results], ["ground"])
+        self.assertEqual(surface_cache.decoded, {})
+
+    #only png files of the requested folders are listed
+
+    def test_find_images(self):
+
+        paths = AssetLoader.find_images(self.assets_path, ["Heart"])
+
+        self.assertTrue(len(paths) > 0)
+        for path in paths:
+            self.assertTrue(path.endswith(".png"))
+            self.assertIn("Heart", path)
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1000, 1000))
+    unittest.main()
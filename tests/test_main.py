@@ -0,0 +1,44 @@
+import pygame
+import unittest
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.main import Main, parse_args
+from src.assets import surface_cache
+
+class Test_Headless(unittest.TestCase):
+
+    def tearDown(self):
+
+        surface_cache.convert = True
+
+    #the options of the command line choose the headless mode
+
+    def test_args(self):
+
+        args = parse_args([])
+        self.assertFalse(args.headless)
+        self.assertEqual(args.frames, 1000)
+        args = parse_args(["--headless", "--frames", "50"])
+        self.assertTrue(args.headless)
+        self.assertEqual(args.frames, 50)
+
+    #the game is stepped without a screen and without drawing
+
+    def test_simulate(self):
+
+        game = Main(headless=True)
+        self.assertEqual(pygame.display.get_driver(), "dummy")
+        self.assertFalse(surface_cache.convert)
+
+        steps, rate = game.simulate(60)
+        self.assertEqual(steps, 60)
+        self.assertGreater(rate, 0)
+        self.assertIs(game.current_state, game.states["game"])
+        self.assertFalse(game.states["game"].is_drawn)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import pygame
+import unittest
+import threading
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.music import MusicManager
+
+class Test_Music_Manager(unittest.TestCase):
+
+    def setUp(self):
+
+        path_game = os.path.dirname(os.path.abspath(sys.argv[0]))
+        path_game = os.path.abspath(path_game)
+        music_path = os.path.join(path_game, os.pardir, "assets", "Music")
+        self.manager = MusicManager(music_path, fade_frames=4, seed=1)
+
+    def wait_read(self, path):
+
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread() and thread.daemon:
+                thread.join()
+        self.assertIn(path, self.manager.data)
+
+    #only the files that exist can be picked
+
+    def test_tracks(self):
+
+        for category, tracks in self.manager.tracks.items():
+            for path in tracks:
+                self.assertTrue(os.path.exists(path))
+        for _ in range(20):
+            path = self.manager.choose("World")
+            self.assertIn(path, self.manager.tracks["World"])
+            self.manager.upcoming.clear()
+        self.assertIsNone(self.manager.choose("Missing"))
+
+    #the prefetched track is the one played next
+
+    def test_prefetch(self):
+
+        self.manager.prefetch("Boss")
+        path = self.manager.upcoming["Boss"]
+        self.wait_read(path)
+
+        self.manager.play("Boss", 0.5)
+        self.assertEqual(self.manager.pending, path)
+        self.manager.update()
+        self.assertEqual(self.manager.current, path)
+        self.assertEqual(len(self.manager.stalls), 1)
+
+    #the old track fades out before the new one fades in
+
+    def test_fade(self):
+
+        self.manager.play("Menu", 0.5)
+        self.wait_read(self.manager.pending)
+        for _ in range(5):
+            self.manager.update()
+        self.assertEqual(self.manager.level, 1)
+
+        self.manager.play("Over", 0.5)
+        self.wait_read(self.manager.pending)
+        levels = []
+        for _ in range(10):
+            self.manager.update()
+            levels.append(self.manager.level)
+        self.assertEqual(levels[:5], [0.75, 0.5, 0.25, 0, 0])
+        self.assertEqual(levels[5:9], [0.25, 0.5, 0.75, 1])
+        self.assertIn(self.manager.current, self.manager.tracks["Over"])
+        self.assertEqual(self.manager.report()["transitions"], 2)
+
+if __name__ == "__main__":
+    pygame.init()
+    unittest.main()
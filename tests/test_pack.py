@@ -0,0 +1,71 @@
+import pygame
+import unittest
+import tempfile
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.pack import AssetPack, PackBuilder, content_hash
+
+class Test_Pack(unittest.TestCase):
+
+    def setUp(self):
+
+        self.builder = PackBuilder()
+        colors = [(255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 60)]
+        for i, size in enumerate([(60, 40), (50, 30), (31, 70)]):
+            surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            surface.fill(colors[i])
+            surface.set_at((3, 2), (10, 20, 30, 40))
+            self.builder.record(f"frame_{i}", surface)
+
+    #frames read back from the pack keep their size, pixels and format
+
+    def test_save_and_load(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.pack")
+            self.builder.save(path, "hash")
+            pack = AssetPack(path)
+
+            self.assertEqual(pack.hash, "hash")
+            for key, surface in self.builder.frames.items():
+                frame = pack.frame(key)
+                self.assertEqual(frame.get_size(), surface.get_size())
+                self.assertEqual(frame.get_masks(), surface.get_masks())
+                self.assertEqual(frame.get_at((3, 2)), (10, 20, 30, 40))
+                self.assertEqual(frame.get_at((9, 9)), surface.get_at((9, 9)))
+            self.assertIsNone(pack.frame("missing"))
+            self.assertEqual(pack.hits, 3)
+            del frame
+
+    #a file that is not a pack is refused
+
+    def test_not_a_pack(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.pack")
+            with open(path, "wb") as file:
+                file.write(b"not a pack at all")
+            with self.assertRaises(ValueError):
+                AssetPack(path)
+
+    #the hash follows the content of the png files
+
+    def test_content_hash(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "image.png")
+            pygame.image.save(self.builder.frames["frame_0"], path)
+            first = content_hash(directory)
+            self.assertEqual(content_hash(directory), first)
+
+            pygame.image.save(self.builder.frames["frame_1"], path)
+            self.assertNotEqual(content_hash(directory), first)
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1000, 1000))
+    unittest.main()
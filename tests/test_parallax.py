@@ -0,0 +1,71 @@
+import pygame
+import unittest
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.parallax import Parallax, ParallaxLayer
+
+class Test_Parallax(unittest.TestCase):
+
+    def setUp(self):
+
+        back = pygame.Surface((200, 100))
+        back.fill((0, 0, 255))
+        pygame.draw.rect(back, (255, 255, 0), (0, 0, 20, 100))
+        front = pygame.Surface((200, 100), pygame.SRCALPHA)
+        pygame.draw.rect(front, (255, 0, 0, 128), (50, 0, 30, 100))
+        self.layers = [ParallaxLayer(back, True), ParallaxLayer(front)]
+        self.screen = pygame.Surface((200, 100))
+
+    #at most two copies of a layer are drawn, wherever it is
+
+    def test_wrap(self):
+
+        for x in (-2000, -450, -200, -1, 0, 37, 199, 5000):
+            self.assertTrue(self.layers[0].draw(self.screen, x) <= 2)
+            left = self.layers[0].wrap(x)
+            self.assertTrue(-200 < left <= 0)
+            self.assertEqual((left - x) % 200, 0)
+
+        self.layers[0].draw(self.screen, -450)
+        self.assertEqual(self.screen.get_at((150, 50)), (255, 255, 0, 255))
+
+    #the flattened layers look like the layers drawn one by one
+
+    def test_flatten(self):
+
+        parallax = Parallax(self.layers)
+        direct = pygame.Surface((200, 100))
+        for layer, x in zip(self.layers, (-70, 45)):
+            layer.draw(direct, x)
+
+        for _ in range(2):
+            parallax.draw(self.screen, [-70, 45])
+        self.assertIsNotNone(parallax.flat)
+        self.assertEqual(parallax.blits, 2)
+        for x in range(0, 200, 5):
+            color = self.screen.get_at((x, 50))
+            self.assertEqual(color, direct.get_at((x, 50)))
+
+        parallax.draw(self.screen, [-71, 40])
+        self.assertEqual(parallax.blits, 4)
+
+    #nothing is drawn out of the given area
+
+    def test_area(self):
+
+        self.screen.fill((0, 0, 0))
+        parallax = Parallax(self.layers, False)
+        parallax.draw(self.screen, [0, 0], pygame.Rect(0, 0, 100, 100))
+
+        self.assertEqual(self.screen.get_at((150, 50)), (0, 0, 0, 255))
+        self.assertEqual(self.screen.get_at((10, 50)), (255, 255, 0, 255))
+        self.assertEqual(self.screen.get_clip(), self.screen.get_rect())
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1000, 1000))
+    unittest.main()
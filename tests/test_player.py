@@ -11,6 +11,8 @@ from src.player import Knight, Yokai, Ninja
 from src.enemy import Mage, Flying, Dummy
 from src.weapon import Projectile, Shield, Attack
 from src.ground import Ground
+from src.assets import MirroredFrames, mirror_store
+from src.assets import Herolife, Bar, Bosslife, Hud
 
 #auxiliary function used to simulate that certain keys have been pressed
 
@@ -305,6 +307,109 @@ class TestDead(unittest.TestCase):
 
         self.assertEqual(self.player.action, "Death")
 
+class TestMirroredFrames(unittest.TestCase):
+
+    def setUp(self):
+        mirror_store.clear()
+        self.player = Knight(0, 0, 40, 70)
+        self.frames = self.player.images["KWalk"]
+
+    #both directions are indexed as before, one of them mirrored
+
+    def test_directions(self):
+        half = len(self.frames) // 2
+
+        self.assertIsInstance(self.frames, MirroredFrames)
+        for i in range(half):
+            left = self.frames[i]
+            right = self.frames[i + half]
+            flipped = pygame.transform.flip(right, True, False)
+            self.assertEqual(left.get_size(), right.get_size())
+            self.assertEqual(
+                pygame.image.tobytes(left, "RGBA"),
+                pygame.image.tobytes(flipped, "RGBA")
+            )
+        with self.assertRaises(IndexError):
+            self.frames[len(self.frames)]
+
+    #only one direction is stored, the other is shared by the store
+
+    def test_saved(self):
+        stored = self.frames.halves[0][1]
+
+        self.assertIs(self.frames.halves[1][1], stored)
+        self.assertTrue(mirror_store.report()["Knight"] > 0)
+        self.assertIs(self.frames[0], self.frames[0])
+        self.assertEqual(mirror_store.misses, 1)
+        self.assertEqual(mirror_store.hits, 1)
+
+    #the least recently used mirrored frames are dropped
+
+    def test_bounded(self):
+        mirror_store.max_size = 1
+        try:
+            self.frames[0]
+            self.frames[1]
+            self.assertEqual(len(mirror_store.surfaces), 1)
+            self.assertIn(self.frames.halves[0][0][1], mirror_store.surfaces)
+        finally:
+            mirror_store.max_size = 32 * 2**20
+
+class TestHud(unittest.TestCase):
+
+    def setUp(self):
+
+        self.hero = Knight(0, 0, 40, 70)
+        self.life = Herolife(self.hero, 400, 50, 15, 40, 40, 20)
+        self.timer = Bar(
+            60, 20, 70, 240, 20, (255, 255, 255), (160, 32, 240)
+        )
+        self.boss = Bosslife(
+            1000, 200, 750, 1000, 40, (0, 255, 0), (255, 0, 0)
+        )
+        self.hud = Hud()
+        self.screen = pygame.Surface((1400, 800))
+
+    #only the widgets whose state changed are drawn again
+
+    def test_dirty(self):
+
+        widgets = [self.life, self.timer, self.boss]
+        self.life.update(self.hero)
+        self.hud.draw(self.screen, widgets)
+        self.assertEqual(self.hud.dirty, 3)
+        self.hud.draw(self.screen, widgets)
+        self.assertEqual(self.hud.dirty, 0)
+
+        self.hero.life -= 150
+        self.life.update(self.hero)
+        self.boss.update(900)
+        self.hud.draw(self.screen, widgets)
+        self.assertEqual(self.hud.dirty, 2)
+        self.hud.draw(self.screen, widgets[:2])
+        self.assertEqual(len(self.hud.cache), 2)
+
+    #the cached widgets look like the widgets drawn on the screen
+
+    def test_same_pixels(self):
+
+        self.hero.life -= 500
+        self.life.update(self.hero)
+        self.timer.update(20)
+        self.boss.update(600)
+        widgets = [self.life, self.timer, self.boss]
+        expected = pygame.Surface((1400, 800))
+        expected.fill((30, 60, 90))
+        self.screen.fill((30, 60, 90))
+        for widget in widgets:
+            widget.draw(expected)
+        self.hud.draw(self.screen, widgets)
+
+        for x in range(0, 1400, 9):
+            for y in (20, 35, 75, 760, 785):
+                color = self.screen.get_at((x, y))
+                self.assertEqual(color, expected.get_at((x, y)))
+
 if __name__ == "__main__":
     pygame.init()
     pygame.display.set_mode((1000, 1000))  
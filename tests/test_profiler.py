@@ -0,0 +1,71 @@
+import pygame
+import unittest
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.profiler import FrameProfiler
+
+class Test_Frame_Profiler(unittest.TestCase):
+
+    def setUp(self):
+
+        self.profiler = FrameProfiler(4)
+
+    def play(self, frames):
+
+        for _ in range(frames):
+            self.profiler.start()
+            for phase in FrameProfiler.phases:
+                self.profiler.mark(phase)
+            self.profiler.end_frame()
+
+    #nothing is timed while the profiler is off
+
+    def test_disabled(self):
+
+        self.play(3)
+        self.assertEqual(self.profiler.count, 0)
+        self.assertEqual(sum(self.profiler.times), 0)
+        self.assertEqual(self.profiler.counters()["mean"], 0)
+
+    #the newest frames replace the oldest ones in the buffer
+
+    def test_ring(self):
+
+        self.profiler.toggle()
+        self.play(6)
+        self.assertEqual(self.profiler.count, 4)
+        self.assertEqual(self.profiler.index, 2)
+
+        newest = (self.profiler.index - 1) * len(FrameProfiler.phases)
+        self.profiler.times[newest + 2] = 0.5
+        self.assertEqual(self.profiler.frame(0)[2], 0.5)
+        counters = self.profiler.counters()
+        self.assertGreaterEqual(counters["phases"]["update"], 125)
+        self.assertGreaterEqual(counters["max"], 500)
+        self.assertGreater(counters["fps"], 0)
+
+        self.profiler.toggle()
+        self.play(2)
+        self.assertEqual(self.profiler.index, 2)
+        self.profiler.toggle()
+        self.assertEqual(self.profiler.count, 0)
+
+    #the overlay is drawn in the top right corner
+
+    def test_draw(self):
+
+        screen = pygame.Surface((1400, 800))
+        self.profiler.toggle()
+        self.play(4)
+        area = self.profiler.draw(screen)
+        self.assertEqual(area.topright, (1390, 10))
+        self.assertTrue(screen.get_rect().contains(area))
+        self.assertEqual(screen.get_at(area.move(1, 1).topleft), (20, 20, 20))
+
+if __name__ == "__main__":
+    pygame.init()
+    unittest.main()
@@ -0,0 +1,142 @@
+import pygame
+import unittest
+import random
+import tempfile
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.replay import Recorder, Replay, KeyState
+from src.main import Main
+from src.assets import surface_cache
+from src.interfaces import f_reset_game
+
+class Test_Replay(unittest.TestCase):
+
+    def setUp(self):
+
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.path = os.path.join(folder.name, "game.log")
+
+    def tearDown(self):
+
+        surface_cache.convert = True
+
+    #the held keys and the key events come back from the log
+
+    def test_log(self):
+
+        recorder = Recorder(self.path, seed=42)
+        self.assertEqual(random.random(), random.Random(42).random())
+        recorder.frame(KeyState({pygame.K_d, pygame.K_v}), [])
+        recorder.frame(KeyState(), [
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0),
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)),
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_x, mod=0)
+        ])
+        recorder.close()
+
+        replay = Replay(self.path)
+        self.assertEqual(replay.seed, 42)
+        self.assertEqual(len(replay.frames), 2)
+        keys, events = replay.frames[0]
+        self.assertTrue(keys[pygame.K_d] and keys[pygame.K_v])
+        self.assertFalse(keys[pygame.K_a] or keys[pygame.K_SPACE])
+        self.assertEqual(events, [])
+        keys, events = replay.frames[1]
+        self.assertEqual(keys.pressed, frozenset())
+        self.assertEqual(
+            [(event.type, event.key) for event in events],
+            [(pygame.KEYDOWN, pygame.K_SPACE), (pygame.KEYUP, pygame.K_x)]
+        )
+        self.assertEqual(os.path.getsize(self.path), 22 + 4 * 4 + 2 + 12)
+
+    #a file that is not a log is refused
+
+    def test_invalid(self):
+
+        with open(self.path, "wb") as file:
+            file.write(b"not a log")
+        with self.assertRaises(ValueError):
+            Replay(self.path)
+
+    #a recorded game is played again the same way
+
+    def test_run(self):
+
+        main = Main(headless=True)
+        main.finish_loading()
+        main.change_state("game", False)
+        game = main.states["game"]
+        recorder = Recorder(self.path)
+        for frame in range(120):
+            keys = KeyState({pygame.K_d} if frame % 40 < 30 else ())
+            events = []
+            if frame % 15 == 0:
+                events.append(
+                    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+                )
+            for event in events:
+                game.on_event(event, main)
+            recorder.frame(keys, events)
+            game.on_key_pressed(keys)
+            game.update()
+            game.collision_decetion()
+            game.elimination(main.change_state)
+        recorder.close()
+        recorded = (tuple(game.hero.rect), game.camera.position_x)
+
+        main = Main(headless=True)
+        steps = Replay(self.path).run(main, fast=True)
+        game = main.states["game"]
+        self.assertEqual(steps, 120)
+        self.assertEqual(
+            (tuple(game.hero.rect), game.camera.position_x), recorded
+        )
+
+    #a game reset while recording is reset at the same frame in the replay
+
+    def test_reset(self):
+
+        main = Main(headless=True)
+        main.finish_loading()
+        main.change_state("game", False)
+        game = main.states["game"]
+        main.recorder = Recorder(self.path)
+        for frame in range(160):
+            keys = KeyState({pygame.K_d} if frame % 50 < 35 else ())
+            if frame == 90:
+                # Given to the game before it was paused and reset
+                event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+                game.on_event(event, main)
+                main.recorded.append(event)
+                main.change_state("pause", False)
+                f_reset_game(main)
+            main.recorder.frame(keys, main.recorded)
+            main.recorded = []
+            game.on_key_pressed(keys)
+            game.update()
+            game.collision_decetion()
+            game.elimination(main.change_state)
+        main.stop_recording()
+        recorded = (
+            tuple(game.hero.rect), game.camera.position_x, random.random()
+        )
+
+        replay = Replay(self.path)
+        self.assertEqual(len(replay.frames), 161)
+        self.assertIsNone(replay.frames[90][0])
+        main = Main(headless=True)
+        steps = replay.run(main, fast=True)
+        game = main.states["game"]
+        self.assertEqual(steps, 160)
+        self.assertEqual(
+            (tuple(game.hero.rect), game.camera.position_x, random.random()),
+            recorded
+        )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import pygame
+import unittest
+import sys, os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.score import Score, fonts, fitted_sizes
+
+class Test_Score(unittest.TestCase):
+
+    def setUp(self):
+
+        fonts.clear()
+        fitted_sizes.clear()
+        self.screen = pygame.Surface((400, 200))
+        self.score = Score(
+            "Score", 0, 100, 50, 200, 40, 60, (0, 0, 0), 100,
+            "Lumios Typewriter New.otf"
+        )
+
+    #the text is rendered again only when the value changes
+
+    def test_compose_once(self):
+
+        self.score.draw(self.screen)
+        surface = self.score.surface
+        self.score.update(0)
+        self.score.draw(self.screen)
+        self.assertIs(self.score.surface, surface)
+
+        self.score.update(10)
+        self.assertIsNone(self.score.surface)
+        self.score.draw(self.screen)
+        self.assertIsNot(self.score.surface, surface)
+
+    #fonts and fitted sizes are shared between scores
+
+    def test_caches(self):
+
+        self.score.draw(self.screen)
+        other = Score(
+            "Score", 5, 0, 0, 200, 40, 60, (0, 0, 0), 100,
+            "Lumios Typewriter New.otf"
+        )
+        other.draw(self.screen)
+        font = other.adj_font("Score: 5", 60)
+
+        self.assertIn(font, fonts.values())
+        self.assertEqual(len(fitted_sizes), 1)
+        width, height = font.size("Score: 5")
+        self.assertTrue(width <= 200 and height <= 40)
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1000, 1000))
+    unittest.main()
@@ -0,0 +1,75 @@
+import pygame
+import unittest
+import sys, os
+from types import SimpleNamespace
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.spatial import SpatialHash
+
+class Test_Spatial_Hash(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tiles = [
+            SimpleNamespace(rect=pygame.Rect(x, y, 50, 50))
+            for y in (0, 50) for x in range(0, 500, 50)
+        ]
+        self.grid = SpatialHash(50, self.tiles)
+
+    #only the tiles under a rect are found, in the order of the map
+
+    def test_query(self):
+
+        found = self.grid.query(pygame.Rect(60, 40, 40, 20))
+        self.assertEqual(found, [self.tiles[1], self.tiles[11]])
+        self.assertEqual(self.grid.query(pygame.Rect(0, 200, 50, 50)), [])
+
+        found = self.grid.query(
+            pygame.Rect(410, 60, 10, 10), pygame.Rect(0, 0, 10, 10)
+        )
+        self.assertEqual(found, [self.tiles[0], self.tiles[18]])
+
+        found = self.grid.query(pygame.Rect(0, 0, 100, 100), start=5)
+        self.assertEqual(found, [self.tiles[10], self.tiles[11]])
+
+    #a tile that moved is found in its new cells and keeps its order
+
+    def test_move(self):
+
+        tile = self.tiles[3]
+        tile.rect.x = 420
+        self.grid.move(tile)
+
+        self.assertNotIn(tile, self.grid.query(pygame.Rect(160, 0, 10, 10)))
+        found = self.grid.query(pygame.Rect(440, 0, 10, 10))
+        self.assertEqual(found, [tile, self.tiles[8]])
+
+        self.grid.remove(tile)
+        self.assertEqual(
+            self.grid.query(pygame.Rect(440, 0, 20, 10)),
+            [self.tiles[8], self.tiles[9]]
+        )
+
+    #only the columns with an object are occupied
+
+    def test_occupied(self):
+
+        self.assertTrue(self.grid.occupied(pygame.Rect(440, 500, 10, 10)))
+        self.assertFalse(self.grid.occupied(pygame.Rect(500, 0, 10, 10)))
+        self.assertTrue(self.grid.occupied(
+            pygame.Rect(600, 0, 10, 10), pygame.Rect(-20, 0, 21, 10)
+        ))
+
+        for tile in self.tiles[9::10]:
+            self.grid.remove(tile)
+        self.assertFalse(self.grid.occupied(pygame.Rect(450, 0, 10, 10)))
+        self.tiles[0].rect.x = 460
+        self.grid.move(self.tiles[0])
+        self.assertTrue(self.grid.occupied(pygame.Rect(450, 0, 10, 10)))
+
+if __name__ == "__main__":
+    pygame.init()
+    unittest.main()
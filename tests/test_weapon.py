@@ -0,0 +1,187 @@
+import pygame
+import unittest
+import sys, os
+from types import SimpleNamespace
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..')
+sys.path.append(src_path)
+
+from src.weapon import Projectile, ProjectileSystem, ScaledImages
+from src.weapon import scaled_images, Shield
+
+class Test_Projectile_System(unittest.TestCase):
+
+    def setUp(self):
+
+        self.system = ProjectileSystem(4)
+        self.image = pygame.Surface((50, 30))
+        self.projectiles = []
+
+    def fire(self, x):
+
+        return self.system.fire(
+            self.projectiles, x, 0, 10, 0, "Monster", 20, 50, 30, self.image
+        )
+
+    #the projectiles fired come from the pool and go back to it
+
+    def test_reuse(self):
+
+        pool = list(self.system.free)
+        for _ in range(20):
+            shots = [self.fire(x) for x in (0, 100, 200)]
+            for shot in shots:
+                self.assertIn(shot, pool)
+            self.system.clear(self.projectiles)
+
+        self.assertEqual(self.system.allocated, 0)
+        self.assertEqual(len(self.system.free), 4)
+
+        shots = [self.fire(x) for x in range(0, 600, 100)]
+        self.assertEqual(self.system.allocated, 2)
+        self.assertEqual(shots[0].rect, pygame.Rect(0, 0, 50, 30))
+        self.assertEqual(shots[0].image.get_size(), (50, 30))
+
+    #removing moves the last projectile into the hole
+
+    def test_release(self):
+
+        shots = [self.fire(x) for x in (0, 100, 200, 300)]
+        self.system.release(self.projectiles, 1)
+        self.assertEqual(self.projectiles, [shots[0], shots[3], shots[2]])
+        self.assertIs(self.system.free[-1], shots[1])
+
+        #walking backwards visits every projectile while removing
+        for index in reversed(range(len(self.projectiles))):
+            if self.projectiles[index].rect.x >= 200:
+                self.system.release(self.projectiles, index)
+        self.assertEqual(self.projectiles, [shots[0]])
+
+    #the projectiles move together and leave with the screen
+
+    def test_update_cull(self):
+
+        for x in (0, 500, 990):
+            self.fire(x)
+        for _ in range(2):
+            self.system.update(self.projectiles)
+        self.assertEqual(
+            [shot.rect.x for shot in self.projectiles], [20, 520, 1010]
+        )
+
+        self.system.cull(self.projectiles, pygame.Rect(0, 0, 1000, 800))
+        self.assertEqual(
+            sorted(shot.rect.x for shot in self.projectiles), [20, 520]
+        )
+        self.system.cull(self.projectiles, pygame.Rect(600, 0, 1000, 800))
+        self.assertEqual(self.projectiles, [])
+        self.assertEqual(len(self.system.free), 4)
+
+    #the projectiles touching a rect are found and removed together
+
+    def test_hits(self):
+
+        shots = [self.fire(x) for x in (0, 100, 200, 300, 400)]
+        hits = self.system.hits(self.projectiles, pygame.Rect(90, 0, 200, 5))
+        self.assertEqual(hits, [1, 2])
+        self.system.release_all(self.projectiles, hits)
+        self.assertEqual(self.projectiles, [shots[0], shots[3], shots[4]])
+        self.assertEqual(self.system.free[-2:], [shots[2], shots[1]])
+        self.assertEqual(self.system.hits([], pygame.Rect(0, 0, 9, 9)), [])
+
+    #every projectile is drawn where the camera sees it
+
+    def test_draw(self):
+
+        screen = pygame.Surface((100, 50))
+        self.image.fill((255, 0, 0))
+        for x in (200, 260):
+            self.fire(x)
+        camera = SimpleNamespace(
+            position_x=200, apply=lambda rect: rect.move(-200, 0)
+        )
+        self.system.draw(self.projectiles, screen, camera)
+        self.assertEqual(screen.get_at((5, 5)), (255, 0, 0))
+        self.assertEqual(screen.get_at((55, 5)), (0, 0, 0))
+        self.assertEqual(screen.get_at((65, 5)), (255, 0, 0))
+
+class Test_Scaled_Images(unittest.TestCase):
+
+    def setUp(self):
+
+        self.images = ScaledImages(2)
+        self.image = pygame.Surface((10, 10))
+        scaled_images.clear()
+
+    #the same image at the same size is scaled once
+
+    def test_hits(self):
+
+        first = self.images.scale(self.image, (30, 30))
+        self.assertIs(self.images.scale(self.image, (30, 30)), first)
+        self.assertEqual(first.get_size(), (30, 30))
+        self.assertIsNot(self.images.scale(self.image, (20, 30)), first)
+        self.assertIsNot(
+            self.images.scale(pygame.Surface((10, 10)), (30, 30)), first
+        )
+        self.assertEqual((self.images.hits, self.images.misses), (1, 3))
+        self.assertEqual(self.images.hit_rate(), 0.25)
+
+    #the least recently used image leaves when the cache is full
+
+    def test_eviction(self):
+
+        first = self.images.scale(self.image, (30, 30))
+        self.images.scale(self.image, (20, 20))
+        self.images.scale(self.image, (30, 30))
+        self.images.scale(self.image, (40, 40))
+
+        self.assertEqual(len(self.images.surfaces), 2)
+        self.assertIs(self.images.scale(self.image, (30, 30)), first)
+        self.images.scale(self.image, (20, 20))
+        self.assertEqual(self.images.misses, 4)
+
+    #projectiles fired with the same image share the scaled surface
+
+    def test_projectiles(self):
+
+        image = pygame.Surface((35, 14))
+        shots = [
+            Projectile(0, 0, 10, 0, "Monster", 20, 70, 28, image)
+            for _ in range(7)
+        ]
+        for shot in shots:
+            self.assertIs(shot.image, shots[0].image)
+        self.assertEqual(shots[0].image.get_size(), (70, 28))
+        self.assertEqual(len(scaled_images.surfaces), 1)
+
+    #a reflected projectile takes the mirrored image from the cache
+
+    def test_reflect(self):
+
+        image = pygame.Surface((35, 14))
+        image.set_at((0, 0), (255, 0, 0))
+        enemy = [
+            Projectile(x, 0, -10, 0, "Monster", 20, 70, 28, image)
+            for x in (0, 20)
+        ]
+        scaled = enemy[0].image
+        hero = []
+        shield = Shield(0, 0, 50, 50)
+        shield.reflect("Knight", 1, hero, enemy)
+        shield.reflect("Knight", 0, hero, enemy)
+
+        self.assertEqual(enemy, [])
+        self.assertIs(hero[0].image, hero[1].image)
+        self.assertEqual(hero[0].image.get_at((69, 0)), (255, 0, 0))
+        self.assertEqual((hero[0].speed_x, hero[0].who), (10, "Knight"))
+        self.assertEqual(scaled_images.misses, 2)
+
+        #reflected back, it gets its first image again
+        self.assertIs(scaled_images.flip(hero[0].image), scaled)
+        self.assertEqual(scaled_images.misses, 2)
+
+if __name__ == "__main__":
+    pygame.init()
+    unittest.main()